@@ -0,0 +1,4 @@
+"""
+Benchmarks for Admin Action Bot
+Run from the repository root, e.g. python -m benchmarks.bench_pterodactyl
+"""
@@ -0,0 +1,606 @@
+"""
+Simulated Discord interaction load harness
+Drives the admin panel, modals and player dropdown with fake interactions against the panel stand-in
+
+Usage:
+    python -m benchmarks.bench_interactions --moderators 2000 --actions 3
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from .bench_pterodactyl import percentile
+from .panel_stub import PanelStub
+
+# Discord's deadlines: initial response (defer or modal) and followups on the interaction token
+INITIAL_RESPONSE_LIMIT = 3.0
+FOLLOWUP_LIMIT = 15 * 60.0
+
+# Flow -> relative weight in the simulated mix
+FLOWS = {
+    'panel_kick': 4,
+    'panel_kill': 2,
+    'panel_tempban': 2,
+    'panel_ban': 1,
+    'dropdown_manual': 1,
+    'slash_kick': 3,
+    'freeze': 1,
+}
+
+_interaction_ids = itertools.count(1_300_000_000_000_000_000)
+
+
+def _not_found() -> discord.NotFound:
+    """The error discord.py raises for an expired interaction token"""
+    response = SimpleNamespace(status=404, reason='Not Found')
+    return discord.NotFound(response, {'code': 10062, 'message': 'Unknown interaction'})
+
+
+class SimulatedMember(discord.Member):
+    """Guild member stand-in that passes AdminBot.is_admin() without a gateway connection"""
+    
+    def __init__(self, user_id: int, name: str, admin_role_id: Optional[int]):
+        self._sim_id = user_id
+        self._sim_name = name
+        self._sim_roles = [SimpleNamespace(id=admin_role_id)] if admin_role_id else []
+    
+    id = property(lambda self: self._sim_id)
+    name = property(lambda self: self._sim_name)
+    display_name = property(lambda self: self._sim_name)
+    mention = property(lambda self: f"<@{self._sim_id}>")
+    roles = property(lambda self: self._sim_roles)
+    guild_permissions = property(lambda self: discord.Permissions(administrator=True))
+    
+    def __str__(self) -> str:
+        return self._sim_name
+    
+    def __repr__(self) -> str:
+        return f"<SimulatedMember {self._sim_name}>"
+
+
+class FakeResponse:
+    """interaction.response: the single initial response, due within 3 seconds"""
+    
+    def __init__(self, interaction: 'FakeInteraction'):
+        self._interaction = interaction
+        self.modal: Optional[discord.ui.Modal] = None
+        self.kind: Optional[str] = None
+    
+    def is_done(self) -> bool:
+        return self.kind is not None
+    
+    async def _respond(self, kind: str):
+        if self.kind is not None:
+            raise discord.InteractionResponded(self._interaction)
+        await self._interaction.round_trip()
+        if self._interaction.age() > INITIAL_RESPONSE_LIMIT:
+            self._interaction.expired = True
+            raise _not_found()
+        self.kind = kind
+        self._interaction.acked_at = time.monotonic()
+    
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False):
+        await self._respond('defer')
+    
+    async def send_modal(self, modal: discord.ui.Modal):
+        await self._respond('modal')
+        self.modal = modal
+    
+    async def send_message(self, content: Optional[str] = None, **kwargs):
+        await self._respond('message')
+        self._interaction.record_message(content, kwargs)
+    
+    async def edit_message(self, **kwargs):
+        await self._respond('edit')
+
+
+class FakeFollowup:
+    """interaction.followup: webhook messages on the token, valid for 15 minutes"""
+    
+    def __init__(self, interaction: 'FakeInteraction'):
+        self._interaction = interaction
+    
+    async def send(self, content: Optional[str] = None, **kwargs):
+        await self._interaction.round_trip()
+        if self._interaction.age() > FOLLOWUP_LIMIT:
+            raise _not_found()
+        self._interaction.record_message(content, kwargs)
+
+
+class FakeInteraction:
+    """Enough of discord.Interaction for AdminBot's views and modals"""
+    
+    def __init__(self, sim: 'Simulation', flow: str, user: SimulatedMember):
+        self.sim = sim
+        self.flow = flow
+        self.id = next(_interaction_ids)
+        self.user = user
+        self.channel_id = sim.config.bot_channel_id
+        self.guild_id = sim.config.guild_id
+        
+        # Discord created it before the gateway delivered it to us
+        self.created = time.monotonic() - sim.args.gateway_latency
+        self.created_at = discord.utils.utcnow() - timedelta(seconds=sim.args.gateway_latency)
+        self.acked_at: Optional[float] = None
+        self.followed_up_at: Optional[float] = None
+        self.expired = False
+        self.messages: List[Dict[str, Any]] = []
+        self._followed_up = asyncio.Event()
+        
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+    
+    def age(self) -> float:
+        return time.monotonic() - self.created
+    
+    async def round_trip(self):
+        rtt = self.sim.args.discord_latency
+        if rtt:
+            await asyncio.sleep(self.sim.random.uniform(rtt * 0.5, rtt * 1.5))
+    
+    def record_message(self, content: Optional[str], kwargs: Dict[str, Any]):
+        self.messages.append({'content': content, **kwargs})
+        if self.followed_up_at is None:
+            self.followed_up_at = time.monotonic()
+            self._followed_up.set()
+    
+    async def wait_for_message(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """First message sent on this interaction (None if nothing came in time)"""
+        try:
+            await asyncio.wait_for(self._followed_up.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self.messages[0]
+
+
+class StallWatchdog:
+    """
+    Finds code that blocks the event loop
+    
+    A heartbeat task ticks on the loop; when it stops ticking for longer than
+    the threshold, a watchdog thread samples the main thread's stack, so the
+    report names the line that was running rather than the task that owned it.
+    """
+    
+    def __init__(self, threshold: float, interval: float = 0.005):
+        """
+        Configure the watchdog
+        
+        Args:
+            threshold: Seconds without a heartbeat that count as a stall (0 records lag only)
+            interval: Seconds between heartbeats
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.lag_samples: List[float] = []
+        # Blocking code location -> [stall count, worst stall seconds, sample stack]
+        self.stalls: Dict[str, list] = {}
+        
+        self._beat = time.monotonic()
+        self._sampled: Optional[str] = None
+        self._main_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        self._task = asyncio.create_task(self._heartbeat(), name="stall-watchdog")
+        if self.threshold > 0:
+            self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+            self._thread.start()
+    
+    async def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+    
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - expected)
+            self.lag_samples.append(lag)
+            if self._sampled is not None:
+                # The stall the watchdog sampled has ended - record how long it was
+                entry = self.stalls[self._sampled]
+                entry[1] = max(entry[1], lag)
+                self._sampled = None
+    
+    def _watch(self):
+        while not self._stop.wait(self.threshold / 4):
+            if self._sampled is not None or time.monotonic() - self._beat < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._main_thread)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            location = self._locate(stack)
+            entry = self.stalls.setdefault(location, [0, 0.0, traceback.format_list(stack[-6:])])
+            entry[0] += 1
+            self._sampled = location
+    
+    @staticmethod
+    def _locate(stack: traceback.StackSummary) -> str:
+        """Innermost frame in this repository (or the innermost frame at all)"""
+        root = str(Path(__file__).resolve().parent.parent)
+        for frame in reversed(stack):
+            if frame.filename.startswith(root) and 'bench_interactions' not in frame.filename:
+                return f"{os.path.relpath(frame.filename, root)}:{frame.lineno} in {frame.name}"
+        frame = stack[-1]
+        return f"{frame.filename}:{frame.lineno} in {frame.name}"
+
+
+class Simulation:
+    """One run: an AdminBot wired to the panel stand-in and many simulated moderators"""
+    
+    def __init__(self, args: argparse.Namespace, bot, stub: PanelStub):
+        self.args = args
+        self.bot = bot
+        self.config = bot.config
+        self.stub = stub
+        self.random = random.Random(args.seed)
+        self.interactions: List[FakeInteraction] = []
+        self.flow_outcomes: Dict[str, Counter] = defaultdict(Counter)
+    
+    def new_interaction(self, flow: str, user: SimulatedMember) -> FakeInteraction:
+        interaction = FakeInteraction(self, flow, user)
+        self.interactions.append(interaction)
+        return interaction
+    
+    async def think(self):
+        if self.args.think_time:
+            await asyncio.sleep(self.random.uniform(0, self.args.think_time))
+    
+    async def moderator(self, index: int, start_delay: float):
+        await asyncio.sleep(start_delay)
+        user = SimulatedMember(10_000 + index, f"mod{index}", self.config.admin_role_id)
+        flows = list(FLOWS)
+        weights = list(FLOWS.values())
+        for _ in range(self.args.actions):
+            flow = self.random.choices(flows, weights)[0]
+            try:
+                outcome = await getattr(self, f"_flow_{flow.split('_')[0]}")(flow, user)
+            except Exception as e:
+                logging.getLogger('Simulation').exception(f"{flow} raised")
+                outcome = f"exception:{type(e).__name__}"
+            self.flow_outcomes[flow][outcome] += 1
+            await self.think()
+    
+    async def finish(self, interaction: FakeInteraction) -> str:
+        """Wait for the interaction's reply and classify it"""
+        if interaction.expired:
+            return 'expired'
+        message = await interaction.wait_for_message(self.args.followup_timeout)
+        if message is None:
+            return 'no_reply'
+        content = message.get('content') or ''
+        if 'Too many actions' in content:
+            return 'refused'
+        if content.startswith('⚠️ Already banned'):
+            # Ban the already-banned player anyway, as a moderator double-checking would
+            await self.think()
+            confirm = self.new_interaction(f"{interaction.flow.split(':')[0]}:confirm", interaction.user)
+            await message['view'].confirm_button.callback(confirm)
+            return 'rebanned' if await self.finish(confirm) == 'ok' else 'failed'
+        if content.startswith('✅'):
+            return 'ok'
+        return 'failed'
+    
+    def _fill(self, modal: discord.ui.Modal, action: str):
+        player = self.random.choice(self.args.players)
+        if hasattr(modal, 'player_input'):
+            modal.player_input._value = player
+        if getattr(modal, 'require_reason', False):
+            modal.reason_input._value = f"simulated {action}"
+        if getattr(modal, 'require_duration', False):
+            modal.duration_input._value = str(self.random.choice([30, 60, 1440]))
+    
+    async def _submit_modal(self, flow: str, user: SimulatedMember, modal: discord.ui.Modal) -> str:
+        await self.think()
+        self._fill(modal, modal.action)
+        submit = self.new_interaction(f"{flow}:submit", user)
+        await modal.on_submit(submit)
+        if not getattr(modal, 'use_dropdown', False):
+            return await self.finish(submit)
+        
+        # Modal answered with the player selection view - pick from the dropdown
+        message = await submit.wait_for_message(self.args.followup_timeout)
+        if message is None:
+            return 'expired' if submit.expired else 'no_reply'
+        view = message.get('view')
+        dropdown = next((item for item in view.children if isinstance(item, discord.ui.Select)), None)
+        await self.think()
+        select = self.new_interaction(f"{flow}:select", user)
+        dropdown._values = [self.random.choice(dropdown.options).value]
+        await dropdown.callback(select)
+        return await self.finish(select)
+    
+    async def _flow_panel(self, flow: str, user: SimulatedMember) -> str:
+        view = self.bot.panel_view
+        click = self.new_interaction(f"{flow}:click", user)
+        if not await view.interaction_check(click):
+            return 'denied'
+        button = next(item for item in view.children if getattr(item, 'custom_id', None) == f"admin_action:{flow.split('_')[1]}")
+        await button.callback(click)
+        if click.response.modal is None:
+            return 'expired' if click.expired else 'no_modal'
+        return await self._submit_modal(flow, user, click.response.modal)
+    
+    async def _flow_dropdown(self, flow: str, user: SimulatedMember) -> str:
+        # Panel -> kick modal -> selection view -> "Enter Manually" -> manual modal
+        view = self.bot.panel_view
+        click = self.new_interaction(f"{flow}:click", user)
+        button = next(item for item in view.children if getattr(item, 'custom_id', None) == 'admin_action:kick')
+        await button.callback(click)
+        modal = click.response.modal
+        if modal is None or not modal.use_dropdown:
+            return await self._submit_modal(flow, user, modal) if modal else 'no_modal'
+        
+        await self.think()
+        self._fill(modal, 'kick')
+        submit = self.new_interaction(f"{flow}:submit", user)
+        await modal.on_submit(submit)
+        message = await submit.wait_for_message(self.args.followup_timeout)
+        if message is None:
+            return 'no_reply'
+        manual = next(item for item in message['view'].children if isinstance(item, discord.ui.Button))
+        
+        await self.think()
+        open_manual = self.new_interaction(f"{flow}:manual", user)
+        await manual.callback(open_manual)
+        if open_manual.response.modal is None:
+            return 'expired' if open_manual.expired else 'no_modal'
+        return await self._submit_modal(flow, user, open_manual.response.modal)
+    
+    async def _flow_slash(self, flow: str, user: SimulatedMember) -> str:
+        interaction = self.new_interaction(flow, user)
+        await self.bot.run_slash_action(
+            interaction, 'kick', self.random.choice(self.args.players), reason="simulated kick"
+        )
+        return await self.finish(interaction)
+    
+    async def _flow_freeze(self, flow: str, user: SimulatedMember) -> str:
+        view = self.bot.panel_view
+        interaction = self.new_interaction(flow, user)
+        if not await view.interaction_check(interaction):
+            return 'denied'
+        button = next(item for item in view.children if getattr(item, 'custom_id', None) == 'admin_action:freeze')
+        await button.callback(interaction)
+        return await self.finish(interaction)
+    
+    def report(self, elapsed: float, watchdog: StallWatchdog) -> Dict[str, Any]:
+        by_step: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: {'ack': [], 'followup': []})
+        late_acks = late_followups = expired = 0
+        for interaction in self.interactions:
+            step = interaction.flow.split(':')[-1] if ':' in interaction.flow else 'command'
+            times = by_step[step]
+            if interaction.expired:
+                expired += 1
+            if interaction.acked_at is not None:
+                ack = interaction.acked_at - interaction.created
+                times['ack'].append(ack)
+                late_acks += ack > INITIAL_RESPONSE_LIMIT
+            if interaction.followed_up_at is not None and interaction.response.kind == 'defer':
+                followup = interaction.followed_up_at - interaction.created
+                times['followup'].append(followup)
+                late_followups += followup > FOLLOWUP_LIMIT
+        
+        def stats(samples: List[float]) -> Dict[str, float]:
+            ordered = sorted(samples)
+            return {
+                'count': len(ordered),
+                'p50_ms': round(percentile(ordered, 50) * 1000, 1),
+                'p90_ms': round(percentile(ordered, 90) * 1000, 1),
+                'p99_ms': round(percentile(ordered, 99) * 1000, 1),
+                'max_ms': round(ordered[-1] * 1000, 1) if ordered else 0.0
+            }
+        
+        blocking = sorted(
+            (
+                {'location': location, 'count': count, 'max_ms': round(worst * 1000, 1), 'stack': stack}
+                for location, (count, worst, stack) in watchdog.stalls.items()
+            ),
+            key=lambda entry: entry['max_ms'],
+            reverse=True
+        )
+        
+        return {
+            'interactions': len(self.interactions),
+            'elapsed_s': round(elapsed, 2),
+            'limits': {
+                'initial_response_s': INITIAL_RESPONSE_LIMIT,
+                'followup_s': FOLLOWUP_LIMIT,
+                'late_initial_responses': late_acks,
+                'late_followups': late_followups,
+                'expired': expired
+            },
+            'steps': {
+                step: {'time_to_ack': stats(times['ack']), 'time_to_followup': stats(times['followup'])}
+                for step, times in sorted(by_step.items())
+            },
+            'outcomes': {flow: dict(outcomes) for flow, outcomes in sorted(self.flow_outcomes.items())},
+            'event_loop': {
+                'lag': stats(watchdog.lag_samples),
+                'blocking': blocking
+            },
+            'panel': {'requests': self.stub.requests, 'rate_limited': self.stub.rate_limited},
+            'executor': self.bot.executor.stats()
+        }
+
+
+def configure_environment(args: argparse.Namespace, panel_url: str, data_dir: str):
+    """Point the bot's Config at the stand-in and a throwaway data directory"""
+    os.environ.update({
+        'DISCORD_BOT_TOKEN': 'simulated',
+        'DISCORD_GUILD_ID': '1',
+        'DISCORD_BOT_CHANNEL_ID': '2',
+        'DISCORD_AUDIT_CHANNEL_ID': '3',
+        'PTERODACTYL_API_URL': panel_url,
+        'PTERODACTYL_API_KEY': 'simulated',
+        'PTERODACTYL_SERVER_ID': 'sim0001',
+        'PTERODACTYL_SERVERS': '',
+        'ACTION_SERVERS': '',
+        'CONSOLE_STREAM_ENABLED': 'false',
+        'METRICS_ENABLED': 'false',
+        'AUDIT_JOURNAL_PATH': os.path.join(data_dir, 'audit.db'),
+        'RECENT_PLAYERS_PATH': os.path.join(data_dir, 'recent_players.json'),
+        'STATE_PATH': os.path.join(data_dir, 'state.json'),
+        'SCHEDULER_PATH': os.path.join(data_dir, 'scheduler.db'),
+        'ACTION_WORKERS': str(args.workers),
+        'ACTION_QUEUE_SIZE': str(args.queue_size),
+        'PTERODACTYL_RATE_LIMIT': str(args.client_rate_limit),
+        'PTERODACTYL_RATE_BURST': str(max(1, int(args.client_rate_limit))),
+    })
+
+
+class FakeChannel:
+    """Audit channel stand-in: accepts sends after a Discord round trip"""
+    
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.sent = 0
+    
+    async def send(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    stub = PanelStub(latency=args.panel_latency, jitter=args.panel_latency / 2, seed=args.seed)
+    await stub.start()
+    
+    with tempfile.TemporaryDirectory(prefix='adminbot-sim-') as data_dir:
+        configure_environment(args, stub.url, data_dir)
+        
+        from src.bot import AdminBot
+        from src.config import Config
+        
+        bot = AdminBot(Config())
+        await bot.setup_hook()
+        bot.audit_channel = FakeChannel(args.discord_latency)
+        # Players offered in the dropdown (normally learned from the console and past actions)
+        for player in args.players[:args.known_players]:
+            bot.recent_players.add(player)
+        
+        sim = Simulation(args, bot, stub)
+        watchdog = StallWatchdog(args.block_threshold)
+        watchdog.start()
+        stub.reset_counters()
+        started = time.monotonic()
+        try:
+            await asyncio.gather(*(
+                sim.moderator(index, sim.random.uniform(0, args.ramp))
+                for index in range(args.moderators)
+            ))
+            elapsed = time.monotonic() - started
+        finally:
+            await watchdog.stop()
+            await bot.close()
+            await stub.stop()
+    
+    report = sim.report(elapsed, watchdog)
+    report.update({
+        'benchmark': 'interactions',
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {
+            key: value for key, value in vars(args).items() if key not in ('output', 'players')
+        }
+    })
+    return report
+
+
+def print_summary(report: Dict[str, Any]):
+    limits = report['limits']
+    print(f"{report['interactions']} interactions in {report['elapsed_s']}s")
+    print(f"{'step':<10} {'ack p50':>9} {'ack p99':>9} {'ack max':>9} {'reply p50':>10} {'reply p99':>10} {'reply max':>10}")
+    for step, times in report['steps'].items():
+        ack, followup = times['time_to_ack'], times['time_to_followup']
+        print(
+            f"{step:<10} {ack['p50_ms']:>7.1f}ms {ack['p99_ms']:>7.1f}ms {ack['max_ms']:>7.1f}ms "
+            f"{followup['p50_ms']:>8.1f}ms {followup['p99_ms']:>8.1f}ms {followup['max_ms']:>8.1f}ms"
+        )
+    print(
+        f"Over {limits['initial_response_s']:g}s to ack: {limits['late_initial_responses']}  "
+        f"over {limits['followup_s']:g}s to reply: {limits['late_followups']}  expired: {limits['expired']}"
+    )
+    outcomes = Counter()
+    for counts in report['outcomes'].values():
+        outcomes.update(counts)
+    print("Outcomes: " + ", ".join(f"{outcome} {count}" for outcome, count in outcomes.most_common()))
+    lag = report['event_loop']['lag']
+    print(f"Event loop lag: p50 {lag['p50_ms']}ms  p99 {lag['p99_ms']}ms  max {lag['max_ms']}ms")
+    for entry in report['event_loop']['blocking'][:10]:
+        print(f"  blocked up to {entry['max_ms']:.0f}ms (x{entry['count']}) at {entry['location']}")
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--moderators', type=int, default=1000, help="Simulated moderators (default: 1000)")
+    parser.add_argument('--actions', type=int, default=3, help="Flows each moderator runs (default: 3)")
+    parser.add_argument('--ramp', type=float, default=5.0, help="Seconds over which moderators start (default: 5)")
+    parser.add_argument('--think-time', type=float, default=0.5, help="Max seconds between a moderator's steps (default: 0.5)")
+    parser.add_argument('--gateway-latency', type=float, default=0.05,
+                        help="Seconds from interaction creation to delivery (default: 0.05)")
+    parser.add_argument('--discord-latency', type=float, default=0.08,
+                        help="Round trip of a Discord API call in seconds (default: 0.08)")
+    parser.add_argument('--panel-latency', type=float, default=0.03, help="Panel response time in seconds (default: 0.03)")
+    parser.add_argument('--workers', type=int, default=4, help="ACTION_WORKERS for the bot (default: 4)")
+    parser.add_argument('--queue-size', type=int, default=100, help="ACTION_QUEUE_SIZE for the bot (default: 100)")
+    parser.add_argument('--client-rate-limit', type=float, default=10.0,
+                        help="PTERODACTYL_RATE_LIMIT for the bot in requests/s (default: 10, the bot's default)")
+    parser.add_argument('--known-players', type=int, default=20,
+                        help="Players offered in dropdowns; 0 exercises the manual-entry modal (default: 20)")
+    parser.add_argument('--followup-timeout', type=float, default=120.0,
+                        help="Seconds to wait for a reply before counting it as missing (default: 120)")
+    parser.add_argument('--block-threshold', type=float, default=0.05,
+                        help="Report code holding the event loop longer than this many seconds; 0 disables (default: 0.05)")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument('--output', default='benchmarks/results/interactions.json',
+                        help="JSON results file (default: benchmarks/results/interactions.json)")
+    args = parser.parse_args(argv)
+    args.players = [f"Player{n}" for n in range(max(args.known_players, 50))]
+    return args
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # The bot logs every action; keep the summary readable
+    logging.basicConfig(level=logging.CRITICAL)
+    logging.getLogger().setLevel(logging.CRITICAL)
+    
+    report = asyncio.run(run(args))
+    print_summary(report)
+    
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, default=str) + "\n")
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+PterodactylClient benchmark
+Measures throughput and latency percentiles against the local panel stand-in
+
+Usage:
+    python -m benchmarks.bench_pterodactyl --concurrency 1,4,16,64 --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from src.pterodactyl import PterodactylClient
+
+from .panel_stub import PanelStub
+
+SERVER_ID = 'bench0001'
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+    
+    Args:
+        samples: Sorted values
+        pct: Percentile in [0, 100]
+    
+    Returns:
+        The value at that percentile (0.0 for no samples)
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def summarise(latencies: List[float], failures: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        'requests': len(ordered),
+        'failures': failures,
+        'elapsed_s': round(elapsed, 4),
+        'throughput_rps': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'mean': round(statistics.fmean(ordered) * 1000, 2) if ordered else 0.0,
+            'p50': round(percentile(ordered, 50) * 1000, 2),
+            'p90': round(percentile(ordered, 90) * 1000, 2),
+            'p99': round(percentile(ordered, 99) * 1000, 2),
+            'max': round(ordered[-1] * 1000, 2) if ordered else 0.0
+        }
+    }
+
+
+def _scenarios(client: PterodactylClient) -> Dict[str, Callable[[], Awaitable[Dict[str, Any]]]]:
+    return {
+        'command': lambda: client.send_command('say benchmark'),
+        'status': lambda: client.get_server_status(fresh=True),
+        'websocket': client.get_websocket_credentials
+    }
+
+
+async def run_level(
+    stub: PanelStub,
+    args: argparse.Namespace,
+    scenario: str,
+    concurrency: int
+) -> Dict[str, Any]:
+    """
+    Run one scenario at one concurrency level with a fresh client
+    
+    Args:
+        stub: Running panel stand-in
+        args: Parsed command-line options
+        scenario: 'command', 'status' or 'websocket'
+        concurrency: Requests kept in flight at once
+    
+    Returns:
+        Summary for the results file
+    """
+    client = PterodactylClient(
+        stub.url,
+        'bench-key',
+        SERVER_ID,
+        connection_limit=args.connection_limit,
+        rate_limit=args.client_rate_limit,
+        rate_burst=max(1, int(args.client_rate_limit)),
+        # Injected errors should be measured, not short-circuited
+        circuit_failure_threshold=args.requests + 1
+    )
+    await client.start()
+    call = _scenarios(client)[scenario]
+    stub.reset_counters()
+    
+    latencies: List[float] = []
+    failures = 0
+    remaining = iter(range(args.requests))
+    
+    async def worker():
+        nonlocal failures
+        for _ in remaining:
+            start = time.perf_counter()
+            result = await call()
+            latencies.append(time.perf_counter() - start)
+            if not result.get('success'):
+                failures += 1
+    
+    try:
+        # Warm the connection pool so the first level isn't charged for handshakes
+        await asyncio.gather(*(call() for _ in range(min(concurrency, args.connection_limit))))
+        stub.reset_counters()
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+    
+    summary = summarise(latencies, failures, elapsed)
+    summary.update({
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'panel': {
+            'requests': stub.requests,
+            'errors_served': stub.errors_served,
+            'rate_limited': stub.rate_limited
+        }
+    })
+    return summary
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    stub = PanelStub(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        rate_burst=args.rate_burst,
+        seed=args.seed
+    )
+    await stub.start()
+    results = []
+    try:
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                summary = await run_level(stub, args, scenario, concurrency)
+                results.append(summary)
+                latency = summary['latency_ms']
+                print(
+                    f"{scenario:<10} c={concurrency:<4} {summary['throughput_rps']:>9.1f} req/s  "
+                    f"p50 {latency['p50']:>8.2f}ms  p99 {latency['p99']:>8.2f}ms  "
+                    f"failed {summary['failures']:<5} 429s {summary['panel']['rate_limited']}"
+                )
+    finally:
+        await stub.stop()
+    
+    return {
+        'benchmark': 'pterodactyl',
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {
+            'requests': args.requests,
+            'latency_s': args.latency,
+            'jitter_s': args.jitter,
+            'error_rate': args.error_rate,
+            'panel_rate_limit': args.rate_limit,
+            'panel_rate_burst': args.rate_burst,
+            'client_rate_limit': args.client_rate_limit,
+            'connection_limit': args.connection_limit
+        },
+        'results': results
+    }
+
+
+def _csv(kind: Callable[[str], Any]) -> Callable[[str], List[Any]]:
+    return lambda value: [kind(part) for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scenarios', type=_csv(str), default=['command', 'status'],
+                        help="Comma-separated: command, status, websocket (default: command,status)")
+    parser.add_argument('--concurrency', type=_csv(int), default=[1, 4, 16, 64],
+                        help="Comma-separated concurrency levels (default: 1,4,16,64)")
+    parser.add_argument('--requests', type=int, default=500, help="Requests per level (default: 500)")
+    parser.add_argument('--latency', type=float, default=0.01, help="Panel latency in seconds (default: 0.01)")
+    parser.add_argument('--jitter', type=float, default=0.005, help="Extra random panel latency in seconds (default: 0.005)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of panel requests that fail (default: 0)")
+    parser.add_argument('--rate-limit', type=float, default=None, help="Panel requests/s before 429s (default: off)")
+    parser.add_argument('--rate-burst', type=int, default=60, help="Panel 429 burst allowance (default: 60)")
+    parser.add_argument('--client-rate-limit', type=float, default=10000.0,
+                        help="PterodactylClient rate limit in requests/s (default: 10000, effectively off)")
+    parser.add_argument('--connection-limit', type=int, default=10, help="Client connection pool size (default: 10)")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for error injection (default: 1)")
+    parser.add_argument('--output', default='benchmarks/results/pterodactyl.json',
+                        help="JSON results file (default: benchmarks/results/pterodactyl.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # Retries and 429s are expected here; keep the table readable
+    logging.basicConfig(level=logging.CRITICAL)
+    
+    report = asyncio.run(run(args))
+    
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
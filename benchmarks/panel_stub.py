@@ -0,0 +1,243 @@
+"""
+Local Pterodactyl panel stand-in for benchmarks
+Serves the client-API endpoints the bot uses, with configurable latency, errors and 429s
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from aiohttp import WSMsgType, web
+
+
+class PanelStub:
+    """aiohttp server imitating the panel's command, resources, files and console websocket endpoints"""
+    
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 502,
+        rate_limit: Optional[float] = None,
+        rate_burst: int = 10,
+        players: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Configure the stand-in
+        
+        Args:
+            latency: Seconds added to every HTTP response
+            jitter: Extra random latency, uniform in [0, jitter] seconds
+            error_rate: Share of requests (0-1) answered with error_status
+            error_status: HTTP status used for injected errors
+            rate_limit: Requests per second before 429 responses start (None disables)
+            rate_burst: Requests allowed in a burst before rate limiting applies
+            players: Names reported online by the 'list' console command
+            seed: Random seed for reproducible error injection
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.players = players if players is not None else ['Steve', 'Alex']
+        self._random = random.Random(seed)
+        
+        # Reported by the resources endpoint; change them to simulate load
+        self.state = 'running'
+        self.resources = {
+            'memory_bytes': 2147483648,
+            'cpu_absolute': 37.5,
+            'disk_bytes': 1073741824,
+            'network_rx_bytes': 1024,
+            'network_tx_bytes': 2048,
+            'uptime': 3600000
+        }
+        
+        # Server files: path -> (content, modified time); change them with write_file()
+        self.files: Dict[str, Tuple[str, float]] = {}
+        self.write_file('/banned-players.json', '[]')
+        
+        self._tokens = float(rate_burst)
+        self._refilled_at = time.monotonic()
+        self._sockets: Set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ''
+        
+        # Counters for the benchmark report
+        self.requests = 0
+        self.commands = 0
+        self.errors_served = 0
+        self.rate_limited = 0
+        self.file_downloads = 0
+    
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        
+        Returns:
+            Base URL to use as the panel URL
+        """
+        app = web.Application()
+        app.router.add_post('/api/client/servers/{server}/command', self._handle_command)
+        app.router.add_get('/api/client/servers/{server}/resources', self._handle_resources)
+        app.router.add_get('/api/client/servers/{server}/websocket', self._handle_websocket_credentials)
+        app.router.add_get('/api/client/servers/{server}/files/list', self._handle_file_list)
+        app.router.add_get('/api/client/servers/{server}/files/contents', self._handle_file_contents)
+        app.router.add_get('/ws', self._handle_console)
+        
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+    
+    async def stop(self):
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    def reset_counters(self):
+        self.requests = self.commands = self.errors_served = self.rate_limited = 0
+    
+    def write_file(self, path: str, content: str):
+        """Create or replace a server file, updating its modification time"""
+        self.files[path] = (content, time.time())
+    
+    async def _gate(self) -> Optional[web.Response]:
+        """Apply latency, rate limiting and error injection; a response means 'answer with this'"""
+        self.requests += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        
+        if self.rate_limit:
+            now = time.monotonic()
+            self._tokens = min(self.rate_burst, self._tokens + (now - self._refilled_at) * self.rate_limit)
+            self._refilled_at = now
+            if self._tokens < 1:
+                self.rate_limited += 1
+                retry_after = (1 - self._tokens) / self.rate_limit
+                return web.json_response(
+                    {'errors': [{'code': 'TooManyRequestsHttpException', 'status': '429'}]},
+                    status=429,
+                    headers={'Retry-After': f"{retry_after:.3f}"}
+                )
+            self._tokens -= 1
+        
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors_served += 1
+            return web.json_response({'errors': [{'status': str(self.error_status)}]}, status=self.error_status)
+        return None
+    
+    async def _handle_command(self, request: web.Request) -> web.Response:
+        refusal = await self._gate()
+        if refusal:
+            return refusal
+        payload = await request.json()
+        self.commands += 1
+        await self._console_output(f"> {payload.get('command', '')}")
+        if payload.get('command') == 'list':
+            await self._console_output(self._list_line())
+        return web.Response(status=204)
+    
+    async def _handle_resources(self, request: web.Request) -> web.Response:
+        refusal = await self._gate()
+        if refusal:
+            return refusal
+        return web.json_response({
+            'object': 'stats',
+            'attributes': {
+                'current_state': self.state,
+                'is_suspended': False,
+                'resources': dict(self.resources)
+            }
+        })
+    
+    async def _handle_websocket_credentials(self, request: web.Request) -> web.Response:
+        refusal = await self._gate()
+        if refusal:
+            return refusal
+        socket_url = self.url.replace('http://', 'ws://', 1) + '/ws'
+        return web.json_response({'data': {'token': 'stub-token', 'socket': socket_url}})
+    
+    async def _handle_file_list(self, request: web.Request) -> web.Response:
+        refusal = await self._gate()
+        if refusal:
+            return refusal
+        directory = request.query.get('directory', '/').rstrip('/')
+        data = []
+        for path, (content, modified) in self.files.items():
+            parent, _, name = path.rpartition('/')
+            if parent == directory:
+                data.append({'object': 'file_object', 'attributes': {
+                    'name': name,
+                    'size': len(content.encode()),
+                    'is_file': True,
+                    'modified_at': datetime.fromtimestamp(modified, timezone.utc).isoformat()
+                }})
+        return web.json_response({'object': 'list', 'data': data})
+    
+    async def _handle_file_contents(self, request: web.Request) -> web.Response:
+        refusal = await self._gate()
+        if refusal:
+            return refusal
+        path = request.query.get('file', '')
+        if path not in self.files:
+            return web.json_response({'errors': [{'status': '404'}]}, status=404)
+        content = self.files[path][0]
+        etag = '"' + hashlib.sha1(content.encode()).hexdigest() + '"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        self.file_downloads += 1
+        return web.Response(text=content, headers={'ETag': etag})
+    
+    async def _handle_console(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(message.data)
+                event = payload.get('event')
+                args = payload.get('args') or []
+                if event == 'auth':
+                    self._sockets.add(ws)
+                    await ws.send_json({'event': 'auth success'})
+                    await ws.send_json({'event': 'status', 'args': ['running']})
+                elif event == 'send command' and args:
+                    self.commands += 1
+                    await self._console_output(f"> {args[0]}")
+                    if args[0] == 'list':
+                        await self._console_output(self._list_line())
+        finally:
+            self._sockets.discard(ws)
+        return ws
+    
+    def _list_line(self) -> str:
+        return (
+            f"[12:00:00 INFO]: There are {len(self.players)} of a max of 20 players online: "
+            + ", ".join(self.players)
+        )
+    
+    async def _console_output(self, line: str):
+        for ws in list(self._sockets):
+            try:
+                await ws.send_json({'event': 'console output', 'args': [line]})
+            except ConnectionError:
+                self._sockets.discard(ws)
@@ -6,6 +6,11 @@ Starts the Discord bot with configured settings
 
 import sys
 import logging
+import time
+
+# Taken before the heavier imports so time-to-ready covers the whole startup
+STARTED_AT = time.monotonic()
+
 from src.config import load_config
 from src.bot import AdminBot
 
@@ -27,7 +32,7 @@ def main():
         
         # Create and run bot
         logger.info("Starting bot...")
-        bot = AdminBot(config)
+        bot = AdminBot(config, started_at=STARTED_AT)
         bot.run(config.discord_token)
         
     except ValueError as e:
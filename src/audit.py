@@ -0,0 +1,299 @@
+"""
+Batched audit-log writer for Admin Action Bot
+Merges pending audit embeds into as few audit-channel messages as possible
+"""
+
+import asyncio
+import datetime
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import discord
+
+from .metrics import AUDIT_SEND_SECONDS
+
+logger = logging.getLogger('Audit')
+
+# Discord limits per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class AuditQueue:
+    """Async queue that sends audit embeds in batches of up to 10 per message"""
+    
+    def __init__(
+        self,
+        get_channel: Callable[[], Optional[discord.abc.Messageable]],
+        on_delivered: Optional[Callable[[List[str]], None]] = None,
+        batch_size: int = MAX_EMBEDS_PER_MESSAGE,
+        flush_interval: float = 2.0,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 300.0,
+        max_retries: int = 6
+    ):
+        """
+        Initialize the audit queue
+        
+        Args:
+            get_channel: Returns the audit channel (resolved lazily, after on_ready)
+            on_delivered: Called with the journal record IDs of each message sent
+            batch_size: Embeds per message before flushing (max 10)
+            flush_interval: Seconds to wait for more entries after the first one arrives
+            retry_delay: Seconds before the first retry of a batch Discord rejected
+            max_retry_delay: Longest wait between retries (the delay doubles each time)
+            max_retries: Retries before a batch is left in the journal for the next replay
+        """
+        self.get_channel = get_channel
+        self.on_delivered = on_delivered
+        self.batch_size = min(batch_size, MAX_EMBEDS_PER_MESSAGE)
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_retries = max_retries
+        
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._pending_ids: Set[str] = set()
+        # Entries from a failed send waiting for their next retry
+        self._retrying: List[Tuple[discord.Embed, Optional[str]]] = []
+        self.messages_sent = 0
+        self.embeds_sent = 0
+    
+    @property
+    def depth(self) -> int:
+        """Number of audit entries waiting to be sent"""
+        return self._queue.qsize()
+    
+    def start(self):
+        """Start the background writer"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+        logger.info("Audit writer started")
+    
+    async def stop(self):
+        """Stop the writer and flush whatever is still queued"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        pending, self._retrying = self._retrying, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), self.batch_size):
+            self._release(await self._send(pending[start:start + self.batch_size]))
+    
+    def is_pending(self, record_id: str) -> bool:
+        """Whether a journal record is queued or being sent right now"""
+        return record_id in self._pending_ids
+    
+    def put(self, embed: discord.Embed, record_id: Optional[str] = None):
+        """
+        Queue an audit embed without waiting for it to be sent
+        
+        Args:
+            embed: The audit entry
+            record_id: Journal record the embed was built from
+        """
+        if record_id:
+            self._pending_ids.add(record_id)
+        self._queue.put_nowait((embed, record_id))
+        # Warn once per five queued messages' worth of backlog
+        if self.depth % (self.batch_size * 5) == 0:
+            logger.warning(f"Audit queue backing up ({self.depth} pending)")
+    
+    async def _run(self):
+        """Collect embeds until the batch is full or the flush interval passes"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._send_with_retry(batch)
+    
+    async def _send_with_retry(self, entries: List[Tuple[discord.Embed, Optional[str]]]):
+        """Send a batch, retrying whatever failed with exponential backoff"""
+        self._retrying = await self._send(entries)
+        attempt = 0
+        while self._retrying and attempt < self.max_retries:
+            delay = min(self.max_retry_delay, self.retry_delay * 2 ** attempt)
+            attempt += 1
+            logger.warning(
+                f"Retrying {len(self._retrying)} audit entries in {delay:g}s "
+                f"(attempt {attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+            self._retrying = await self._send(self._retrying)
+        
+        if self._retrying:
+            # Still undelivered in the journal - replayed on next reconnect
+            logger.error(f"Giving up on {len(self._retrying)} audit entries until the next reconnect")
+            self._release(self._retrying)
+            self._retrying = []
+    
+    def _release(self, entries: List[Tuple[discord.Embed, Optional[str]]]):
+        """Stop treating entries as pending so a journal replay can queue them again"""
+        for _, record_id in entries:
+            self._pending_ids.discard(record_id)
+    
+    async def _send(
+        self,
+        entries: List[Tuple[discord.Embed, Optional[str]]]
+    ) -> List[Tuple[discord.Embed, Optional[str]]]:
+        """
+        Send embeds, splitting further where Discord's character limit requires
+        
+        Returns:
+            The entries that could not be sent (still pending)
+        """
+        channel = self.get_channel()
+        if not channel:
+            logger.warning(f"Audit channel not available - {len(entries)} audit entries not sent")
+            return list(entries)
+        
+        failed = []
+        for chunk in _split_by_size(entries):
+            started = time.monotonic()
+            try:
+                await channel.send(embeds=[embed for embed, _ in chunk])
+            except Exception as e:
+                AUDIT_SEND_SECONDS.observe(time.monotonic() - started, outcome='error')
+                logger.error(f"Failed to send audit log: {e}")
+                failed.extend(chunk)
+                continue
+            AUDIT_SEND_SECONDS.observe(time.monotonic() - started, outcome='success')
+            
+            self.messages_sent += 1
+            self.embeds_sent += len(chunk)
+            logger.info(f"Sent {len(chunk)} audit entries ({self.depth} still queued)")
+            self._release(chunk)
+            if self.on_delivered:
+                self.on_delivered([record_id for _, record_id in chunk if record_id])
+        return failed
+
+
+def _split_by_size(entries: List[Tuple[discord.Embed, Optional[str]]]) -> List[List[Tuple[discord.Embed, Optional[str]]]]:
+    """Group embeds so no message exceeds Discord's total embed character limit"""
+    chunks: List[List[Tuple[discord.Embed, Optional[str]]]] = []
+    current: List[Tuple[discord.Embed, Optional[str]]] = []
+    size = 0
+    
+    for entry in entries:
+        length = len(entry[0])
+        if current and size + length > MAX_EMBED_CHARS_PER_MESSAGE:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(entry)
+        size += length
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def truncate(text: str, limit: int) -> str:
+    """Trim text to a Discord field/message limit"""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def build_audit_embed(record: Dict[str, Any]) -> discord.Embed:
+    """
+    Render a journal record as an audit-channel embed
+    
+    Args:
+        record: Record from AuditJournal.append() or AuditJournal.undelivered()
+        
+    Returns:
+        Embed for the audit channel
+    """
+    action = record['action']
+    bulk = (record.get('details') or {}).get('bulk')
+    timestamp = datetime.datetime.fromtimestamp(record['created_at'], tz=datetime.timezone.utc)
+    
+    if bulk is not None:
+        succeeded = [player for player, success, _ in bulk if success]
+        failed = [(player, error) for player, success, error in bulk if not success]
+        
+        if not failed:
+            color = discord.Color.green()
+        elif succeeded:
+            color = discord.Color.orange()
+        else:
+            color = discord.Color.red()
+        
+        embed = discord.Embed(
+            title=f"{'✅' if not failed else '⚠️'} BULK {action.upper()}",
+            color=color,
+            timestamp=timestamp
+        )
+        embed.add_field(name="Administrator", value=f"<@{record['admin_id']}>", inline=True)
+        embed.add_field(name="Targets", value=str(len(bulk)), inline=True)
+        embed.add_field(name="Status", value=f"{len(succeeded)} succeeded, {len(failed)} failed", inline=True)
+        
+        if succeeded:
+            embed.add_field(name="Succeeded", value=truncate(", ".join(succeeded), 1024), inline=False)
+        
+        if failed:
+            failures = "\n".join(f"{player}: {error or 'Unknown error'}" for player, error in failed)
+            embed.add_field(name="Failed", value=truncate(failures, 1024), inline=False)
+    else:
+        success = record['success']
+        embed = discord.Embed(
+            title=f"{'✅' if success else '❌'} {action.upper()}",
+            color=discord.Color.green() if success else discord.Color.red(),
+            timestamp=timestamp
+        )
+        embed.add_field(name="Administrator", value=f"<@{record['admin_id']}>", inline=True)
+        embed.add_field(name="Target Player", value=record['target'], inline=True)
+        embed.add_field(name="Status", value="Success" if success else "Failed", inline=True)
+    
+    servers = (record.get('details') or {}).get('servers')
+    if servers:
+        embed.add_field(
+            name="Servers",
+            value=truncate(" • ".join(
+                f"{'✅' if outcome['success'] else '⏳' if outcome.get('pending') else '❌'} {name}"
+                for name, outcome in servers.items()
+            ), 1024),
+            inline=False
+        )
+    
+    coalesced = (record.get('details') or {}).get('coalesced')
+    if coalesced:
+        embed.add_field(
+            name="Coalesced",
+            value=truncate(
+                f"{len(coalesced)} identical request(s) shared this result: "
+                + ", ".join(f"<@{admin_id}>" for admin_id, _ in coalesced),
+                1024
+            ),
+            inline=False
+        )
+    
+    if record.get('reason'):
+        embed.add_field(name="Reason", value=truncate(record['reason'], 1024), inline=False)
+    
+    if record.get('duration'):
+        embed.add_field(name="Duration", value=f"{record['duration']} minutes", inline=True)
+    
+    if record.get('error'):
+        embed.add_field(name="Error", value=f"```{truncate(record['error'], 1000)}```", inline=False)
+    
+    embed.set_footer(text=f"Admin ID: {record['admin_id']}")
+    return embed
@@ -0,0 +1,256 @@
+"""
+Ban list index for Admin Action Bot
+In-memory index of the server's banned-players.json, refreshed through the panel's files API
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .pterodactyl import PterodactylClient
+
+logger = logging.getLogger('BanList')
+
+
+class BanList:
+    """Banned players by name, kept in memory so lookups and paging never call the panel"""
+    
+    def __init__(
+        self,
+        client: PterodactylClient,
+        path: str = '/banned-players.json',
+        refresh_interval: float = 300.0,
+        overlay_ttl: Optional[float] = None
+    ):
+        """
+        Initialize the ban list
+        
+        Args:
+            client: Panel client used to read the file
+            path: Path of banned-players.json in the server's file manager
+            refresh_interval: Seconds between checks for changes to the file
+            overlay_ttl: Seconds a ban or unban by the bot is kept while the file does not
+                show it (default: three refresh intervals), e.g. if it was undone in the console
+        """
+        self.client = client
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.overlay_ttl = overlay_ttl if overlay_ttl is not None else 3 * refresh_interval
+        
+        # Lowercased name -> entry ('name', 'reason', 'source', 'created', 'expires' as Unix time or None)
+        self._bans: Dict[str, Dict[str, Any]] = {}
+        self._sorted: Optional[List[Dict[str, Any]]] = None
+        
+        # Bans and unbans issued by the bot that the file may not show yet:
+        # lowercased name -> (time.monotonic() when made, entry or None for an unban)
+        self._overlay: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        
+        # What the file looked like when last read, to skip unchanged downloads
+        self._version: Optional[Tuple[Any, Any]] = None
+        self._etag: Optional[str] = None
+        self.loaded = False
+        self.last_refresh: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def __contains__(self, player_name: str) -> bool:
+        return self.get(player_name) is not None
+    
+    def __len__(self) -> int:
+        return len(self.entries())
+    
+    def get(self, player_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a player's current ban
+        
+        Args:
+            player_name: Player name (case-insensitive)
+        
+        Returns:
+            The ban entry, or None if the player is not banned (or the ban has expired)
+        """
+        entry = self._bans.get(player_name.lower())
+        if entry is None or (entry['expires'] is not None and entry['expires'] <= time.time()):
+            return None
+        return entry
+    
+    def entries(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get current bans sorted by name
+        
+        Args:
+            query: Only names containing this text (case-insensitive)
+        
+        Returns:
+            List of ban entries
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._bans.values(), key=lambda entry: entry['name'].lower())
+        now = time.time()
+        query = query.lower() if query else None
+        return [
+            entry for entry in self._sorted
+            if (entry['expires'] is None or entry['expires'] > now)
+            and (query is None or query in entry['name'].lower())
+        ]
+    
+    def record_ban(
+        self,
+        player_name: str,
+        reason: Optional[str] = None,
+        source: Optional[str] = None,
+        expires: Optional[float] = None
+    ):
+        """
+        Add a ban the bot has just issued, before the file reflects it
+        
+        Args:
+            player_name: Banned player
+            reason: Reason for the ban
+            source: Who issued it
+            expires: Unix time the ban ends (None for permanent)
+        """
+        entry = {
+            'name': player_name,
+            'reason': reason,
+            'source': source,
+            'created': time.time(),
+            'expires': expires
+        }
+        self._overlay[player_name.lower()] = (time.monotonic(), entry)
+        self._set(player_name.lower(), entry)
+    
+    def record_unban(self, player_name: str):
+        """Remove a player the bot has just unbanned, before the file reflects it"""
+        self._overlay[player_name.lower()] = (time.monotonic(), None)
+        self._set(player_name.lower(), None)
+    
+    def _set(self, key: str, entry: Optional[Dict[str, Any]]):
+        if entry is None:
+            self._bans.pop(key, None)
+        else:
+            self._bans[key] = entry
+        self._sorted = None
+    
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Re-read the file if it changed since the last read
+        
+        The file's modification time and size (from the directory listing) are
+        checked first, and the download itself is conditional on its ETag when
+        the panel supplies one, so an unchanged ban list costs one small request.
+        
+        Args:
+            force: Download the file even if it looks unchanged
+        
+        Returns:
+            True if the index was rebuilt
+        """
+        info = await self.client.get_file_info(self.path)
+        if not info['success']:
+            logger.warning(f"Could not check {self.path}: {info.get('error')}")
+            return False
+        
+        version = (info.get('modified_at'), info.get('size'))
+        if not force and self.loaded and version == self._version:
+            self.last_refresh = time.time()
+            return False
+        
+        contents = await self.client.get_file_contents(self.path, etag=None if force else self._etag)
+        if not contents['success']:
+            logger.warning(f"Could not read {self.path}: {contents.get('error')}")
+            return False
+        self._version = version
+        self.last_refresh = time.time()
+        if contents.get('not_modified'):
+            return False
+        self._etag = contents.get('etag')
+        
+        try:
+            records = json.loads(contents['content'] or '[]')
+        except ValueError as e:
+            logger.error(f"{self.path} is not valid JSON: {e}")
+            return False
+        
+        bans = {}
+        for record in records:
+            if isinstance(record, dict) and record.get('name'):
+                entry = _parse_entry(record)
+                bans[entry['name'].lower()] = entry
+        
+        # Keep the bot's own changes until a download shows them. The file's modified_at is
+        # the panel's clock, so it is never compared with ours; only the local age is used
+        now = time.monotonic()
+        for key, (changed_at, entry) in list(self._overlay.items()):
+            if _shows(bans, key, entry) or now - changed_at > self.overlay_ttl:
+                del self._overlay[key]
+            elif entry is None:
+                bans.pop(key, None)
+            else:
+                bans[key] = entry
+        
+        self._bans = bans
+        self._sorted = None
+        self.loaded = True
+        logger.info(f"Ban list loaded from {self.path} ({len(bans)} entries)")
+        return True
+    
+    def start(self):
+        """Load the ban list and keep it current in the background"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="ban-list")
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Ban list refresh failed")
+            await asyncio.sleep(self.refresh_interval)
+
+
+def _parse_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a banned-players.json record ('expires' is 'forever' or a timestamp string)"""
+    expires = record.get('expires')
+    return {
+        'name': record['name'],
+        'reason': record.get('reason'),
+        'source': record.get('source'),
+        'created': _parse_minecraft_time(record.get('created')),
+        'expires': None if not expires or expires == 'forever' else _parse_minecraft_time(expires)
+    }
+
+
+def _parse_minecraft_time(value: Optional[str]) -> Optional[float]:
+    """Parse Minecraft's '2024-01-31 18:00:00 +0000' format"""
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S %z').timestamp()
+    except ValueError:
+        return None
+
+
+def _shows(bans: Dict[str, Dict[str, Any]], key: str, entry: Optional[Dict[str, Any]]) -> bool:
+    """Whether the downloaded bans already reflect a ban (entry) or unban (None) by the bot"""
+    current = bans.get(key)
+    if entry is None:
+        return current is None
+    if current is None:
+        return False
+    if entry['expires'] is None or current['expires'] is None:
+        return entry['expires'] is None and current['expires'] is None
+    # The server works out its own expiry time; allow for the delay in issuing the command
+    return abs(entry['expires'] - current['expires']) < 120
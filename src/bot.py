@@ -6,11 +6,31 @@ Handles Discord connection, events, and command registration
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
+import datetime
+import hashlib
+import json
 import logging
-from typing import Optional
+import re
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple
 
 from .config import Config
 from .pterodactyl import PterodactylClient
+from .console import ConsoleStream
+from .roster import PlayerRoster
+from .audit import AuditQueue, build_audit_embed, truncate
+from .journal import AuditJournal
+from .players import RecentPlayers
+from .state import BotState
+from .templates import is_valid_player_name
+from .executor import ActionExecutor, ActionJob
+from .scheduler import ActionScheduler, parse_when
+from .banlist import BanList
+from .telemetry import ResourceMonitor, format_bytes, format_duration, sparkline
+from . import tracing
+from .tracing import Tracer
+from .metrics import CACHE_HIT_RATIO, CACHE_LOOKUPS, QUEUE_DEPTH, REGISTRY, LoopLagMonitor, MetricsServer
 
 # Configure logging
 logging.basicConfig(
@@ -19,16 +39,352 @@ logging.basicConfig(
 )
 logger = logging.getLogger('AdminBot')
 
+# Player-targeted actions available in bulk mode: action -> (modal title, require_reason, require_duration)
+BULK_ACTIONS: Dict[str, Tuple[str, bool, bool]] = {
+    'kill': ("Bulk Kill", False, False),
+    'kick': ("Bulk Kick", True, False),
+    'tempban': ("Bulk Temp Ban", True, True),
+    'ban': ("Bulk Ban", True, False),
+}
+
+# Maximum players accepted in one bulk action
+MAX_BULK_PLAYERS = 50
+
+# Note on unbans scheduled by a tempban; they are skipped if the player has since been banned for longer
+TEMPBAN_EXPIRY_NOTE = 'tempban expiry'
+
+# Bans listed per page of /admin banlist
+BANLIST_PAGE_SIZE = 10
+
+# Server state -> (emoji, embed colour) for /admin status
+SERVER_STATE_STYLES: Dict[str, Tuple[str, discord.Color]] = {
+    'running': ("🟢", discord.Color.green()),
+    'starting': ("🟡", discord.Color.gold()),
+    'stopping': ("🟠", discord.Color.orange()),
+    'offline': ("🔴", discord.Color.red()),
+}
+
+# Actions without a player target: action -> (past tense, verb) for reply messages
+GLOBAL_ACTION_LABELS: Dict[str, Tuple[str, str]] = {
+    'freeze': ("frozen", "freeze"),
+    'unfreeze': ("unfrozen", "unfreeze"),
+}
+
+
+def server_outcome_emoji(outcome: Dict[str, Any]) -> str:
+    """✅ sent, ⏳ still queued or running after FANOUT_TIMEOUT, ❌ failed"""
+    if outcome['success']:
+        return "✅"
+    return "⏳" if outcome.get('pending') else "❌"
+
+
+def format_server_results(result: Dict[str, Any]) -> str:
+    """
+    Describe per-server outcomes of a multi-server command for a reply message
+    
+    Args:
+        result: Result from AdminBot.run_command()
+        
+    Returns:
+        A line such as "\nServers: ✅ lobby • ❌ survival • ⏳ creative", or "" for single-server results
+    """
+    servers = result.get('servers')
+    if not servers:
+        return ""
+    return "\nServers: " + " • ".join(
+        f"{server_outcome_emoji(outcome)} {name}" for name, outcome in servers.items()
+    )
+
+
+def format_action_reply(
+    action: str,
+    player: Optional[str],
+    reason: Optional[str],
+    duration: Optional[int],
+    result: Dict[str, Any]
+) -> str:
+    """
+    Build the moderator's followup message for a single action
+    
+    Args:
+        action: The moderation action
+        player: Target player (None for game-wide actions such as freeze)
+        reason: The reason for the action
+        duration: Duration in minutes (for temp bans)
+        result: Result from AdminBot.run_command()
+        
+    Returns:
+        The reply text
+    """
+    if player is None:
+        past, verb = GLOBAL_ACTION_LABELS.get(action, (f"{action} done", action))
+        if result['success']:
+            return f"✅ Game {past} successfully!" + format_server_results(result)
+        return f"❌ Failed to {verb} game: {result.get('error', 'Unknown error')}" + format_server_results(result)
+    
+    if result['success']:
+        message = f"✅ Successfully executed {action} on **{player}**"
+        if reason:
+            message += f"\nReason: {reason}"
+        if duration:
+            message += f"\nDuration: {duration} minutes"
+    else:
+        message = f"❌ Failed to execute {action} on **{player}**\n"
+        message += f"Error: {result.get('error', 'Unknown error')}"
+    return message + format_server_results(result)
+
+
+def format_scheduled_job(job: Dict[str, Any]) -> str:
+    """
+    Describe a scheduled action in one line for replies and listings
+    
+    Args:
+        job: Job from ActionScheduler
+        
+    Returns:
+        Text such as "`1a2b3c4d` **freeze** at <t:...:f> (<t:...:R>), daily"
+    """
+    line = f"`{job['id'][:8]}` **{job['action']}**"
+    if job['player']:
+        line += f" {job['player']}"
+    if job['action'] == 'announce' and job['reason']:
+        line += f": {truncate(job['reason'], 80)}"
+    due = int(job['due_at'])
+    line += f" at <t:{due}:f> (<t:{due}:R>)"
+    if job['repeat']:
+        line += ", daily" if job['repeat'] == 86400 else f", every {job['repeat'] / 3600:g}h"
+    if job['note']:
+        line += f" - {job['note']}"
+    return line
+
+
+def format_ban_entry(entry: Dict[str, Any]) -> str:
+    """
+    Describe a ban list entry in one line
+    
+    Args:
+        entry: Entry from BanList
+    
+    Returns:
+        Text such as "**Steve** - permanent, by Admin: griefing"
+    """
+    line = f"**{entry['name']}** - "
+    line += f"until <t:{int(entry['expires'])}:f>" if entry['expires'] else "permanent"
+    if entry['source']:
+        line += f", by {entry['source']}"
+    if entry['reason']:
+        line += f": {truncate(entry['reason'], 80)}"
+    return line
+
+
+def build_banlist_embed(entries: List[Dict[str, Any]], page: int, query: Optional[str], loaded: bool) -> discord.Embed:
+    """
+    Build one page of the /admin banlist view
+    
+    Args:
+        entries: Matching ban list entries, sorted
+        page: Zero-based page number
+        query: Search text the entries were filtered by
+        loaded: Whether the server's ban file has been read yet
+    
+    Returns:
+        Embed listing BANLIST_PAGE_SIZE entries
+    """
+    pages = max(1, -(-len(entries) // BANLIST_PAGE_SIZE))
+    shown = entries[page * BANLIST_PAGE_SIZE:(page + 1) * BANLIST_PAGE_SIZE]
+    if shown:
+        description = "\n".join(format_ban_entry(entry) for entry in shown)
+    else:
+        description = f"No banned players match `{query}`." if query else "No banned players."
+    embed = discord.Embed(
+        title=f"🚫 Banned Players ({len(entries)})" + (f" matching \"{query}\"" if query else ""),
+        description=truncate(description, 4096),
+        color=discord.Color.red()
+    )
+    footer = f"Page {page + 1}/{pages}"
+    if not loaded:
+        footer += " • Server ban list not read yet - only bans made through the bot are shown"
+    embed.set_footer(text=footer)
+    return embed
+
+
+def build_status_embed(monitor: ResourceMonitor, short_window: float = 300, long_window: float = 900) -> discord.Embed:
+    """
+    Build the /admin status embed from the monitor's samples (no panel calls)
+    
+    Args:
+        monitor: Resource monitor holding recent samples
+        short_window: Seconds covered by the short averages
+        long_window: Seconds covered by the peaks and sparklines
+        
+    Returns:
+        Embed with current values and recent trends
+    """
+    sample = monitor.latest()
+    if sample is None:
+        description = "No resource samples yet."
+        if monitor.last_error:
+            description += f"\nLast poll failed: {monitor.last_error}"
+        return discord.Embed(title="📊 Server Status", description=description, color=discord.Color.greyple())
+    
+    emoji, color = SERVER_STATE_STYLES.get(sample.state, ("⚪", discord.Color.greyple()))
+    description = f"{emoji} **{sample.state.title()}**"
+    if sample.state == 'running' and sample.uptime:
+        description += f" for {format_duration(sample.uptime)}"
+    if monitor.last_error:
+        description += f"\n⚠️ Latest poll failed ({monitor.last_error}) - showing the last good sample"
+    embed = discord.Embed(
+        title="📊 Server Status",
+        description=description,
+        color=color,
+        timestamp=datetime.datetime.fromtimestamp(sample.time, datetime.timezone.utc)
+    )
+    
+    short_label = f"{short_window / 60:g}m"
+    long_label = f"{long_window / 60:g}m"
+    cpu_short = monitor.trend('cpu', short_window)
+    cpu_long = monitor.trend('cpu', long_window)
+    memory_short = monitor.trend('memory_bytes', short_window)
+    memory_long = monitor.trend('memory_bytes', long_window)
+    
+    cpu = f"**{sample.cpu:.1f}%**"
+    if cpu_short and cpu_short['samples'] > 1:
+        cpu += f"\n{short_label} avg {cpu_short['avg']:.1f}%"
+    if cpu_long and cpu_long['samples'] > 1:
+        cpu += f"\n{long_label} peak {cpu_long['max']:.1f}%"
+    embed.add_field(name="CPU", value=cpu, inline=True)
+    
+    memory = f"**{format_bytes(sample.memory_bytes)}**"
+    if memory_short and memory_short['samples'] > 1:
+        change = memory_short['change']
+        memory += f"\n{short_label} {'▲' if change > 0 else '▼' if change < 0 else '='} {format_bytes(abs(change))}"
+    if memory_long and memory_long['samples'] > 1:
+        memory += f"\n{long_label} peak {format_bytes(memory_long['max'])}"
+    embed.add_field(name="Memory", value=memory, inline=True)
+    
+    embed.add_field(name="Disk", value=f"**{format_bytes(sample.disk_bytes)}**", inline=True)
+    embed.add_field(
+        name="Network",
+        value=f"↓ {format_bytes(sample.network_rx_bytes)} • ↑ {format_bytes(sample.network_tx_bytes)}",
+        inline=False
+    )
+    
+    recent = monitor.window(long_window)
+    if len(recent) > 1:
+        embed.add_field(
+            name=f"Last {long_label}",
+            value=(
+                f"CPU `{sparkline([point.cpu for point in recent])}`\n"
+                f"Memory `{sparkline([point.memory_bytes for point in recent])}`"
+            ),
+            inline=False
+        )
+    
+    embed.set_footer(text=f"{len(monitor)} samples in memory • sampling every {monitor.current_interval:g}s")
+    return embed
+
+
+def parse_player_list(text: str) -> List[str]:
+    """
+    Split free-text player input into unique names, keeping first-seen order
+    
+    Args:
+        text: Names separated by commas, spaces or newlines
+        
+    Returns:
+        List of player names (duplicates removed case-insensitively)
+    """
+    players: Dict[str, str] = {}
+    for name in re.split(r'[\s,;]+', text):
+        if name:
+            players.setdefault(name.lower(), name)
+    return list(players.values())
+
+
+def build_panel_embed() -> discord.Embed:
+    """Build the admin panel embed (static - built once and reused)"""
+    embed = discord.Embed(
+        title="🛡️ Admin Action Panel",
+        description="Select a moderation action below:",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="Available Actions",
+        value=(
+            "🔴 **Kill** - Remove player instantly\n"
+            "👢 **Kick** - Disconnect player\n"
+            "⏰ **Temp Ban** - Temporary ban\n"
+            "🚫 **Ban** - Permanent ban\n"
+            "❄️ **Freeze** - Stop game ticks\n"
+            "✅ **Unfreeze** - Restore game ticks"
+        ),
+        inline=False
+    )
+    embed.set_footer(text="All actions are logged in the audit channel")
+    return embed
+
+
+def build_welcome_embed(audit_channel_id: int) -> discord.Embed:
+    """
+    Build the welcome message embed, without its timestamp
+    
+    Args:
+        audit_channel_id: Channel mentioned as the audit log
+        
+    Returns:
+        Embed to copy and timestamp for each welcome message
+    """
+    embed = discord.Embed(
+        title="🤖 Admin Action Bot Online",
+        description="Minecraft server moderation tool is ready!",
+        color=discord.Color.green()
+    )
+    
+    embed.add_field(
+        name="📋 Available Commands",
+        value=(
+            "`/admin panel` - Open the admin action panel\n"
+            "`/admin kill|kick|tempban|ban` - Act on a player directly, with name autocomplete\n"
+            "`/admin schedule|scheduled|unschedule` - Timed freezes, announcements and unbans\n"
+            "`/admin banlist` - Page through banned players\n"
+            "`/admin status` - Server CPU, memory and disk with recent trends"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🛡️ Available Actions",
+        value=(
+            "• 🔴 **Kill** - Remove player instantly\n"
+            "• 👢 **Kick** - Disconnect player from server\n"
+            "• ⏰ **Temp Ban** - Temporary ban with duration\n"
+            "• 🚫 **Ban** - Permanent ban\n"
+            "• ❄️ **Freeze** - Freeze game ticks\n"
+            "• ✅ **Unfreeze** - Restore game ticks"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📍 Usage",
+        value=f"Use `/admin panel` in this channel to open the moderation panel.\nAll actions are logged in <#{audit_channel_id}>",
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Version 0.2.2 • Logged actions appear in #audit-logs")
+    return embed
+
 
 class AdminBot(commands.Bot):
     """Main bot class for Admin Action Bot"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, started_at: Optional[float] = None):
         """
         Initialize the bot
         
         Args:
             config: Configuration instance
+            started_at: time.monotonic() at process start (default: now), for time-to-ready
         """
         intents = discord.Intents.default()
         intents.message_content = True
@@ -37,10 +393,22 @@ class AdminBot(commands.Bot):
         super().__init__(
             command_prefix=config.command_prefix,
             intents=intents,
-            help_command=None
+            help_command=None,
+            # Sent with every IDENTIFY, so reconnects keep the status without change_presence
+            activity=discord.Activity(
+                type=discord.ActivityType.watching,
+                name="for moderation needs | /admin panel"
+            )
         )
         
         self.config = config
+        self._startup_done = False
+        
+        # Startup measurements: seconds per startup step, and process start -> ready for /admin
+        self.started_at = started_at if started_at is not None else time.monotonic()
+        self.startup_timings: Dict[str, float] = {}
+        self.time_to_ready: Optional[float] = None
+        self._background_tasks: Set[asyncio.Task] = set()
         self.bot_channel: Optional[discord.TextChannel] = None
         self.audit_channel: Optional[discord.TextChannel] = None
         self.admin_guild: Optional[discord.Guild] = None
@@ -49,21 +417,138 @@ class AdminBot(commands.Bot):
         self.pterodactyl = PterodactylClient(
             api_url=config.pterodactyl_url,
             api_key=config.pterodactyl_key,
-            server_id=config.server_id
+            server_id=config.server_id,
+            connection_limit=config.pterodactyl_connection_limit,
+            dns_cache_ttl=config.pterodactyl_dns_cache_ttl,
+            keepalive_timeout=config.pterodactyl_keepalive_timeout,
+            rate_limit=config.pterodactyl_rate_limit,
+            rate_burst=config.pterodactyl_rate_burst,
+            max_rate_limit_retries=config.pterodactyl_max_rate_limit_retries,
+            max_retries=config.pterodactyl_max_retries,
+            retry_base_delay=config.pterodactyl_retry_base_delay,
+            circuit_failure_threshold=config.pterodactyl_circuit_failure_threshold,
+            circuit_reset_timeout=config.pterodactyl_circuit_reset_timeout,
+            status_cache_ttl=config.status_cache_ttl,
+            status_cache_stale=config.status_cache_stale
+        )
+        
+        # Shared console websocket (subscribe with `async for line in bot.console.lines()`)
+        self.console = ConsoleStream(self.pterodactyl)
+        
+        # Live online-player roster fed from console join/leave lines
+        self.roster = PlayerRoster(self.console)
+        
+        # Durable local audit journal (source of truth for the audit channel)
+        self.journal = AuditJournal(config.audit_journal_path)
+        
+        # Batched writer for the audit channel
+        self.audit_queue = AuditQueue(
+            get_channel=lambda: self.audit_channel,
+            on_delivered=self.journal.mark_delivered,
+            batch_size=config.audit_batch_size,
+            flush_interval=config.audit_flush_interval
         )
         
         # Cache for recent players (for dropdown selection)
-        self.recent_players: list = []
-        self.max_recent_players = 25  # Store last 25 unique players
+        self.recent_players = RecentPlayers(
+            capacity=config.recent_players_capacity,
+            path=config.recent_players_path
+        )
+        
+        # Worker pool that runs single actions, then replies and audits concurrently
+        self.executor = ActionExecutor(
+            self.run_command,
+            workers=config.action_workers,
+            max_queue=config.action_queue_size
+        )
+        
+        # Timed actions (tempban expiry, scheduled freezes and announcements), persisted to disk
+        self.scheduler = ActionScheduler(
+            config.scheduler_path,
+            self.run_scheduled_action,
+            concurrency=config.scheduler_concurrency
+        )
+        
+        # Banned players, read from the server's ban file and updated when the bot bans or unbans
+        self.ban_list = BanList(
+            self.pterodactyl,
+            path=config.banlist_path,
+            refresh_interval=config.banlist_refresh_interval
+        )
+        
+        # Recent CPU, memory and disk samples for /admin status
+        self.telemetry = ResourceMonitor(
+            self.pterodactyl,
+            interval=config.telemetry_interval,
+            idle_interval=config.telemetry_idle_interval,
+            idle_cpu=config.telemetry_idle_cpu,
+            capacity=config.telemetry_history
+        )
+        
+        # Per-interaction tracing (JSON timelines; slow interactions always logged)
+        self.tracer = Tracer(log_all=config.trace_log_enabled, slow_threshold=config.slow_interaction_threshold)
+        
+        # Optional local Prometheus endpoint, and event-loop lag sampling
+        self.metrics_server = MetricsServer(REGISTRY, config.metrics_host, config.metrics_port) if config.metrics_enabled else None
+        self.loop_lag = LoopLagMonitor()
+        
+        # Values that must survive restarts (e.g. the pinned panel message ID)
+        self.state = BotState(config.state_path)
+        
+        # Static embeds are built once; the panel view is created in setup_hook (needs the event loop)
+        self.panel_embed = build_panel_embed()
+        self.welcome_embed = build_welcome_embed(config.audit_channel_id)
+        self.panel_view: Optional[AdminActionView] = None
         
     async def setup_hook(self):
         """Called when bot is starting up - setup commands and extensions"""
         logger.info("Setting up bot...")
         
+        # Independent local setup runs concurrently: the shared Pterodactyl HTTP session,
+        # the audit journal, recent players from the last run and persisted state
+        # (panel and welcome message IDs, command tree hash)
+        await asyncio.gather(
+            self.run_startup_step('pterodactyl session', self.pterodactyl.start(), required=True),
+            self.run_startup_step('audit journal', self.journal.start(), required=True),
+            self.run_startup_step('recent players', asyncio.to_thread(self.recent_players.load), required=True),
+            self.run_startup_step('bot state', asyncio.to_thread(self.state.load), required=True)
+        )
+        
+        # Start the batched audit writer, recent-players snapshots and action workers
+        self.audit_queue.start()
+        self.executor.start()
+        self.loop_lag.start()
+        
+        # Restore pending timed actions; overdue ones (missed while offline) run straight away
+        await self.run_startup_step('scheduler', self.scheduler.start(), required=True)
+        
+        # Serve /metrics locally when enabled
+        if self.metrics_server:
+            REGISTRY.add_collector(self.collect_metrics)
+            await self.run_startup_step('metrics endpoint', self.metrics_server.start(), required=True)
+        self.recent_players.start()
+        
+        # Connect to the server console in the background
+        if self.config.console_stream_enabled:
+            self.roster.start()
+            self.console.start()
+        
+        # Load the server's ban list in the background, then watch it for changes
+        if self.config.banlist_enabled:
+            self.ban_list.start()
+        
+        # Sample server resources in the background
+        if self.config.telemetry_enabled:
+            self.telemetry.start()
+        
+        # Register the panel as a persistent view so its buttons keep working after a restart
+        self.panel_view = AdminActionView(self)
+        self.add_view(self.panel_view)
+        
         # Register slash commands
         await self.register_commands()
         
-        logger.info("Setup complete")
+        logger.info(f"Setup complete ({time.monotonic() - self.started_at:.2f}s since process start)")
     
     async def on_ready(self):
         """Called when bot successfully connects to Discord"""
@@ -91,106 +576,337 @@ class AdminBot(commands.Bot):
         logger.info(f"Bot channel: #{self.bot_channel.name}")
         logger.info(f"Audit channel: #{self.audit_channel.name}")
         
-        # Sync slash commands to guild
-        try:
-            synced = await self.tree.sync(guild=discord.Object(id=self.config.guild_id))
-            logger.info(f"Synced {len(synced)} command(s) to guild")
-        except Exception as e:
-            logger.error(f"Failed to sync commands: {e}")
+        # Post any audit entries that were journaled while Discord was unreachable
+        self.spawn(self.run_startup_step('audit replay', self.replay_audit_journal()), name="audit-replay")
         
-        # Set bot status
-        await self.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name="for moderation needs | /admin"
-            )
+        # Everything below only needs to happen once per process, not on every reconnect
+        if self._startup_done:
+            logger.info("Reconnected - skipping one-time startup work")
+            return
+        self._startup_done = True
+        
+        timeout = self.config.startup_step_timeout
+        
+        # Test the Pterodactyl connection in the background - a slow panel must not delay readiness
+        self.spawn(
+            self.run_startup_step('panel health check', self.pterodactyl.test_connection(), timeout),
+            name="panel-health-check"
         )
         
-        # Test Pterodactyl connection
-        await self.pterodactyl.test_connection()
+        # Independent Discord steps run concurrently, each under its own deadline:
+        # command sync (skipped when the tree is unchanged), the pinned admin panel,
+        # and the welcome message (edited in place when it still exists)
+        await asyncio.gather(
+            self._sync_commands_and_report_ready(timeout),
+            self.run_startup_step('pinned panel', self.ensure_panel_message(), timeout),
+            self.run_startup_step('welcome message', self.send_welcome_message(), timeout)
+        )
+        logger.info(
+            "Startup steps: " +
+            ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in self.startup_timings.items())
+        )
+    
+    async def _sync_commands_and_report_ready(self, timeout: float):
+        """Sync commands, then record how long the process took to become ready for /admin"""
+        await self.run_startup_step('command sync', self.sync_commands(), timeout)
+        self.time_to_ready = time.monotonic() - self.started_at
+        logger.info(f"Ready for /admin {self.time_to_ready:.2f}s after process start")
+    
+    async def run_startup_step(
+        self,
+        name: str,
+        step: Awaitable[Any],
+        timeout: Optional[float] = None,
+        required: bool = False
+    ) -> bool:
+        """
+        Run one startup step under a deadline, recording how long it took
         
-        # Send welcome message to bot channel
-        await self.send_welcome_message()
+        Args:
+            name: Step name for logs and startup_timings
+            step: The awaitable to run
+            timeout: Seconds before the step is abandoned (None waits indefinitely)
+            required: Re-raise failures instead of logging them
+            
+        Returns:
+            True if the step finished in time without raising
+        """
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(step, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Startup step '{name}' timed out after {timeout:g}s")
+            if required:
+                raise
+            return False
+        except Exception:
+            if required:
+                raise
+            logger.exception(f"Startup step '{name}' failed")
+            return False
+        finally:
+            self.startup_timings[name] = time.monotonic() - started
+        
+        logger.info(f"Startup step '{name}' finished in {self.startup_timings[name]:.3f}s")
+        return True
+    
+    def collect_metrics(self):
+        """Refresh scrape-time gauges: queue depths and cache hit rates"""
+        QUEUE_DEPTH.set(self.executor.depth, queue='actions')
+        QUEUE_DEPTH.set(self.executor.in_flight, queue='actions_in_flight')
+        QUEUE_DEPTH.set(self.audit_queue.depth, queue='audit')
+        QUEUE_DEPTH.set(self.journal.depth, queue='journal')
+        QUEUE_DEPTH.set(self.pterodactyl.rate_limiter.waiting, queue='rate_limiter')
+        
+        stats = self.pterodactyl.status_cache.stats()
+        CACHE_HIT_RATIO.set(stats['hit_rate'], cache='server_status')
+        for result in ('hits', 'stale_hits', 'misses', 'coalesced'):
+            CACHE_LOOKUPS.set(stats[result], cache='server_status', result=result)
+    
+    def spawn(self, coro: Awaitable[Any], name: Optional[str] = None) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def close(self):
+        """Shut down the bot and release the Pterodactyl HTTP session"""
+        for task in list(self._background_tasks):
+            task.cancel()
+        await self.roster.stop()
+        await self.console.stop()
+        await self.ban_list.stop()
+        await self.telemetry.stop()
+        await self.scheduler.stop()
+        await self.executor.stop()
+        await self.audit_queue.stop()
+        await self.journal.stop()
+        await self.recent_players.stop()
+        await self.loop_lag.stop()
+        if self.metrics_server:
+            REGISTRY.remove_collector(self.collect_metrics)
+            await self.metrics_server.stop()
+        await self.pterodactyl.close()
+        await super().close()
     
     async def on_error(self, event_method: str, *args, **kwargs):
         """Handle errors in event handlers"""
         logger.exception(f"Error in {event_method}")
     
+    def command_tree_hash(self) -> str:
+        """Hash of the guild command tree payload, used to skip redundant syncs"""
+        guild = discord.Object(id=self.config.guild_id)
+        payload = [command.to_dict(self.tree) for command in self.tree.get_commands(guild=guild)]
+        data = json.dumps([self.config.guild_id, payload], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+    
+    async def sync_commands(self):
+        """Sync slash commands to the guild unless the synced tree is already up to date"""
+        tree_hash = self.command_tree_hash()
+        if self.state.get('command_tree_hash') == tree_hash:
+            logger.info("Command tree unchanged - skipping sync")
+            return
+        
+        try:
+            synced = await self.tree.sync(guild=discord.Object(id=self.config.guild_id))
+            logger.info(f"Synced {len(synced)} command(s) to guild")
+            await self.state.set('command_tree_hash', tree_hash)
+        except Exception as e:
+            logger.error(f"Failed to sync commands: {e}")
+    
     async def send_welcome_message(self):
-        """Send welcome message to bot channel showing available commands"""
+        """Send welcome message to bot channel showing available commands, editing the last one if it still exists"""
         if not self.bot_channel:
             logger.warning("Cannot send welcome message - bot channel not found")
             return
         
         try:
-            embed = discord.Embed(
-                title="🤖 Admin Action Bot Online",
-                description="Minecraft server moderation tool is ready!",
-                color=discord.Color.green()
-            )
-            
-            embed.add_field(
-                name="📋 Available Commands",
-                value="</admin:0> - Open the admin action panel",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🛡️ Available Actions",
-                value=(
-                    "• 🔴 **Kill** - Remove player instantly\n"
-                    "• 👢 **Kick** - Disconnect player from server\n"
-                    "• ⏰ **Temp Ban** - Temporary ban with duration\n"
-                    "• 🚫 **Ban** - Permanent ban\n"
-                    "• ❄️ **Freeze** - Freeze game ticks\n"
-                    "• ✅ **Unfreeze** - Restore game ticks"
-                ),
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📍 Usage",
-                value=f"Use `/admin` in this channel to open the moderation panel.\nAll actions are logged in <#{self.config.audit_channel_id}>",
-                inline=False
-            )
-            
-            embed.set_footer(text=f"Version 0.2.2 • Logged actions appear in #audit-logs")
+            embed = self.welcome_embed.copy()
             embed.timestamp = discord.utils.utcnow()
             
-            await self.bot_channel.send(embed=embed)
+            message_id = self.state.get('welcome_message_id')
+            if message_id:
+                try:
+                    await self.bot_channel.get_partial_message(message_id).edit(embed=embed)
+                    logger.info("Welcome message updated in bot channel")
+                    return
+                except discord.NotFound:
+                    pass
+            
+            message = await self.bot_channel.send(embed=embed)
+            await self.state.set('welcome_message_id', message.id)
             logger.info("Welcome message sent to bot channel")
             
         except Exception as e:
             logger.error(f"Failed to send welcome message: {e}")
     
+    async def ensure_panel_message(self):
+        """Edit the pinned admin panel in the bot channel, or post and pin a new one"""
+        if not self.config.pinned_panel_enabled or not self.bot_channel:
+            return
+        
+        message_id = self.state.get('panel_message_id')
+        if message_id:
+            try:
+                message = await self.bot_channel.fetch_message(message_id)
+                await message.edit(embed=self.panel_embed, view=self.panel_view)
+                logger.info("Pinned admin panel refreshed")
+                return
+            except discord.NotFound:
+                logger.info("Pinned admin panel was deleted - posting a new one")
+            except discord.HTTPException as e:
+                logger.error(f"Failed to refresh pinned admin panel: {e}")
+                return
+        
+        try:
+            message = await self.bot_channel.send(embed=self.panel_embed, view=self.panel_view)
+            await self.state.set('panel_message_id', message.id)
+            await message.pin(reason="Admin action panel")
+            logger.info("Admin panel posted and pinned in bot channel")
+        except discord.Forbidden:
+            logger.warning("Missing permission to post or pin the admin panel (needs Manage Messages to pin)")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to post admin panel: {e}")
+    
     async def register_commands(self):
         """Register slash commands and UI components"""
+        admin_group = app_commands.Group(name="admin", description="Minecraft server moderation")
+        
+        async def player_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            """Suggest online, then recently moderated, players matching what has been typed"""
+            if not self.is_admin(interaction.user):
+                return []
+            return [
+                app_commands.Choice(name=player, value=player)
+                for player in self.search_players(current)
+            ]
+        
         # Main admin panel command
-        @self.tree.command(
-            name="admin",
-            description="Open the admin action panel",
-            guild=discord.Object(id=self.config.guild_id)
-        )
+        @admin_group.command(name="panel", description="Open the admin action panel")
         async def admin_panel(interaction: discord.Interaction):
             """Show the main admin panel with moderation buttons"""
-            # Defer immediately in the command itself to minimize delay
-            try:
-                await interaction.response.defer(ephemeral=True)
-            except discord.errors.NotFound:
-                # Interaction already expired - log and return
-                logger.error("Interaction expired before defer - user may have slow connection")
-                return
-            
-            await self.show_admin_panel(interaction)
+            async with self.tracer.interaction('admin_panel', interaction):
+                # Defer immediately in the command itself to minimize delay
+                if not await self.defer_interaction(interaction):
+                    return
+                
+                await self.show_admin_panel(interaction)
+        
+        @admin_group.command(name="kill", description="Kill a player")
+        @app_commands.describe(player="Player name")
+        @app_commands.autocomplete(player=player_autocomplete)
+        async def admin_kill(interaction: discord.Interaction, player: str):
+            await self.run_slash_action(interaction, "kill", player)
+        
+        @admin_group.command(name="kick", description="Kick a player from the server")
+        @app_commands.describe(player="Player name", reason="Reason for the kick")
+        @app_commands.autocomplete(player=player_autocomplete)
+        async def admin_kick(interaction: discord.Interaction, player: str, reason: app_commands.Range[str, 1, 500]):
+            await self.run_slash_action(interaction, "kick", player, reason=reason)
+        
+        @admin_group.command(name="tempban", description="Temporarily ban a player")
+        @app_commands.describe(player="Player name", duration="Duration in minutes", reason="Reason for the ban")
+        @app_commands.autocomplete(player=player_autocomplete)
+        async def admin_tempban(
+            interaction: discord.Interaction,
+            player: str,
+            duration: app_commands.Range[int, 1, 525600],
+            reason: app_commands.Range[str, 1, 500]
+        ):
+            await self.run_slash_action(interaction, "tempban", player, reason=reason, duration=duration)
+        
+        @admin_group.command(name="ban", description="Permanently ban a player")
+        @app_commands.describe(player="Player name", reason="Reason for the ban")
+        @app_commands.autocomplete(player=player_autocomplete)
+        async def admin_ban(interaction: discord.Interaction, player: str, reason: app_commands.Range[str, 1, 500]):
+            await self.run_slash_action(interaction, "ban", player, reason=reason)
+        
+        @admin_group.command(name="schedule", description="Schedule a freeze, unfreeze, announcement or unban")
+        @app_commands.describe(
+            action="What to run",
+            when="A delay (30m, 2h), a time of day (03:00) or a date and time (2025-01-31 18:00)",
+            player="Player to unban",
+            message="Announcement text",
+            window="Freeze only: unfreeze again after this many minutes",
+            daily="Repeat every day"
+        )
+        @app_commands.choices(action=[
+            app_commands.Choice(name="Freeze", value="freeze"),
+            app_commands.Choice(name="Unfreeze", value="unfreeze"),
+            app_commands.Choice(name="Announcement", value="announce"),
+            app_commands.Choice(name="Unban", value="unban")
+        ])
+        @app_commands.autocomplete(player=player_autocomplete)
+        async def admin_schedule(
+            interaction: discord.Interaction,
+            action: app_commands.Choice[str],
+            when: str,
+            player: Optional[str] = None,
+            message: Optional[app_commands.Range[str, 1, 200]] = None,
+            window: Optional[app_commands.Range[int, 1, 1440]] = None,
+            daily: bool = False
+        ):
+            await self.schedule_action(interaction, action.value, when, player, message, window, daily)
+        
+        @admin_group.command(name="scheduled", description="List upcoming scheduled actions")
+        async def admin_scheduled(interaction: discord.Interaction):
+            await self.show_scheduled(interaction)
+        
+        @admin_group.command(name="unschedule", description="Cancel a scheduled action")
+        @app_commands.describe(job="Job ID shown by /admin scheduled")
+        async def admin_unschedule(interaction: discord.Interaction, job: str):
+            await self.unschedule_action(interaction, job)
+        
+        @admin_group.command(name="banlist", description="List banned players")
+        @app_commands.describe(search="Only players whose name contains this")
+        async def admin_banlist(interaction: discord.Interaction, search: Optional[str] = None):
+            await self.show_banlist(interaction, search)
+        
+        @admin_group.command(name="status", description="Show server CPU, memory and disk usage")
+        async def admin_status(interaction: discord.Interaction):
+            await self.show_status(interaction)
+        
+        self.tree.add_command(admin_group, guild=discord.Object(id=self.config.guild_id))
         
         logger.info("Commands registered")
     
-    async def show_admin_panel(self, interaction: discord.Interaction):
+    async def defer_interaction(self, interaction: discord.Interaction) -> bool:
+        """Defer an interaction ephemerally; False if it already expired"""
+        try:
+            with tracing.span('defer'):
+                await interaction.response.defer(ephemeral=True)
+            return True
+        except discord.errors.NotFound:
+            # Interaction already expired - log and return
+            logger.error("Interaction expired before defer - user may have slow connection")
+            return False
+    
+    def is_admin(self, member: discord.abc.User) -> bool:
         """
-        Display the main admin panel with moderation action buttons
+        Check whether a member may use admin commands
+        
+        Args:
+            member: The guild member
+            
+        Returns:
+            True if they hold ADMIN_ROLE_ID (or are an administrator when no role is configured)
+        """
+        if not isinstance(member, discord.Member):
+            return False
+        if self.config.admin_role_id:
+            return any(role.id == self.config.admin_role_id for role in member.roles)
+        return member.guild_permissions.administrator
+    
+    async def check_access(self, interaction: discord.Interaction) -> bool:
+        """
+        Check channel and permissions for an admin command, replying if denied
         
         Args:
             interaction: Discord interaction (already deferred)
+            
+        Returns:
+            True if the command may proceed
         """
         # Check if command is used in the correct channel
         if interaction.channel_id != self.config.bot_channel_id:
@@ -198,48 +914,323 @@ class AdminBot(commands.Bot):
                 f"❌ This command can only be used in <#{self.config.bot_channel_id}>",
                 ephemeral=True
             )
-            return
+            return False
         
         # Check if user has admin permissions
-        if self.config.admin_role_id:
-            if not any(role.id == self.config.admin_role_id for role in interaction.user.roles):
-                await interaction.followup.send(
-                    "❌ You don't have permission to use admin commands.",
-                    ephemeral=True
-                )
+        if not self.is_admin(interaction.user):
+            if self.config.admin_role_id:
+                message = "❌ You don't have permission to use admin commands."
+            else:
+                message = "❌ You need administrator permissions to use this command."
+            await interaction.followup.send(message, ephemeral=True)
+            return False
+        
+        return True
+    
+    def search_players(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        Find online and recently moderated players by name prefix
+        
+        Args:
+            prefix: Start of the name (case-insensitive; empty matches everyone)
+            limit: Maximum results (Discord shows 25 suggestions)
+            
+        Returns:
+            Online matches first, then recent matches, without duplicates
+        """
+        if not prefix:
+            return self.get_player_choices(limit)
+        
+        matches = self.roster.search(prefix, limit)
+        for player in self.recent_players.search(prefix, limit):
+            if len(matches) >= limit:
+                break
+            if player not in self.roster:
+                matches.append(player)
+        return matches
+    
+    async def run_slash_action(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        player: str,
+        reason: Optional[str] = None,
+        duration: Optional[int] = None
+    ):
+        """
+        Handle an /admin <action> subcommand
+        
+        Args:
+            interaction: Discord interaction (not yet deferred)
+            action: The moderation action
+            player: Target player (from autocomplete or typed)
+            reason: The reason for the action
+            duration: Duration in minutes (for temp bans)
+        """
+        async with self.tracer.interaction(f'admin_{action}', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
                 return
-        elif not interaction.user.guild_permissions.administrator:
+            
+            # The name is checked when the command is rendered
+            await self.submit_action(interaction, action, player.strip(), reason.strip() if reason else None, duration)
+    
+    async def show_admin_panel(self, interaction: discord.Interaction):
+        """
+        Display the main admin panel with moderation action buttons
+        
+        Args:
+            interaction: Discord interaction (already deferred)
+        """
+        if not await self.check_access(interaction):
+            return
+        
+        with tracing.span('show_admin_panel'):
+            await interaction.followup.send(embed=self.panel_embed, view=self.panel_view, ephemeral=True)
+    
+    async def schedule_action(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        when: str,
+        player: Optional[str] = None,
+        message: Optional[str] = None,
+        window: Optional[int] = None,
+        daily: bool = False
+    ):
+        """
+        Handle /admin schedule
+        
+        Args:
+            interaction: Discord interaction (not yet deferred)
+            action: freeze, unfreeze, announce or unban
+            when: When to run it, as accepted by parse_when()
+            player: Target player (unban)
+            message: Announcement text (announce)
+            window: Minutes after a freeze to unfreeze again
+            daily: Repeat every day
+        """
+        async with self.tracer.interaction(f'admin_schedule:{action}', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
+                return
+            
+            player = player.strip() if player else None
+            error = None
+            if action == 'unban' and not player:
+                error = "Unban needs a `player`."
+            elif action == 'announce' and not message:
+                error = "Announcements need a `message`."
+            elif window and action != 'freeze':
+                error = "`window` only applies to freezes."
+            if error:
+                await interaction.followup.send(f"❌ {error}", ephemeral=True)
+                return
+            
+            try:
+                due_at = parse_when(when).timestamp()
+                # Rendered now so a bad value is refused here rather than failing when due
+                self.config.get_command(action, player=player, reason=message)
+            except ValueError as e:
+                await interaction.followup.send(f"❌ {e}", ephemeral=True)
+                return
+            
+            created_by = (interaction.user.id, str(interaction.user))
+            repeat = 86400.0 if daily else None
+            jobs = [await self.scheduler.schedule(action, due_at, created_by, player=player, reason=message, repeat=repeat)]
+            if window:
+                jobs.append(await self.scheduler.schedule(
+                    'unfreeze', due_at + window * 60, created_by,
+                    repeat=repeat, note=f"end of {window}-minute freeze"
+                ))
+            
             await interaction.followup.send(
-                "❌ You need administrator permissions to use this command.",
+                "🗓️ Scheduled:\n" + "\n".join(format_scheduled_job(job) for job in jobs),
                 ephemeral=True
             )
-            return
+            await self.log_action(
+                admin=interaction.user,
+                action='schedule',
+                target=player or "Game",
+                reason="; ".join(format_scheduled_job(job) for job in jobs)
+            )
+    
+    async def show_scheduled(self, interaction: discord.Interaction, limit: int = 15):
+        """
+        Handle /admin scheduled - list the next pending timed actions
         
-        # Create embed
-        embed = discord.Embed(
-            title="🛡️ Admin Action Panel",
-            description="Select a moderation action below:",
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="Available Actions",
-            value=(
-                "🔴 **Kill** - Remove player instantly\n"
-                "👢 **Kick** - Disconnect player\n"
-                "⏰ **Temp Ban** - Temporary ban\n"
-                "🚫 **Ban** - Permanent ban\n"
-                "❄️ **Freeze** - Stop game ticks\n"
-                "✅ **Unfreeze** - Restore game ticks"
-            ),
-            inline=False
+        Args:
+            interaction: Discord interaction (not yet deferred)
+            limit: Maximum actions to list
+        """
+        async with self.tracer.interaction('admin_scheduled', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
+                return
+            
+            jobs = self.scheduler.upcoming(limit)
+            embed = discord.Embed(
+                title="🗓️ Scheduled Actions",
+                description="\n".join(format_scheduled_job(job) for job in jobs) or "Nothing scheduled.",
+                color=discord.Color.blue()
+            )
+            if len(self.scheduler) > len(jobs):
+                embed.set_footer(text=f"Showing the next {len(jobs)} of {len(self.scheduler)}")
+            await interaction.followup.send(embed=embed, ephemeral=True)
+    
+    async def unschedule_action(self, interaction: discord.Interaction, job_id: str):
+        """
+        Handle /admin unschedule
+        
+        Args:
+            interaction: Discord interaction (not yet deferred)
+            job_id: Job ID or unambiguous prefix (as listed by /admin scheduled)
+        """
+        async with self.tracer.interaction('admin_unschedule', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
+                return
+            
+            job = await self.scheduler.cancel(job_id.strip().strip('`'))
+            if job is None:
+                await interaction.followup.send(f"❌ No single scheduled action matches `{job_id}`.", ephemeral=True)
+                return
+            
+            await interaction.followup.send(f"🗑️ Cancelled {format_scheduled_job(job)}", ephemeral=True)
+            await self.log_action(
+                admin=interaction.user,
+                action='unschedule',
+                target=job['player'] or "Game",
+                reason=format_scheduled_job(job)
+            )
+    
+    async def show_banlist(self, interaction: discord.Interaction, query: Optional[str] = None):
+        """
+        Handle /admin banlist - page through the in-memory ban list
+        
+        Args:
+            interaction: Discord interaction (not yet deferred)
+            query: Only players whose name contains this
+        """
+        async with self.tracer.interaction('admin_banlist', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
+                return
+            
+            query = query.strip() if query else None
+            entries = self.ban_list.entries(query)
+            embed = build_banlist_embed(entries, 0, query, self.ban_list.loaded)
+            if len(entries) > BANLIST_PAGE_SIZE:
+                await interaction.followup.send(embed=embed, view=BanListView(self, entries, query), ephemeral=True)
+            else:
+                await interaction.followup.send(embed=embed, ephemeral=True)
+    
+    async def show_status(self, interaction: discord.Interaction):
+        """
+        Handle /admin status - current resource usage and trends from memory
+        
+        Args:
+            interaction: Discord interaction (not yet deferred)
+        """
+        async with self.tracer.interaction('admin_status', interaction):
+            if not await self.defer_interaction(interaction):
+                return
+            if not await self.check_access(interaction):
+                return
+            
+            if not self.config.telemetry_enabled:
+                await interaction.followup.send("❌ Resource telemetry is disabled (`TELEMETRY_ENABLED`).", ephemeral=True)
+                return
+            await interaction.followup.send(embed=build_status_embed(self.telemetry), ephemeral=True)
+    
+    async def run_scheduled_action(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a due scheduled action and record it in the audit log
+        
+        Args:
+            job: Job from ActionScheduler
+            
+        Returns:
+            run_command() result
+        """
+        details = {'scheduled': job['id']}
+        if job['note']:
+            details['note'] = job['note']
+        reason = job['reason'] or job['note']
+        
+        # A tempban's expiry must not lift a longer ban issued since (e.g. from the console)
+        current_ban = self.ban_list.get(job['player']) if job['note'] == TEMPBAN_EXPIRY_NOTE else None
+        if current_ban and (current_ban['expires'] is None or current_ban['expires'] > job['due_at'] + 60):
+            logger.info(f"Skipping tempban expiry for {job['player']}: {format_ban_entry(current_ban)}")
+            result = {'success': True, 'message': "Skipped"}
+            details['skipped'] = True
+            reason = f"Skipped - player is still banned: {format_ban_entry(current_ban)}"
+        else:
+            try:
+                command = self.config.get_command(job['action'], player=job['player'], reason=job['reason'])
+            except ValueError as e:
+                result = {'success': False, 'error': str(e)}
+            else:
+                result = await self.run_command(job['action'], command)
+            if job['action'] == 'unban' and result['success']:
+                self.ban_list.record_unban(job['player'])
+        
+        record = self.journal.append(
+            admin_id=job['created_by_id'],
+            admin_name=job['created_by_name'],
+            action=job['action'],
+            target=job['player'] or "Game",
+            reason=reason,
+            success=result['success'],
+            error=result.get('error'),
+            latency=result.get('latency'),
+            details=details
         )
-        embed.set_footer(text="All actions are logged in the audit channel")
+        self.audit_queue.put(build_audit_embed(record), record['id'])
+        return result
+    
+    async def track_ban(
+        self,
+        action: str,
+        player: Optional[str],
+        reason: Optional[str],
+        duration: Optional[int],
+        result: Dict[str, Any],
+        admin: discord.abc.User
+    ):
+        """
+        Keep the ban list and a player's pending expiry unban in step with the bans issued through the bot
         
-        # Create buttons (will be implemented in ui module)
-        view = AdminActionView(self)
+        The ban is added to the ban list straight away rather than waiting for the
+        next read of the server's file. A tempban schedules an unban when it runs out
+        (replacing any earlier one); a permanent ban cancels it.
         
-        # Use followup since we already deferred the interaction
-        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+        Args:
+            action: The moderation action that ran
+            player: Target player
+            reason: The reason for the ban
+            duration: Duration in minutes (for temp bans)
+            result: run_command() result
+            admin: The administrator who performed the action
+        """
+        if not player or not result.get('success') or action not in ('tempban', 'ban'):
+            return
+        expires = time.time() + duration * 60 if action == 'tempban' and duration else None
+        self.ban_list.record_ban(player, reason=reason, source=str(admin), expires=expires)
+        await self.scheduler.cancel_matching('unban', player)
+        if action == 'tempban' and duration and self.config.tempban_auto_unban:
+            await self.scheduler.schedule(
+                'unban',
+                time.time() + duration * 60,
+                (admin.id, str(admin)),
+                player=player,
+                note=TEMPBAN_EXPIRY_NOTE
+            )
     
     async def log_action(
         self,
@@ -249,10 +1240,17 @@ class AdminBot(commands.Bot):
         reason: Optional[str] = None,
         duration: Optional[int] = None,
         success: bool = True,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        latency: Optional[float] = None,
+        servers: Optional[Dict[str, Any]] = None,
+        coalesced: Optional[List[discord.abc.User]] = None
     ):
         """
-        Log a moderation action to the audit channel
+        Log a moderation action to the audit journal and audit channel
+        
+        The record is written to the local journal first; the audit-channel
+        embed is a projection of it, queued and sent by the batched audit
+        writer, so this returns without waiting on Discord or the disk.
         
         Args:
             admin: The administrator who performed the action
@@ -262,41 +1260,83 @@ class AdminBot(commands.Bot):
             duration: Duration in minutes (for temp bans)
             success: Whether the action was successful
             error: Error message if action failed
+            latency: Seconds the panel command took
+            servers: Per-server outcomes for multi-server actions
+            coalesced: Administrators whose identical requests shared this action's result
         """
-        if not self.audit_channel:
-            logger.warning("Audit channel not available for logging")
-            return
-        
-        # Determine color based on success
-        color = discord.Color.green() if success else discord.Color.red()
+        details = {}
+        if servers:
+            details['servers'] = servers
+        if coalesced:
+            details['coalesced'] = [[user.id, str(user)] for user in coalesced]
+        
+        with tracing.span('log_action'):
+            record = self.journal.append(
+                admin_id=admin.id,
+                admin_name=str(admin),
+                action=action,
+                target=target,
+                reason=reason,
+                duration=duration,
+                success=success,
+                error=error,
+                latency=latency,
+                details=details or None
+            )
+            
+            # Queued - sent in batches by the audit writer
+            self.audit_queue.put(build_audit_embed(record), record['id'])
+        logger.info(f"Logged {action} by {admin.name} on {target}")
+    
+    async def log_bulk_action(
+        self,
+        admin: discord.Member,
+        action: str,
+        results: List[Tuple[str, Dict]],
+        reason: Optional[str] = None,
+        duration: Optional[int] = None
+    ):
+        """
+        Log a bulk moderation action to the audit journal and channel as one summary
         
-        # Create embed
-        embed = discord.Embed(
-            title=f"{'✅' if success else '❌'} {action.upper()}",
-            color=color,
-            timestamp=discord.utils.utcnow()
+        Args:
+            admin: The administrator who performed the action
+            action: The action type (kill, kick, etc.)
+            results: List of (player, send_command result)
+            reason: The reason for the action
+            duration: Duration in minutes (for temp bans)
+        """
+        latencies = [result['latency'] for _, result in results if result.get('latency') is not None]
+        record = self.journal.append(
+            admin_id=admin.id,
+            admin_name=str(admin),
+            action=action,
+            target=f"{len(results)} players",
+            reason=reason,
+            duration=duration,
+            success=all(result['success'] for _, result in results),
+            latency=max(latencies) if latencies else None,
+            details={
+                'bulk': [
+                    [player, result['success'], result.get('error')]
+                    for player, result in results
+                ]
+            }
         )
         
-        embed.add_field(name="Administrator", value=admin.mention, inline=True)
-        embed.add_field(name="Target Player", value=target, inline=True)
-        embed.add_field(name="Status", value="Success" if success else "Failed", inline=True)
-        
-        if reason:
-            embed.add_field(name="Reason", value=reason, inline=False)
-        
-        if duration:
-            embed.add_field(name="Duration", value=f"{duration} minutes", inline=True)
-        
-        if error:
-            embed.add_field(name="Error", value=f"```{error}```", inline=False)
-        
-        embed.set_footer(text=f"Admin ID: {admin.id}")
-        
-        try:
-            await self.audit_channel.send(embed=embed)
-            logger.info(f"Logged {action} by {admin.name} on {target}")
-        except Exception as e:
-            logger.error(f"Failed to send audit log: {e}")
+        self.audit_queue.put(build_audit_embed(record), record['id'])
+        logger.info(f"Logged bulk {action} by {admin.name} on {len(results)} players")
+    
+    async def replay_audit_journal(self):
+        """Re-queue journal records that never reached the audit channel (e.g. after an outage)"""
+        records = await self.journal.undelivered()
+        replayed = 0
+        for record in records:
+            if not self.audit_queue.is_pending(record['id']):
+                self.audit_queue.put(build_audit_embed(record), record['id'])
+                replayed += 1
+        if replayed:
+            logger.info(f"Replaying {replayed} undelivered audit entries")
     
     def add_recent_player(self, player_name: str):
         """
@@ -308,27 +1348,194 @@ class AdminBot(commands.Bot):
         if not player_name or len(player_name) > 16:
             return
         
-        # Remove if already exists (to move to front)
-        if player_name in self.recent_players:
-            self.recent_players.remove(player_name)
-        
-        # Add to front of list
-        self.recent_players.insert(0, player_name)
-        
-        # Keep only max_recent_players
-        if len(self.recent_players) > self.max_recent_players:
-            self.recent_players = self.recent_players[:self.max_recent_players]
+        # Moves to most recent; evicts the least recent when full
+        self.recent_players.add(player_name)
         
         logger.debug(f"Added {player_name} to recent players cache ({len(self.recent_players)} total)")
     
-    def get_recent_players(self) -> list:
+    def get_recent_players(self, limit: int = 25) -> list:
         """
         Get list of recent players for dropdown
         
+        Args:
+            limit: Maximum number of names, most recent first
+            
         Returns:
             List of recent player names
         """
-        return self.recent_players.copy()
+        return list(self.recent_players.most_recent(limit))
+    
+    def get_player_choices(self, limit: int = 25) -> list:
+        """
+        Get players to offer in dropdowns: online players first, then recent ones
+        
+        Args:
+            limit: Maximum number of names (Discord allows 25 select options)
+            
+        Returns:
+            List of player names with no duplicates
+        """
+        choices = self.roster.get_online_players()[:limit]
+        for player in self.recent_players.most_recent():
+            if len(choices) >= limit:
+                break
+            if player not in self.roster:
+                choices.append(player)
+        return choices
+    
+    async def run_command(self, action: str, command: str) -> Dict[str, Any]:
+        """
+        Run a rendered command on every server the action targets
+        
+        Args:
+            action: The moderation action (selects servers via ACTION_SERVERS)
+            command: The rendered console command
+            
+        Returns:
+            send_command-style result; when several servers are targeted it also
+            has 'servers' (name -> {'success', 'error', 'pending'}) and succeeds unless
+            a server failed - commands still pending after FANOUT_TIMEOUT are not failures
+        """
+        servers = self.config.servers_for(action)
+        if len(servers) == 1:
+            return await self.pterodactyl.send_command(command, next(iter(servers.values())))
+        
+        results = await self.pterodactyl.send_command_many(command, servers, timeout=self.config.fanout_timeout)
+        failed = {
+            name: result for name, result in results.items()
+            if not result['success'] and not result.get('pending')
+        }
+        pending = [name for name, result in results.items() if result.get('pending')]
+        succeeded = len(results) - len(failed) - len(pending)
+        
+        combined = {
+            'success': not failed,
+            'message': f"Executed on {succeeded}/{len(results)} servers"
+            + (f", {len(pending)} still pending" if pending else ""),
+            'latency': max(result.get('latency') or 0 for result in results.values()),
+            'servers': {
+                name: {'success': result['success'], 'error': result.get('error'), 'pending': bool(result.get('pending'))}
+                for name, result in results.items()
+            }
+        }
+        if failed:
+            combined['error'] = "; ".join(
+                f"{name}: {result.get('error', 'Unknown error')}" for name, result in failed.items()
+            )
+        return combined
+    
+    async def submit_action(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        player: Optional[str] = None,
+        reason: Optional[str] = None,
+        duration: Optional[int] = None,
+        confirmed: bool = False
+    ) -> Optional[ActionJob]:
+        """
+        Queue an action on the executor; its worker replies to the moderator and logs it
+        
+        Args:
+            interaction: Discord interaction (already deferred)
+            action: The moderation action (kill, kick, tempban, ban, freeze, unfreeze)
+            player: Target player (None for game-wide actions)
+            reason: The reason for the action
+            duration: Duration in minutes (for temp bans)
+            confirmed: The moderator chose to ban a player who is already banned
+            
+        Returns:
+            The job handle, or None if the action was refused or needs confirming (reply already sent)
+        """
+        # Get command template and format it
+        try:
+            command = self.config.get_command(action, player=player, reason=reason, duration=duration)
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return None
+        
+        # Banning an already-banned player usually means someone got there first
+        existing = self.ban_list.get(player) if player and action in ('ban', 'tempban') and not confirmed else None
+        if existing:
+            await interaction.followup.send(
+                f"⚠️ Already banned: {format_ban_entry(existing)}\n{action.title()} anyway?",
+                view=ConfirmBanView(self, action, player, reason, duration),
+                ephemeral=True
+            )
+            return None
+        
+        async def reply(result: Dict[str, Any]):
+            message = format_action_reply(action, player, reason, duration, result)
+            if result.get('duplicate_of'):
+                message += "\n_Identical request already in progress - this is its result; the command ran once._"
+            await interaction.followup.send(message, ephemeral=True)
+        
+        async def audit(result: Dict[str, Any]):
+            await self.log_action(
+                admin=interaction.user,
+                action=action,
+                target=player or "Game",
+                reason=reason,
+                duration=duration,
+                success=result['success'],
+                error=result.get('error'),
+                latency=result.get('latency'),
+                servers=result.get('servers'),
+                coalesced=result.get('coalesced')
+            )
+            await self.track_ban(action, player, reason, duration, result, interaction.user)
+        
+        try:
+            # The job takes over the interaction's trace and finishes it after the reply.
+            # Double-clicks and two admins sending the same command while it is queued or
+            # running join the first job instead; only that job's audit handler is called.
+            key = (command, tuple(sorted(self.config.servers_for(action).values())))
+            job = self.executor.submit(action, command, reply=reply, audit=audit, key=key, requester=interaction.user)
+        except asyncio.QueueFull:
+            await interaction.followup.send(
+                "❌ Too many actions are queued right now - please try again in a moment.",
+                ephemeral=True
+            )
+            return None
+        
+        # Add player to recent cache
+        if player:
+            self.add_recent_player(player)
+        return job
+    
+    async def execute_bulk(
+        self,
+        action: str,
+        players: List[str],
+        reason: Optional[str] = None,
+        duration: Optional[int] = None
+    ) -> List[Tuple[str, Dict]]:
+        """
+        Run one action against many players with bounded concurrency
+        
+        Args:
+            action: The moderation action (kill, kick, tempban, ban)
+            players: Target player names
+            reason: The reason for the action
+            duration: Duration in minutes (for temp bans)
+            
+        Returns:
+            List of (player, send_command result) in input order
+        """
+        semaphore = asyncio.Semaphore(self.config.bulk_concurrency)
+        
+        async def run(player: str) -> Tuple[str, Dict]:
+            try:
+                command = self.config.get_command(action, player=player, reason=reason, duration=duration)
+            except ValueError as e:
+                return player, {'success': False, 'error': str(e)}
+            async with semaphore:
+                return player, await self.run_command(action, command)
+        
+        for player in players:
+            self.add_recent_player(player)
+        
+        return await asyncio.gather(*(run(player) for player in players))
 
 
 class AdminActionView(discord.ui.View):
@@ -338,6 +1545,13 @@ class AdminActionView(discord.ui.View):
         super().__init__(timeout=None)  # No timeout - persistent view
         self.bot = bot
     
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only admins may use the panel (the pinned copy is visible to the whole channel)"""
+        if self.bot.is_admin(interaction.user):
+            return True
+        await interaction.response.send_message("❌ You don't have permission to use admin commands.", ephemeral=True)
+        return False
+    
     @discord.ui.button(label="Kill", style=discord.ButtonStyle.danger, emoji="🔴", custom_id="admin_action:kill")
     async def kill_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         modal = PlayerActionModal(self.bot, "kill", "Kill Player")
@@ -358,79 +1572,78 @@ class AdminActionView(discord.ui.View):
         modal = PlayerActionModal(self.bot, "ban", "Ban Player", require_reason=True)
         await interaction.response.send_modal(modal)
     
+    @discord.ui.select(
+        placeholder="👥 Bulk action on multiple players...",
+        custom_id="admin_action:bulk",
+        row=2,
+        options=[
+            discord.SelectOption(label=title, value=action, emoji=emoji)
+            for (action, (title, _, _)), emoji in zip(BULK_ACTIONS.items(), ["🔴", "👢", "⏰", "🚫"])
+        ]
+    )
+    async def bulk_select(self, interaction: discord.Interaction, select: discord.ui.Select):
+        action = select.values[0]
+        title, require_reason, require_duration = BULK_ACTIONS[action]
+        modal = PlayerActionModal(
+            self.bot, action, title,
+            require_reason=require_reason,
+            require_duration=require_duration,
+            bulk=True
+        )
+        await interaction.response.send_modal(modal)
+    
     @discord.ui.button(label="Freeze", style=discord.ButtonStyle.primary, emoji="❄️", custom_id="admin_action:freeze")
     async def freeze_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Freeze doesn't require player input
-        await interaction.response.defer(ephemeral=True)
-        
-        command = self.bot.config.get_command("freeze")
-        result = await self.bot.pterodactyl.send_command(command)
-        
-        if result['success']:
-            await interaction.followup.send("✅ Game frozen successfully!", ephemeral=True)
-            await self.bot.log_action(
-                admin=interaction.user,
-                action="freeze",
-                target="Game",
-                success=True
-            )
-        else:
-            await interaction.followup.send(
-                f"❌ Failed to freeze game: {result.get('error', 'Unknown error')}",
-                ephemeral=True
-            )
-            await self.bot.log_action(
-                admin=interaction.user,
-                action="freeze",
-                target="Game",
-                success=False,
-                error=result.get('error')
-            )
+        async with self.bot.tracer.interaction('button:freeze', interaction):
+            if not await self.bot.defer_interaction(interaction):
+                return
+            
+            await self.bot.submit_action(interaction, "freeze")
     
     @discord.ui.button(label="Unfreeze", style=discord.ButtonStyle.success, emoji="✅", custom_id="admin_action:unfreeze")
     async def unfreeze_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Unfreeze doesn't require player input
-        await interaction.response.defer(ephemeral=True)
-        
-        command = self.bot.config.get_command("unfreeze")
-        result = await self.bot.pterodactyl.send_command(command)
-        
-        if result['success']:
-            await interaction.followup.send("✅ Game unfrozen successfully!", ephemeral=True)
-            await self.bot.log_action(
-                admin=interaction.user,
-                action="unfreeze",
-                target="Game",
-                success=True
-            )
-        else:
-            await interaction.followup.send(
-                f"❌ Failed to unfreeze game: {result.get('error', 'Unknown error')}",
-                ephemeral=True
-            )
-            await self.bot.log_action(
-                admin=interaction.user,
-                action="unfreeze",
-                target="Game",
-                success=False,
-                error=result.get('error')
-            )
+        async with self.bot.tracer.interaction('button:unfreeze', interaction):
+            if not await self.bot.defer_interaction(interaction):
+                return
+            
+            await self.bot.submit_action(interaction, "unfreeze")
 
 
 class PlayerActionModal(discord.ui.Modal):
     """Modal for collecting player name and action details"""
     
-    def __init__(self, bot: AdminBot, action: str, title: str, require_reason: bool = False, require_duration: bool = False):
+    def __init__(
+        self,
+        bot: AdminBot,
+        action: str,
+        title: str,
+        require_reason: bool = False,
+        require_duration: bool = False,
+        bulk: bool = False
+    ):
         super().__init__(title=title)
         self.bot = bot
         self.action = action
         self.require_reason = require_reason
         self.require_duration = require_duration
+        self.bulk = bulk
         
-        # Check if we have recent players for dropdown
-        recent_players = self.bot.get_recent_players()
+        # Check if we have online or recent players for dropdown
+        self.use_dropdown = not bulk and bool(self.bot.get_player_choices())
         
-        if recent_players and len(recent_players) > 0:
+        if bulk:
+            # Many players at once - free text, one per line or comma-separated
+            self.player_input = discord.ui.TextInput(
+                label="Player Names",
+                placeholder="One per line or comma-separated",
+                required=True,
+                style=discord.TextStyle.paragraph,
+                max_length=MAX_BULK_PLAYERS * 18
+            )
+            self.add_item(self.player_input)
+        elif self.use_dropdown:
             # Show info that dropdown will appear after modal
             self.info_text = discord.ui.TextInput(
                 label="Player Selection",
@@ -473,11 +1686,14 @@ class PlayerActionModal(discord.ui.Modal):
     
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission"""
-        recent_players = self.bot.get_recent_players()
-        
-        # If we have recent players, show dropdown selection
-        if recent_players and len(recent_players) > 0:
-            await interaction.response.defer(ephemeral=True)
+        async with self.bot.tracer.interaction(f'modal_submit:{self.action}', interaction):
+            await self._handle_submit(interaction)
+    
+    async def _handle_submit(self, interaction: discord.Interaction):
+        # If the modal offered the dropdown, show player selection
+        if self.use_dropdown:
+            if not await self.bot.defer_interaction(interaction):
+                return
             
             # Get reason and duration from modal
             reason = self.reason_input.value.strip() if self.require_reason else None
@@ -501,8 +1717,8 @@ class PlayerActionModal(discord.ui.Modal):
                 color=discord.Color.blue()
             )
             embed.add_field(
-                name="Recent Players",
-                value=f"**{len(recent_players)}** players available",
+                name="Players",
+                value=f"**{len(self.bot.roster)}** online • **{len(view.player_choices)}** available",
                 inline=False
             )
             if reason:
@@ -511,9 +1727,47 @@ class PlayerActionModal(discord.ui.Modal):
                 embed.add_field(name="Duration", value=f"{duration} minutes", inline=True)
             
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+        elif self.bulk:
+            if not await self.bot.defer_interaction(interaction):
+                return
+            
+            players = parse_player_list(self.player_input.value)
+            reason = self.reason_input.value.strip() if self.require_reason else None
+            duration = None
+            
+            invalid = [player for player in players if not is_valid_player_name(player)]
+            if invalid:
+                await interaction.followup.send(
+                    f"❌ Invalid player name(s): {truncate(', '.join(invalid), 1500)}",
+                    ephemeral=True
+                )
+                return
+            if not players:
+                await interaction.followup.send("❌ Enter at least one player name!", ephemeral=True)
+                return
+            if len(players) > MAX_BULK_PLAYERS:
+                await interaction.followup.send(
+                    f"❌ Too many players ({len(players)}) - maximum is {MAX_BULK_PLAYERS} per bulk action",
+                    ephemeral=True
+                )
+                return
+            
+            # Validate duration if required
+            if self.require_duration:
+                try:
+                    duration = int(self.duration_input.value.strip())
+                    if duration <= 0:
+                        await interaction.followup.send("❌ Duration must be a positive number!", ephemeral=True)
+                        return
+                except ValueError:
+                    await interaction.followup.send("❌ Duration must be a valid number!", ephemeral=True)
+                    return
+            
+            await self._execute_bulk(interaction, players, reason, duration)
         else:
             # No cached players - use manual input
-            await interaction.response.defer(ephemeral=True)
+            if not await self.bot.defer_interaction(interaction):
+                return
             
             player = self.player_input.value.strip()
             reason = self.reason_input.value.strip() if self.require_reason else None
@@ -535,51 +1789,41 @@ class PlayerActionModal(discord.ui.Modal):
     
     async def _execute_action(self, interaction: discord.Interaction, player: str, reason: Optional[str], duration: Optional[int]):
         """Execute the moderation action"""
-        # Add player to recent cache
-        self.bot.add_recent_player(player)
-        
-        # Get command template and format it
-        command = self.bot.config.get_command(self.action, player=player, reason=reason, duration=duration)
+        await self.bot.submit_action(interaction, self.action, player, reason, duration)
+    
+    async def _execute_bulk(self, interaction: discord.Interaction, players: List[str], reason: Optional[str], duration: Optional[int]):
+        """Execute the moderation action on every player and reply once"""
+        # Checked before running: the results update the ban list
+        already_banned = [player for player in players if player in self.bot.ban_list] if self.action in ('ban', 'tempban') else []
+        results = await self.bot.execute_bulk(self.action, players, reason=reason, duration=duration)
         
-        # Send command via Pterodactyl
-        result = await self.bot.pterodactyl.send_command(command)
+        succeeded = [player for player, result in results if result['success']]
+        failed = [(player, result) for player, result in results if not result['success']]
         
-        if result['success']:
-            # Success message
-            success_msg = f"✅ Successfully executed {self.action} on **{player}**"
-            if reason:
-                success_msg += f"\nReason: {reason}"
-            if duration:
-                success_msg += f"\nDuration: {duration} minutes"
-            
-            await interaction.followup.send(success_msg, ephemeral=True)
-            
-            # Log to audit channel
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=reason,
-                duration=duration,
-                success=True
-            )
-        else:
-            # Failure message
-            error_msg = f"❌ Failed to execute {self.action} on **{player}**\n"
-            error_msg += f"Error: {result.get('error', 'Unknown error')}"
-            
-            await interaction.followup.send(error_msg, ephemeral=True)
-            
-            # Log failure to audit channel
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=reason,
-                duration=duration,
-                success=False,
-                error=result.get('error')
+        summary = f"{'✅' if not failed else '⚠️'} Bulk {self.action}: **{len(succeeded)}/{len(results)}** succeeded"
+        if reason:
+            summary += f"\nReason: {reason}"
+        if duration:
+            summary += f"\nDuration: {duration} minutes"
+        if already_banned:
+            summary += f"\nAlready banned before this: {', '.join(already_banned)}"
+        if failed:
+            summary += "\n\n**Failed:**\n" + "\n".join(
+                f"• {player}: {result.get('error', 'Unknown error')}" for player, result in failed
             )
+        
+        await interaction.followup.send(truncate(summary, 2000), ephemeral=True)
+        
+        # One audit summary for the whole batch
+        await self.bot.log_bulk_action(
+            admin=interaction.user,
+            action=self.action,
+            results=results,
+            reason=reason,
+            duration=duration
+        )
+        for player, result in results:
+            await self.bot.track_ban(self.action, player, reason, duration, result, interaction.user)
     
     async def on_error(self, interaction: discord.Interaction, error: Exception):
         """Handle modal errors"""
@@ -596,6 +1840,62 @@ class PlayerActionModal(discord.ui.Modal):
             )
 
 
+class ConfirmBanView(discord.ui.View):
+    """Asks whether to go ahead with banning a player who is already banned"""
+    
+    def __init__(self, bot: AdminBot, action: str, player: str, reason: Optional[str], duration: Optional[int]):
+        super().__init__(timeout=120)
+        self.bot = bot
+        self.action = action
+        self.player = player
+        self.reason = reason
+        self.duration = duration
+    
+    @discord.ui.button(label="Ban anyway", style=discord.ButtonStyle.danger)
+    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        async with self.bot.tracer.interaction(f'confirm_ban:{self.action}', interaction):
+            self.stop()
+            with tracing.span('defer'):
+                await interaction.response.edit_message(content=f"⏳ {self.action.title()} on **{self.player}**...", view=None)
+            await self.bot.submit_action(interaction, self.action, self.player, self.reason, self.duration, confirmed=True)
+    
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.edit_message(content=f"Cancelled - **{self.player}** was not banned again.", view=None)
+
+
+class BanListView(discord.ui.View):
+    """Previous/next pages for /admin banlist, over a snapshot of the ban list"""
+    
+    def __init__(self, bot: AdminBot, entries: List[Dict[str, Any]], query: Optional[str]):
+        super().__init__(timeout=300)
+        self.bot = bot
+        self.entries = entries
+        self.query = query
+        self.page = 0
+        self.pages = max(1, -(-len(entries) // BANLIST_PAGE_SIZE))
+        self._update_buttons()
+    
+    def _update_buttons(self):
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.pages - 1
+    
+    async def _show(self, interaction: discord.Interaction, page: int):
+        self.page = min(max(page, 0), self.pages - 1)
+        self._update_buttons()
+        embed = build_banlist_embed(self.entries, self.page, self.query, self.bot.ban_list.loaded)
+        await interaction.response.edit_message(embed=embed, view=self)
+    
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page - 1)
+    
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page + 1)
+
+
 class PlayerSelectionView(discord.ui.View):
     """View for selecting a player from dropdown"""
     
@@ -606,8 +1906,10 @@ class PlayerSelectionView(discord.ui.View):
         self.reason = reason
         self.duration = duration
         
-        # Add player dropdown
-        self.add_item(PlayerDropdown(bot, action, reason, duration))
+        # Add player dropdown (snapshot taken once, shared with the embed)
+        self.player_choices = bot.get_player_choices()
+        if self.player_choices:
+            self.add_item(PlayerDropdown(bot, action, reason, duration, self.player_choices))
         
         # Add manual input button
         manual_button = discord.ui.Button(
@@ -627,23 +1929,31 @@ class PlayerSelectionView(discord.ui.View):
 class PlayerDropdown(discord.ui.Select):
     """Dropdown for selecting a player"""
     
-    def __init__(self, bot: AdminBot, action: str, reason: Optional[str], duration: Optional[int]):
+    def __init__(
+        self,
+        bot: AdminBot,
+        action: str,
+        reason: Optional[str],
+        duration: Optional[int],
+        player_choices: Optional[list] = None
+    ):
         self.bot = bot
         self.action = action
         self.reason = reason
         self.duration = duration
         
-        # Get recent players
-        recent_players = bot.get_recent_players()
+        # Online players first, then recent players (read from memory, no panel call)
+        if player_choices is None:
+            player_choices = bot.get_player_choices()
         
         # Create options (max 25 for Discord)
         options = [
             discord.SelectOption(
                 label=player,
                 value=player,
-                emoji="👤"
+                emoji="🟢" if player in bot.roster else "👤"
             )
-            for player in recent_players[:25]
+            for player in player_choices[:25]
         ]
         
         super().__init__(
@@ -655,52 +1965,12 @@ class PlayerDropdown(discord.ui.Select):
     
     async def callback(self, interaction: discord.Interaction):
         """Handle player selection"""
-        await interaction.response.defer(ephemeral=True)
-        
-        player = self.values[0]
-        
-        # Get command template and format it
-        command = self.bot.config.get_command(self.action, player=player, reason=self.reason, duration=self.duration)
-        
-        # Send command via Pterodactyl
-        result = await self.bot.pterodactyl.send_command(command)
-        
-        if result['success']:
-            # Success message
-            success_msg = f"✅ Successfully executed {self.action} on **{player}**"
-            if self.reason:
-                success_msg += f"\nReason: {self.reason}"
-            if self.duration:
-                success_msg += f"\nDuration: {self.duration} minutes"
-            
-            await interaction.followup.send(success_msg, ephemeral=True)
-            
-            # Log to audit channel
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=self.reason,
-                duration=self.duration,
-                success=True
-            )
-        else:
-            # Failure message
-            error_msg = f"❌ Failed to execute {self.action} on **{player}**\n"
-            error_msg += f"Error: {result.get('error', 'Unknown error')}"
-            
-            await interaction.followup.send(error_msg, ephemeral=True)
+        async with self.bot.tracer.interaction(f'player_select:{self.action}', interaction):
+            if not await self.bot.defer_interaction(interaction):
+                return
             
-            # Log failure to audit channel
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=self.reason,
-                duration=self.duration,
-                success=False,
-                error=result.get('error')
-            )
+            player = self.values[0]
+            await self.bot.submit_action(interaction, self.action, player, self.reason, self.duration)
 
 
 class ManualPlayerInputModal(discord.ui.Modal):
@@ -723,49 +1993,9 @@ class ManualPlayerInputModal(discord.ui.Modal):
     
     async def on_submit(self, interaction: discord.Interaction):
         """Handle manual input submission"""
-        await interaction.response.defer(ephemeral=True)
-        
-        player = self.player_input.value.strip()
-        
-        # Add to recent players cache
-        self.bot.add_recent_player(player)
-        
-        # Get command template and format it
-        command = self.bot.config.get_command(self.action, player=player, reason=self.reason, duration=self.duration)
-        
-        # Send command via Pterodactyl
-        result = await self.bot.pterodactyl.send_command(command)
-        
-        if result['success']:
-            success_msg = f"✅ Successfully executed {self.action} on **{player}**"
-            if self.reason:
-                success_msg += f"\nReason: {self.reason}"
-            if self.duration:
-                success_msg += f"\nDuration: {self.duration} minutes"
-            
-            await interaction.followup.send(success_msg, ephemeral=True)
-            
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=self.reason,
-                duration=self.duration,
-                success=True
-            )
-        else:
-            error_msg = f"❌ Failed to execute {self.action} on **{player}**\n"
-            error_msg += f"Error: {result.get('error', 'Unknown error')}"
-            
-            await interaction.followup.send(error_msg, ephemeral=True)
+        async with self.bot.tracer.interaction(f'manual_submit:{self.action}', interaction):
+            if not await self.bot.defer_interaction(interaction):
+                return
             
-            await self.bot.log_action(
-                admin=interaction.user,
-                action=self.action,
-                target=player,
-                reason=self.reason,
-                duration=self.duration,
-                success=False,
-                error=result.get('error')
-            )
-
+            player = self.player_input.value.strip()
+            await self.bot.submit_action(interaction, self.action, player, self.reason, self.duration)
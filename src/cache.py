@@ -0,0 +1,148 @@
+"""
+Caching helpers for Admin Action Bot
+TTL cache with single-flight loading and stale-while-revalidate
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger('Cache')
+
+
+class TTLCache:
+    """Async cache where concurrent misses share one load and stale values are served during refresh"""
+    
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ):
+        """
+        Initialize the cache
+        
+        Args:
+            ttl: Seconds a value is fresh
+            stale_ttl: Further seconds a value may be served while a refresh runs
+            should_cache: Predicate deciding whether a loaded value is stored (default: always)
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.should_cache = should_cache or (lambda value: True)
+        
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+        
+        Returns:
+            Dict with hits, stale_hits, misses, coalesced and hit_rate
+        """
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'hit_rate': (self.hits + self.stale_hits + self.coalesced) / lookups if lookups else 0.0
+        }
+    
+    def invalidate(self, key: Hashable):
+        """Drop a cached value so the next lookup loads it again"""
+        self._entries.pop(key, None)
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value loaded outside the cache (subject to should_cache), without counting"""
+        if self.should_cache(value):
+            self._entries[key] = (value, time.monotonic())
+    
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Get the cached value, however old, without loading or counting"""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+    
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]], fresh: bool = False) -> Any:
+        """
+        Get a value, loading it at most once at a time per key
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            fresh: Skip the cache and any load in flight; the result is still stored
+        
+        Returns:
+            The cached or freshly loaded value
+        """
+        if fresh:
+            self.misses += 1
+            return await self._store(key, loader)
+        
+        entry = self._entries.get(key)
+        if entry:
+            value, loaded_at = entry
+            age = time.monotonic() - loaded_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if age < self.ttl + self.stale_ttl:
+                # Serve the stale value now and refresh in the background
+                self.stale_hits += 1
+                self._load(key, loader)
+                return value
+        
+        if key in self._inflight:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        return await asyncio.shield(self._load(key, loader))
+    
+    async def refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Load a value for background polling, without counting it as a lookup
+        
+        Joins a load already in flight for the key instead of starting a second one.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+        
+        Returns:
+            The freshly loaded value
+        """
+        return await asyncio.shield(self._load(key, loader))
+    
+    def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start a load for the key, or return the one already running"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_loader(key, loader))
+            task.add_done_callback(_log_load_failure)
+            self._inflight[key] = task
+        return task
+    
+    async def _store(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        if self.should_cache(value):
+            self._entries[key] = (value, time.monotonic())
+        return value
+    
+    async def _run_loader(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await self._store(key, loader)
+        finally:
+            self._inflight.pop(key, None)
+
+
+def _log_load_failure(task: asyncio.Task):
+    """Log loader errors so background refreshes never fail silently"""
+    if not task.cancelled() and task.exception():
+        logger.error(f"Cache load failed: {task.exception()}")
@@ -4,9 +4,11 @@ Loads and validates environment variables and configuration
 """
 
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+from .templates import TEMPLATE_FIELDS, CommandTemplate
+
 
 class Config:
     """Configuration loader and validator"""
@@ -26,6 +28,88 @@ class Config:
         self.pterodactyl_key: str = self._get_required("PTERODACTYL_API_KEY")
         self.server_id: str = self._get_required("PTERODACTYL_SERVER_ID")
         
+        # Multi-server network (optional): named servers, groups, and where each action runs
+        self.servers: Dict[str, str] = self._parse_servers(os.getenv("PTERODACTYL_SERVERS", ""))
+        self.server_groups: Dict[str, List[str]] = self._parse_groups(os.getenv("PTERODACTYL_SERVER_GROUPS", ""))
+        self.action_servers: Dict[str, str] = self._parse_pairs(os.getenv("ACTION_SERVERS", ""))
+        self.fanout_timeout: float = float(os.getenv("FANOUT_TIMEOUT", "10"))
+        
+        # Pterodactyl HTTP connection pool
+        self.pterodactyl_connection_limit: int = int(os.getenv("PTERODACTYL_CONNECTION_LIMIT", "10"))
+        self.pterodactyl_dns_cache_ttl: int = int(os.getenv("PTERODACTYL_DNS_CACHE_TTL", "300"))
+        self.pterodactyl_keepalive_timeout: float = float(os.getenv("PTERODACTYL_KEEPALIVE_TIMEOUT", "60"))
+        
+        # Pterodactyl client-side rate limit (token bucket) and 429 handling
+        self.pterodactyl_rate_limit: float = float(os.getenv("PTERODACTYL_RATE_LIMIT", "10"))
+        self.pterodactyl_rate_burst: int = int(os.getenv("PTERODACTYL_RATE_BURST", "20"))
+        self.pterodactyl_max_rate_limit_retries: int = int(os.getenv("PTERODACTYL_MAX_RATE_LIMIT_RETRIES", "3"))
+        
+        # Pterodactyl retry/backoff and circuit breaker
+        self.pterodactyl_max_retries: int = int(os.getenv("PTERODACTYL_MAX_RETRIES", "2"))
+        self.pterodactyl_retry_base_delay: float = float(os.getenv("PTERODACTYL_RETRY_BASE_DELAY", "0.5"))
+        self.pterodactyl_circuit_failure_threshold: int = int(os.getenv("PTERODACTYL_CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.pterodactyl_circuit_reset_timeout: float = float(os.getenv("PTERODACTYL_CIRCUIT_RESET_TIMEOUT", "30"))
+        
+        # Server status cache (seconds fresh, then seconds served stale while refreshing)
+        self.status_cache_ttl: float = float(os.getenv("STATUS_CACHE_TTL", "5"))
+        self.status_cache_stale: float = float(os.getenv("STATUS_CACHE_STALE", "30"))
+        
+        # Console websocket stream
+        self.console_stream_enabled: bool = os.getenv("CONSOLE_STREAM_ENABLED", "true").lower() == "true"
+        
+        # Action executor: worker tasks, and how many actions may wait for one
+        self.action_workers: int = int(os.getenv("ACTION_WORKERS", "4"))
+        self.action_queue_size: int = int(os.getenv("ACTION_QUEUE_SIZE", "100"))
+        
+        # Interaction tracing: log every trace as JSON, and the threshold (ms) for slow-interaction warnings (0 = off)
+        self.trace_log_enabled: bool = os.getenv("TRACE_LOG_ENABLED", "false").lower() == "true"
+        self.slow_interaction_threshold: float = float(os.getenv("SLOW_INTERACTION_MS", "2000")) / 1000
+        
+        # Local Prometheus metrics endpoint (GET /metrics); keep it bound to localhost unless scraped remotely
+        self.metrics_enabled: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+        self.metrics_host: str = os.getenv("METRICS_HOST", "127.0.0.1")
+        self.metrics_port: int = int(os.getenv("METRICS_PORT", "9108"))
+        
+        # Bulk moderation: maximum commands in flight at once
+        self.bulk_concurrency: int = int(os.getenv("BULK_CONCURRENCY", "5"))
+        
+        # Audit channel batching: embeds per message (max 10) and flush delay in seconds
+        self.audit_batch_size: int = int(os.getenv("AUDIT_BATCH_SIZE", "10"))
+        self.audit_flush_interval: float = float(os.getenv("AUDIT_FLUSH_INTERVAL", "2"))
+        
+        # Recent players cache (LRU, snapshotted to disk)
+        self.recent_players_capacity: int = int(os.getenv("RECENT_PLAYERS_CAPACITY", "500"))
+        self.recent_players_path: str = os.getenv("RECENT_PLAYERS_PATH", "data/recent_players.json")
+        
+        # Durable local audit journal (SQLite, WAL mode)
+        self.audit_journal_path: str = os.getenv("AUDIT_JOURNAL_PATH", "data/audit.db")
+        
+        # Persistent bot state (pinned panel message ID etc.)
+        self.state_path: str = os.getenv("STATE_PATH", "data/state.json")
+        
+        # Deadline in seconds for each network-bound startup step (command sync, panel, health check)
+        self.startup_step_timeout: float = float(os.getenv("STARTUP_STEP_TIMEOUT", "15"))
+        
+        # Keep a pinned, always-available admin panel in the bot channel
+        self.pinned_panel_enabled: bool = os.getenv("PINNED_PANEL_ENABLED", "true").lower() == "true"
+        
+        # Timed actions (scheduled freezes, announcements, tempban expiry), kept across restarts
+        self.scheduler_path: str = os.getenv("SCHEDULER_PATH", "data/scheduler.db")
+        self.scheduler_concurrency: int = int(os.getenv("SCHEDULER_CONCURRENCY", "5"))
+        self.tempban_auto_unban: bool = os.getenv("TEMPBAN_AUTO_UNBAN", "true").lower() == "true"
+        
+        # Local index of the server's ban list, read through the panel's files API
+        self.banlist_enabled: bool = os.getenv("BANLIST_ENABLED", "true").lower() == "true"
+        self.banlist_path: str = os.getenv("BANLIST_PATH", "/banned-players.json")
+        self.banlist_refresh_interval: float = float(os.getenv("BANLIST_REFRESH_INTERVAL", "300"))
+        
+        # Background resource sampling for /admin status; polls slow down while the server is idle
+        self.telemetry_enabled: bool = os.getenv("TELEMETRY_ENABLED", "true").lower() == "true"
+        self.telemetry_interval: float = float(os.getenv("TELEMETRY_INTERVAL", "15"))
+        self.telemetry_idle_interval: float = float(os.getenv("TELEMETRY_IDLE_INTERVAL", "120"))
+        self.telemetry_idle_cpu: float = float(os.getenv("TELEMETRY_IDLE_CPU", "5"))
+        self.telemetry_history: int = int(os.getenv("TELEMETRY_HISTORY", "480"))
+        
         # Bot Configuration
         self.admin_role_id: Optional[int] = self._get_optional_int("ADMIN_ROLE_ID")
         self.command_prefix: str = os.getenv("COMMAND_PREFIX", "!")
@@ -37,12 +121,43 @@ class Config:
         self.cmd_ban = os.getenv('CMD_BAN', 'ban {player} {reason}')
         self.cmd_freeze = os.getenv('CMD_FREEZE', 'tick freeze')
         self.cmd_unfreeze = os.getenv('CMD_UNFREEZE', 'tick unfreeze')
+        self.cmd_unban = os.getenv('CMD_UNBAN', 'pardon {player}')
+        self.cmd_announce = os.getenv('CMD_ANNOUNCE', 'say {reason}')
         
         # Commands that require player parameter
-        self.player_required_commands = ['kill', 'kick', 'tempban', 'ban']
+        self.player_required_commands = ['kill', 'kick', 'tempban', 'ban', 'unban']
         
         # Commands that are global (don't need player parameter)
         self.global_commands = ['freeze', 'unfreeze']
+        
+        # Commands that take a message (in {reason}) instead of a player
+        self.message_commands = ['announce']
+        
+        # Raw templates, and the compiled templates rendered for each action
+        self.commands: Dict[str, str] = {
+            'kill': self.cmd_kill,
+            'kick': self.cmd_kick,
+            'tempban': self.cmd_tempban,
+            'ban': self.cmd_ban,
+            'freeze': self.cmd_freeze,
+            'unfreeze': self.cmd_unfreeze,
+            'unban': self.cmd_unban,
+            'announce': self.cmd_announce
+        }
+        self.command_templates: Dict[str, CommandTemplate] = {}
+        self._template_errors: List[str] = []
+        for action, source in self.commands.items():
+            # Global commands have no player to act on, so they take no placeholders
+            if action in self.player_required_commands:
+                allowed = TEMPLATE_FIELDS
+            elif action in self.message_commands:
+                allowed = frozenset({'reason'})
+            else:
+                allowed = frozenset()
+            try:
+                self.command_templates[action] = CommandTemplate(action, source, allowed)
+            except ValueError as e:
+                self._template_errors.append(str(e))
     
     def _get_required(self, key: str) -> str:
         """Get required environment variable or raise error"""
@@ -56,17 +171,53 @@ class Config:
         value = os.getenv(key)
         return int(value) if value else None
     
+    def _parse_pairs(self, value: str) -> Dict[str, str]:
+        """Parse 'key:value,key:value' into a dict"""
+        pairs = {}
+        for item in value.split(','):
+            if item.strip():
+                key, _, val = item.partition(':')
+                pairs[key.strip()] = val.strip()
+        return pairs
+    
+    def _parse_servers(self, value: str) -> Dict[str, str]:
+        """Parse PTERODACTYL_SERVERS ('name:id,...'), always including the primary server"""
+        servers = self._parse_pairs(value)
+        # A listed server already called 'main' is left alone; validate() reports the clash
+        if self.server_id not in servers.values() and 'main' not in servers:
+            servers = {'main': self.server_id, **servers}
+        return servers
+    
+    def _parse_groups(self, value: str) -> Dict[str, List[str]]:
+        """Parse PTERODACTYL_SERVER_GROUPS ('group:name,name;group:name'), plus the implicit 'all' group"""
+        groups = {'all': list(self.servers)}
+        for item in value.split(';'):
+            if item.strip():
+                name, _, members = item.partition(':')
+                groups[name.strip()] = [member.strip() for member in members.split(',') if member.strip()]
+        return groups
+    
     @property
-    def commands(self) -> Dict[str, str]:
-        """Get all command templates as a dictionary"""
-        return {
-            'kill': self.cmd_kill,
-            'kick': self.cmd_kick,
-            'tempban': self.cmd_tempban,
-            'ban': self.cmd_ban,
-            'freeze': self.cmd_freeze,
-            'unfreeze': self.cmd_unfreeze
-        }
+    def primary_server(self) -> str:
+        """Name of the server given by PTERODACTYL_SERVER_ID"""
+        return next(name for name, server_id in self.servers.items() if server_id == self.server_id)
+    
+    def servers_for(self, action: str) -> Dict[str, str]:
+        """
+        Get the servers an action should run on
+        
+        Args:
+            action: The moderation action (kill, kick, tempban, etc.)
+        
+        Returns:
+            Server name -> server ID (the primary server unless ACTION_SERVERS says otherwise)
+        """
+        target = self.action_servers.get(action)
+        if target in self.server_groups:
+            return {name: self.servers[name] for name in self.server_groups[target]}
+        if target in self.servers:
+            return {target: self.servers[target]}
+        return {self.primary_server: self.server_id}
     
     def validate(self) -> bool:
         """Validate configuration values"""
@@ -80,17 +231,93 @@ class Config:
         if not self.pterodactyl_url.startswith(('http://', 'https://')):
             errors.append("PTERODACTYL_API_URL must start with http:// or https://")
         
-        # Validate command templates based on command type
-        for cmd_name, cmd_template in self.commands.items():
-            # Commands that target specific players must have {player} placeholder
-            if cmd_name in self.player_required_commands:
-                if "{player}" not in cmd_template:
-                    errors.append(
-                        f"Command template for '{cmd_name}' must include {{player}} placeholder. "
-                        f"Current: '{cmd_template}'"
-                    )
-            # Global commands (freeze/unfreeze) don't need {player}
-            # No validation needed for global commands
+        if self.pterodactyl_connection_limit < 1:
+            errors.append("PTERODACTYL_CONNECTION_LIMIT must be at least 1")
+        
+        if self.pterodactyl_rate_limit <= 0:
+            errors.append("PTERODACTYL_RATE_LIMIT must be greater than 0")
+        
+        if self.pterodactyl_rate_burst < 1:
+            errors.append("PTERODACTYL_RATE_BURST must be at least 1")
+        
+        if self.pterodactyl_max_retries < 0:
+            errors.append("PTERODACTYL_MAX_RETRIES cannot be negative")
+        
+        if self.pterodactyl_circuit_failure_threshold < 1:
+            errors.append("PTERODACTYL_CIRCUIT_FAILURE_THRESHOLD must be at least 1")
+        
+        if not 1 <= self.audit_batch_size <= 10:
+            errors.append("AUDIT_BATCH_SIZE must be between 1 and 10")
+        
+        if self.server_id not in self.servers.values():
+            errors.append(
+                f"PTERODACTYL_SERVERS names a server 'main' ({self.servers['main']}) that is not "
+                f"PTERODACTYL_SERVER_ID ({self.server_id}) - rename it, or list the primary server under a name"
+            )
+        
+        for group, members in self.server_groups.items():
+            for member in members:
+                if member not in self.servers:
+                    errors.append(f"Server group '{group}' references unknown server '{member}'")
+        
+        for action, target in self.action_servers.items():
+            if action not in self.commands:
+                errors.append(f"ACTION_SERVERS references unknown action '{action}'")
+            if target not in self.servers and target not in self.server_groups:
+                errors.append(f"ACTION_SERVERS target '{target}' for '{action}' is not a server or group")
+        
+        if self.recent_players_capacity < 1:
+            errors.append("RECENT_PLAYERS_CAPACITY must be at least 1")
+        
+        if self.bulk_concurrency < 1:
+            errors.append("BULK_CONCURRENCY must be at least 1")
+        
+        if self.slow_interaction_threshold < 0:
+            errors.append("SLOW_INTERACTION_MS cannot be negative")
+        
+        if not 1 <= self.metrics_port <= 65535:
+            errors.append("METRICS_PORT must be between 1 and 65535")
+        
+        if self.action_workers < 1:
+            errors.append("ACTION_WORKERS must be at least 1")
+        
+        if self.action_queue_size < 1:
+            errors.append("ACTION_QUEUE_SIZE must be at least 1")
+        
+        if self.startup_step_timeout <= 0:
+            errors.append("STARTUP_STEP_TIMEOUT must be greater than 0")
+        
+        if self.scheduler_concurrency < 1:
+            errors.append("SCHEDULER_CONCURRENCY must be at least 1")
+        
+        if self.banlist_refresh_interval <= 0:
+            errors.append("BANLIST_REFRESH_INTERVAL must be greater than 0")
+        
+        if self.telemetry_interval <= 0:
+            errors.append("TELEMETRY_INTERVAL must be greater than 0")
+        
+        if self.telemetry_idle_interval < self.telemetry_interval:
+            errors.append("TELEMETRY_IDLE_INTERVAL cannot be less than TELEMETRY_INTERVAL")
+        
+        if self.telemetry_history < 2:
+            errors.append("TELEMETRY_HISTORY must be at least 2")
+        
+        # Validate command templates: parse errors and unknown placeholders were found at load
+        errors.extend(self._template_errors)
+        
+        # Commands that target specific players must have {player} placeholder
+        for cmd_name, template in self.command_templates.items():
+            if cmd_name in self.player_required_commands and 'player' not in template.fields:
+                errors.append(
+                    f"Command template for '{cmd_name}' must include {{player}} placeholder. "
+                    f"Current: '{template.source}'"
+                )
+            # Only tempban is given a duration; any other action would be refused at render time
+            if cmd_name != 'tempban' and 'duration' in template.fields:
+                errors.append(
+                    f"Command template for '{cmd_name}' may not use {{duration}} (only tempban has one). "
+                    f"Current: '{template.source}'"
+                )
         
         if errors:
             print("Configuration validation errors:")
@@ -106,16 +333,20 @@ class Config:
         
         Args:
             action: The moderation action (kill, kick, tempban, etc.)
-            **kwargs: Parameters to format into the command template
+            **kwargs: player, reason and duration for the command template
         
         Returns:
             Formatted command string
+        
+        Raises:
+            ValueError: For an unknown action, a player name that is unsafe in a console command,
+                or a missing duration for a template that uses {duration}
         """
-        template = self.commands.get(action)
+        template = self.command_templates.get(action)
         if not template:
             raise ValueError(f"Unknown action: {action}")
         
-        return template.format(**kwargs)
+        return template.render(**kwargs)
 
 
 # Global config instance (initialized when imported)
@@ -0,0 +1,256 @@
+"""
+Pterodactyl console stream for Admin Action Bot
+Holds one long-lived websocket to the server console and fans lines out to subscribers
+"""
+
+import asyncio
+import json
+import logging
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Set
+
+import aiohttp
+
+from .pterodactyl import PterodactylClient
+
+logger = logging.getLogger('Console')
+
+
+class ConsoleStream:
+    """Long-lived console websocket shared by every part of the bot"""
+    
+    def __init__(
+        self,
+        client: PterodactylClient,
+        queue_size: int = 1000,
+        reconnect_min: float = 1.0,
+        reconnect_max: float = 60.0
+    ):
+        """
+        Initialize the console stream
+        
+        Args:
+            client: Pterodactyl client used to fetch websocket credentials
+            queue_size: Maximum buffered lines per subscriber before dropping oldest
+            reconnect_min: Initial reconnect delay in seconds
+            reconnect_max: Maximum reconnect delay in seconds
+        """
+        self.client = client
+        self.queue_size = queue_size
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._connect_listeners: List[Callable[[], Awaitable[None]]] = []
+        self._status_listeners: List[Callable[[str], Awaitable[None]]] = []
+        self._task: Optional[asyncio.Task] = None
+        # Listener runs in flight, referenced until they finish so they can't be collected
+        self._listener_tasks: Set[asyncio.Task] = set()
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._connected = asyncio.Event()
+        self.server_state: Optional[str] = None
+    
+    @property
+    def connected(self) -> bool:
+        """Whether the websocket is currently authenticated"""
+        return self._connected.is_set()
+    
+    def start(self):
+        """Start the background connection task"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="console-stream")
+        logger.info("Console stream started")
+    
+    async def stop(self):
+        """Stop the background task and close the websocket"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._listener_tasks):
+            task.cancel()
+        await asyncio.gather(*self._listener_tasks, return_exceptions=True)
+        if self._ws and not self._ws.closed:
+            await self._ws.close()
+        self._connected.clear()
+        logger.info("Console stream stopped")
+    
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the websocket is authenticated
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+        
+        Returns:
+            True if connected, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def add_connect_listener(self, callback: Callable[[], Awaitable[None]]):
+        """
+        Register a coroutine to run after every successful (re)connect
+        
+        Args:
+            callback: Coroutine function taking no arguments
+        """
+        self._connect_listeners.append(callback)
+    
+    def add_status_listener(self, callback: Callable[[str], Awaitable[None]]):
+        """
+        Register a coroutine to run whenever the server's power state changes
+        
+        Args:
+            callback: Coroutine function taking the new state (running, starting, stopping, offline)
+        """
+        self._status_listeners.append(callback)
+    
+    def _spawn_listeners(self, coro: Awaitable[None]):
+        """Run listeners without blocking the read loop, keeping a reference to the task"""
+        task = asyncio.create_task(coro)
+        self._listener_tasks.add(task)
+        task.add_done_callback(self._listener_tasks.discard)
+    
+    async def _notify_connected(self):
+        """Run connect listeners, isolating failures"""
+        for callback in self._connect_listeners:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("Console connect listener failed")
+    
+    async def _notify_status(self, state: str):
+        """Run status listeners, isolating failures"""
+        for callback in self._status_listeners:
+            try:
+                await callback(state)
+            except Exception:
+                logger.exception("Console status listener failed")
+    
+    async def send_command(self, command: str) -> bool:
+        """
+        Send a command over the open websocket instead of the REST API
+        
+        Args:
+            command: The command to execute (without leading /)
+        
+        Returns:
+            True if the command was written to the socket
+        """
+        if not self.connected or not self._ws or self._ws.closed:
+            return False
+        await self._ws.send_json({'event': 'send command', 'args': [command]})
+        return True
+    
+    @asynccontextmanager
+    async def _subscription(self) -> AsyncIterator[asyncio.Queue]:
+        """Register a subscriber queue for the lifetime of the context"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+    
+    async def lines(self) -> AsyncIterator[str]:
+        """
+        Subscribe to console output
+        
+        Yields:
+            Console lines as they arrive, for as long as the caller iterates
+        """
+        async with self._subscription() as queue:
+            while True:
+                yield await queue.get()
+    
+    def _publish(self, line: str):
+        """Deliver a console line to every subscriber without blocking"""
+        for queue in self._subscribers:
+            if queue.full():
+                # Slow subscriber - drop its oldest line rather than stall the socket
+                queue.get_nowait()
+            queue.put_nowait(line)
+    
+    async def _authenticate(self, ws: aiohttp.ClientWebSocketResponse):
+        """Fetch a fresh token and send it over the socket"""
+        credentials = await self.client.get_websocket_credentials()
+        if not credentials.get('success'):
+            raise ConnectionError(credentials.get('error', 'Could not fetch websocket token'))
+        await ws.send_json({'event': 'auth', 'args': [credentials['token']]})
+    
+    async def _run(self):
+        """Connect, authenticate and read until cancelled, reconnecting on failure"""
+        delay = self.reconnect_min
+        
+        while True:
+            try:
+                credentials = await self.client.get_websocket_credentials()
+                if not credentials.get('success'):
+                    raise ConnectionError(credentials.get('error', 'Could not fetch websocket token'))
+                
+                async with await self.client.ws_connect(credentials['socket']) as ws:
+                    self._ws = ws
+                    await ws.send_json({'event': 'auth', 'args': [credentials['token']]})
+                    await self._read(ws)
+                    delay = self.reconnect_min
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Console stream disconnected: {e}")
+            finally:
+                self._connected.clear()
+                self._ws = None
+            
+            # Jittered exponential backoff before reconnecting
+            sleep_for = delay * (0.5 + random.random() / 2)
+            logger.info(f"Reconnecting console stream in {sleep_for:.1f}s")
+            await asyncio.sleep(sleep_for)
+            delay = min(delay * 2, self.reconnect_max)
+    
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse):
+        """Handle incoming websocket events until the socket closes"""
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+                continue
+            
+            try:
+                payload = json.loads(msg.data)
+            except ValueError:
+                continue
+            
+            event = payload.get('event')
+            args = payload.get('args') or []
+            
+            if event == 'console output':
+                for line in args:
+                    self._publish(line)
+            elif event == 'auth success':
+                # Also sent after a token refresh - only announce new connections
+                if not self._connected.is_set():
+                    self._connected.set()
+                    logger.info("✅ Console stream authenticated")
+                    self._spawn_listeners(self._notify_connected())
+            elif event == 'status':
+                state = args[0] if args else None
+                # The first status after starting is not a change; connect listeners cover it
+                if state and self.server_state is not None and state != self.server_state:
+                    self._spawn_listeners(self._notify_status(state))
+                self.server_state = state
+            elif event == 'token expiring':
+                # Refresh in place so the socket stays open
+                await self._authenticate(ws)
+            elif event in ('token expired', 'jwt error'):
+                logger.warning(f"Console stream token rejected ({event}) - reconnecting")
+                break
@@ -0,0 +1,310 @@
+"""
+Action executor for Admin Action Bot
+Queue of moderation jobs served by worker tasks, with per-stage timings and
+single-flight coalescing of identical commands
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from . import tracing
+from .metrics import ACTION_STAGE_SECONDS
+
+logger = logging.getLogger('Executor')
+
+# Called with the panel result once the command has run
+ResultHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+_job_ids = itertools.count(1)
+
+
+class ActionJob:
+    """Handle for a queued action - wait() returns the panel result"""
+    
+    def __init__(
+        self,
+        action: str,
+        command: str,
+        reply: Optional[ResultHandler] = None,
+        audit: Optional[ResultHandler] = None,
+        key: Optional[Hashable] = None
+    ):
+        """
+        Create a job
+        
+        Args:
+            action: The moderation action (kill, kick, freeze, etc.)
+            command: Rendered console command
+            reply: Sends the moderator's followup for a result
+            audit: Records a result in the audit log
+            key: Identity of the command for coalescing duplicates (None never coalesces)
+        """
+        self.id = next(_job_ids)
+        self.action = action
+        self.command = command
+        self.reply = reply
+        self.audit = audit
+        self.key = key
+        
+        # Duplicate submissions sharing this job's result: (reply, requester)
+        self.followers: List[Tuple[Optional[ResultHandler], Any]] = []
+        
+        self.submitted_at = time.monotonic()
+        # Trace of the interaction that submitted the job; the worker finishes it
+        self.trace = tracing.current()
+        # Seconds spent in each stage: queued, command, reply, audit, total
+        self.timings: Dict[str, float] = {}
+        self._result: asyncio.Future = asyncio.get_running_loop().create_future()
+    
+    def done(self) -> bool:
+        """Whether the command has run (the reply and audit may still be in progress)"""
+        return self._result.done()
+    
+    async def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the command's result
+        
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+        
+        Returns:
+            Result from AdminBot.run_command()
+        """
+        return await asyncio.wait_for(asyncio.shield(self._result), timeout)
+    
+    def __repr__(self) -> str:
+        return f"<ActionJob #{self.id} {self.action}>"
+
+
+class ActionExecutor:
+    """Runs action jobs on a fixed pool of workers, replying and auditing concurrently"""
+    
+    STAGES = ('queued', 'command', 'reply', 'audit', 'total')
+    
+    def __init__(
+        self,
+        run_command: Callable[[str, str], Awaitable[Dict[str, Any]]],
+        workers: int = 4,
+        max_queue: int = 100
+    ):
+        """
+        Initialize the executor
+        
+        Args:
+            run_command: Coroutine function (action, command) -> result dict
+            workers: Jobs processed at once
+            max_queue: Jobs that may wait before submit() refuses more
+        """
+        self.run_command = run_command
+        self.workers = workers
+        
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._tasks: List[asyncio.Task] = []
+        self.in_flight = 0
+        self.completed = 0
+        self.coalesced = 0
+        
+        # Keyed jobs that are queued or running (removed as soon as the command returns)
+        self._recent: Dict[Hashable, ActionJob] = {}
+        
+        # Per stage: [count, total seconds, max seconds]
+        self._stage_stats: Dict[str, List[float]] = {stage: [0, 0.0, 0.0] for stage in self.STAGES}
+    
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and stage timings
+        
+        Returns:
+            Dict with depth, in_flight, completed and per-stage count/avg/max seconds
+        """
+        return {
+            'depth': self.depth,
+            'in_flight': self.in_flight,
+            'completed': self.completed,
+            'coalesced': self.coalesced,
+            'stages': {
+                stage: {
+                    'count': count,
+                    'avg': total / count if count else 0.0,
+                    'max': maximum
+                }
+                for stage, (count, total, maximum) in self._stage_stats.items()
+            }
+        }
+    
+    def start(self):
+        """Start the worker tasks"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"action-worker-{n}")
+            for n in range(self.workers)
+        ]
+        logger.info(f"Action executor started ({self.workers} workers)")
+    
+    async def stop(self, timeout: float = 10.0):
+        """
+        Finish queued jobs (up to a timeout), then stop the workers
+        
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Stopping with {self.depth} queued and {self.in_flight} running actions")
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    def submit(
+        self,
+        action: str,
+        command: str,
+        reply: Optional[ResultHandler] = None,
+        audit: Optional[ResultHandler] = None,
+        key: Optional[Hashable] = None,
+        requester: Any = None
+    ) -> ActionJob:
+        """
+        Queue an action without waiting for it to run
+        
+        A submission whose key matches a job that is still queued or running is
+        not run again: it joins that job, its reply gets the shared result (with
+        'duplicate_of' set) and it is listed under 'coalesced' in the job's one
+        audit result - the joiner's own audit handler is never called. Once the
+        command has returned, the same submission runs again, so a later repeat
+        (e.g. freeze after an unfreeze) is never answered with a stale result.
+        
+        Args:
+            action: The moderation action
+            command: Rendered console command
+            reply: Sends the moderator's followup for a result
+            audit: Records a result in the audit log
+            key: Identity of the command for coalescing (e.g. rendered command and target servers)
+            requester: Who submitted it (e.g. the Discord user), reported in 'coalesced'
+        
+        Returns:
+            The job handle - the existing job when the submission was coalesced
+        
+        Raises:
+            asyncio.QueueFull: If max_queue jobs are already waiting
+        """
+        if key is not None:
+            existing = self._recent.get(key)
+            if existing is not None:
+                self._join(existing, reply, requester)
+                return existing
+        
+        job = ActionJob(action, command, reply=reply, audit=audit, key=key)
+        self._queue.put_nowait(job)
+        if key is not None:
+            self._recent[key] = job
+        if job.trace:
+            job.trace.handoff()
+        if self.depth > self.workers:
+            logger.info(f"Action queue depth {self.depth} ({self.in_flight} running)")
+        return job
+    
+    def _join(self, job: ActionJob, reply: Optional[ResultHandler], requester: Any):
+        self.coalesced += 1
+        logger.info(f"Coalesced duplicate {job.action} into {job!r}")
+        job.followers.append((reply, requester))
+    
+    def _forget(self, job: ActionJob):
+        if self._recent.get(job.key) is job:
+            del self._recent[job.key]
+    
+    async def _reply_duplicate(self, job: ActionJob, reply: ResultHandler, result: Dict[str, Any]):
+        try:
+            await reply({**result, 'duplicate_of': job.id})
+        except Exception:
+            logger.exception(f"Reply to duplicate of {job!r} failed")
+    
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except Exception:
+                logger.exception(f"Action job {job!r} failed")
+            finally:
+                self._queue.task_done()
+    
+    async def _process(self, job: ActionJob):
+        started = time.monotonic()
+        job.timings['queued'] = started - job.submitted_at
+        if job.trace:
+            job.trace.add_span('queued', job.submitted_at, started)
+        self.in_flight += 1
+        result = None
+        try:
+            with tracing.activate(job.trace):
+                try:
+                    with tracing.span('command'):
+                        result = await self.run_command(job.action, job.command)
+                except Exception as e:
+                    logger.exception(f"Action {job.action} raised")
+                    result = {'success': False, 'error': f"Internal error: {e}"}
+                job.timings['command'] = time.monotonic() - started
+                job._result.set_result(result)
+                # From here on an identical submission is a new request and runs again
+                if job.key is not None:
+                    self._forget(job)
+                
+                # One audit entry covers every duplicate that joined while the command ran
+                audit_result = result
+                if job.followers:
+                    audit_result = {**result, 'coalesced': [requester for _, requester in job.followers]}
+                
+                # The moderator's reply and the audit entry don't depend on each other
+                await asyncio.gather(
+                    self._run_stage(job, 'reply', job.reply, result),
+                    self._run_stage(job, 'audit', job.audit, audit_result),
+                    *(
+                        self._reply_duplicate(job, reply, result)
+                        for reply, _ in job.followers if reply is not None
+                    )
+                )
+        finally:
+            if job.key is not None:
+                self._forget(job)
+            if job.trace:
+                job.trace.finish('ok' if result and result.get('success') else 'failed')
+            self.in_flight -= 1
+            self.completed += 1
+            job.timings['total'] = time.monotonic() - job.submitted_at
+            for stage, elapsed in job.timings.items():
+                stats = self._stage_stats[stage]
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+                ACTION_STAGE_SECONDS.observe(elapsed, stage=stage)
+            logger.debug(
+                f"{job!r} finished: " + ", ".join(f"{stage} {elapsed:.3f}s" for stage, elapsed in job.timings.items())
+            )
+    
+    async def _run_stage(self, job: ActionJob, stage: str, handler: Optional[ResultHandler], result: Dict[str, Any]):
+        if handler is None:
+            return
+        started = time.monotonic()
+        try:
+            with tracing.span('followup' if stage == 'reply' else stage):
+                await handler(result)
+        except Exception:
+            # One stage failing (e.g. an expired interaction) must not stop the other
+            logger.exception(f"{stage.title()} for {job!r} failed")
+        finally:
+            job.timings[stage] = time.monotonic() - started
@@ -0,0 +1,251 @@
+"""
+Durable audit journal for Admin Action Bot
+Append-only SQLite (WAL) log of every moderation action, written off the event loop
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('Journal')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    admin_id INTEGER NOT NULL,
+    admin_name TEXT NOT NULL,
+    action TEXT NOT NULL,
+    target TEXT NOT NULL,
+    reason TEXT,
+    duration INTEGER,
+    success INTEGER NOT NULL,
+    error TEXT,
+    latency REAL,
+    details TEXT,
+    delivered INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS audit_log_undelivered ON audit_log (delivered, created_at);
+"""
+
+_COLUMNS = (
+    'id', 'created_at', 'admin_id', 'admin_name', 'action', 'target',
+    'reason', 'duration', 'success', 'error', 'latency', 'details'
+)
+
+
+class AuditJournal:
+    """Append-only audit record store with a background writer thread"""
+    
+    def __init__(self, path: str, batch_size: int = 100):
+        """
+        Initialize the journal
+        
+        Args:
+            path: SQLite database file
+            batch_size: Maximum records written per transaction
+        """
+        self.path = path
+        self.batch_size = batch_size
+        
+        # sqlite3 connections are used from a single dedicated thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-journal")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def depth(self) -> int:
+        """Number of journal operations waiting to be written"""
+        return self._queue.qsize()
+    
+    async def start(self):
+        """Open the database and start the background writer"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._open)
+        self._task = asyncio.create_task(self._run(), name="audit-journal")
+        logger.info(f"Audit journal opened at {self.path}")
+    
+    async def stop(self):
+        """Write everything still queued, then close the database"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        loop = asyncio.get_running_loop()
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending and self._conn:
+            await loop.run_in_executor(self._executor, self._apply, pending)
+        
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=True)
+    
+    def append(
+        self,
+        admin_id: int,
+        admin_name: str,
+        action: str,
+        target: str,
+        reason: Optional[str] = None,
+        duration: Optional[int] = None,
+        success: bool = True,
+        error: Optional[str] = None,
+        latency: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a new audit record for writing
+        
+        Args:
+            admin_id: Discord ID of the administrator
+            admin_name: Display name of the administrator
+            action: The action type (kill, kick, etc.)
+            target: The target player
+            reason: The reason for the action
+            duration: Duration in minutes (for temp bans)
+            success: Whether the action was successful
+            error: Error message if action failed
+            latency: Seconds the panel command took
+            details: Extra structured data (e.g. per-player bulk results)
+        
+        Returns:
+            The record, including its generated 'id' and 'created_at'
+        """
+        record = {
+            'id': uuid.uuid4().hex,
+            'created_at': time.time(),
+            'admin_id': admin_id,
+            'admin_name': admin_name,
+            'action': action,
+            'target': target,
+            'reason': reason,
+            'duration': duration,
+            'success': success,
+            'error': error,
+            'latency': latency,
+            'details': details
+        }
+        self._queue.put_nowait(('append', record))
+        return record
+    
+    def mark_delivered(self, record_ids: List[str]):
+        """
+        Record that entries have been posted to the audit channel
+        
+        Args:
+            record_ids: IDs returned by append()
+        """
+        if record_ids:
+            self._queue.put_nowait(('delivered', list(record_ids)))
+    
+    async def undelivered(self, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Get records that have not reached the audit channel yet, oldest first
+        
+        Args:
+            limit: Maximum records to return
+        
+        Returns:
+            List of records
+        """
+        # Deliveries reported moments ago may still be queued; without them the
+        # select would return records that were already posted
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._select_undelivered, limit)
+    
+    async def flush(self):
+        """Write every operation queued so far before returning"""
+        # Batches the writer task has already taken are ahead of this one on the
+        # single journal thread, so they are written first too
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._apply, pending)
+        except Exception:
+            logger.exception(f"Failed to write {len(pending)} audit journal operations")
+    
+    async def _run(self):
+        """Drain the queue in batches, one transaction per batch"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await loop.run_in_executor(self._executor, self._apply, batch)
+            except Exception:
+                logger.exception(f"Failed to write {len(batch)} audit journal operations")
+    
+    # --- Everything below runs on the journal thread ---
+    
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+    
+    def _close(self):
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+    
+    def _apply(self, operations: List[Tuple[str, Any]]):
+        rows = []
+        delivered = []
+        for op, payload in operations:
+            if op == 'append':
+                rows.append(_to_row(payload))
+            elif op == 'delivered':
+                delivered.extend((record_id,) for record_id in payload)
+        
+        with self._conn:
+            if rows:
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO audit_log ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                    rows
+                )
+            if delivered:
+                self._conn.executemany("UPDATE audit_log SET delivered = 1 WHERE id = ?", delivered)
+    
+    def _select_undelivered(self, limit: int) -> List[Dict[str, Any]]:
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM audit_log "
+            f"WHERE delivered = 0 ORDER BY created_at LIMIT ?",
+            (limit,)
+        )
+        return [_from_row(row) for row in cursor.fetchall()]
+
+
+def _to_row(record: Dict[str, Any]) -> tuple:
+    values = dict(record)
+    values['success'] = int(bool(values['success']))
+    values['details'] = json.dumps(values['details']) if values.get('details') is not None else None
+    return tuple(values.get(column) for column in _COLUMNS)
+
+
+def _from_row(row: tuple) -> Dict[str, Any]:
+    record = dict(zip(_COLUMNS, row))
+    record['success'] = bool(record['success'])
+    record['details'] = json.loads(record['details']) if record['details'] else None
+    return record
@@ -0,0 +1,268 @@
+"""
+Metrics for Admin Action Bot
+Minimal Prometheus text-format registry, an event-loop lag monitor and a local /metrics server
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger('Metrics')
+
+# Latency buckets in seconds, from a fast cache hit to a panel timeout
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by labels"""
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+    
+    def observe(self, value: float, **labels: str):
+        """
+        Record one observation
+        
+        Args:
+            value: Observed value (seconds for latency histograms)
+            **labels: One value per label name
+        """
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+    
+    def collect(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for key, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Gauge:
+    """Value that can go up and down, optionally split by labels"""
+    
+    type_name = 'gauge'
+    
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+    
+    def set(self, value: float, **labels: str):
+        """Set the current value for a label combination"""
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        self._values[key] = value
+    
+    def collect(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class CounterSnapshot(Gauge):
+    """Counter whose value is copied from a component's own running total at scrape time"""
+    
+    type_name = 'counter'
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in Prometheus text format"""
+    
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Callable[[], None]] = []
+    
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+    
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        metric = Gauge(name, documentation, label_names)
+        self._metrics.append(metric)
+        return metric
+    
+    def counter_snapshot(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> CounterSnapshot:
+        metric = CounterSnapshot(name, documentation, label_names)
+        self._metrics.append(metric)
+        return metric
+    
+    def add_collector(self, collector: Callable[[], None]):
+        """Register a function that refreshes gauges just before each scrape"""
+        self._collectors.append(collector)
+    
+    def remove_collector(self, collector: Callable[[], None]):
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+    
+    def render(self) -> str:
+        """Render every metric in Prometheus text exposition format"""
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("Metrics collector failed")
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry; observing into it is cheap whether or not the endpoint is enabled
+REGISTRY = MetricsRegistry()
+
+SEND_COMMAND_SECONDS = REGISTRY.histogram(
+    'adminbot_send_command_seconds',
+    'Time to send one console command to the panel, by outcome (HTTP status or failure kind)',
+    ('status',)
+)
+ACTION_STAGE_SECONDS = REGISTRY.histogram(
+    'adminbot_action_stage_seconds',
+    'Time spent in each action executor stage (reply is the Discord followup)',
+    ('stage',)
+)
+AUDIT_SEND_SECONDS = REGISTRY.histogram(
+    'adminbot_audit_send_seconds',
+    'Time to post one batched audit message to Discord, by outcome',
+    ('outcome',)
+)
+EVENT_LOOP_LAG_SECONDS = REGISTRY.histogram(
+    'adminbot_event_loop_lag_seconds',
+    'How late the event loop woke a periodic timer',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    'adminbot_queue_depth',
+    'Items waiting in internal queues',
+    ('queue',)
+)
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    'adminbot_cache_hit_ratio',
+    'Share of cache lookups served without a new load',
+    ('cache',)
+)
+CACHE_LOOKUPS = REGISTRY.counter_snapshot(
+    'adminbot_cache_lookups_total',
+    'Cache lookups since start, by result',
+    ('cache', 'result')
+)
+
+
+class LoopLagMonitor:
+    """Measures event-loop responsiveness by timing a periodic sleep"""
+    
+    def __init__(self, interval: float = 0.5, histogram: Histogram = EVENT_LOOP_LAG_SECONDS, warn_threshold: float = 0.25):
+        """
+        Initialize the monitor
+        
+        Args:
+            interval: Seconds between samples
+            histogram: Where lag samples are recorded
+            warn_threshold: Lag in seconds that is logged as a warning
+        """
+        self.interval = interval
+        self.histogram = histogram
+        self.warn_threshold = warn_threshold
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - expected)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.histogram.observe(lag)
+            if lag >= self.warn_threshold:
+                logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving GET /metrics for Prometheus to scrape"""
+    
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = '127.0.0.1', port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+    
+    async def start(self):
+        """Start listening"""
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+    
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.registry.render().encode('utf-8'), headers={'Content-Type': CONTENT_TYPE})
@@ -0,0 +1,171 @@
+"""
+Recent players cache for Admin Action Bot
+LRU of player names with a case-insensitive prefix index and disk snapshots
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger('Players')
+
+
+class RecentPlayers:
+    """Least-recently-used set of player names, most recent last"""
+    
+    def __init__(self, capacity: int = 500, path: Optional[str] = None, snapshot_interval: float = 60.0):
+        """
+        Initialize the cache
+        
+        Args:
+            capacity: Maximum names kept before the least recent is evicted
+            path: JSON snapshot file (None disables persistence)
+            snapshot_interval: Seconds between snapshots while there are unsaved changes
+        """
+        self.capacity = capacity
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        
+        # Lowercased name -> display name, ordered oldest -> newest
+        self._players: "OrderedDict[str, str]" = OrderedDict()
+        # Sorted lowercased names for prefix search
+        self._index: List[str] = []
+        
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+    
+    def __contains__(self, player_name: str) -> bool:
+        return player_name.lower() in self._players
+    
+    def __len__(self) -> int:
+        return len(self._players)
+    
+    def add(self, player_name: str):
+        """
+        Mark a player as most recently used
+        
+        O(1) for a name already in the cache. A new name (and the eviction it
+        may cause) also updates the sorted prefix index, which is a binary search
+        plus an O(n) list shift - a few microseconds at the default capacity.
+        
+        Args:
+            player_name: The player's username
+        """
+        key = player_name.lower()
+        if key in self._players:
+            self._players.move_to_end(key)
+        else:
+            bisect.insort(self._index, key)
+            if len(self._players) >= self.capacity:
+                evicted, _ = self._players.popitem(last=False)
+                del self._index[bisect.bisect_left(self._index, evicted)]
+        # Keep the latest capitalisation
+        self._players[key] = player_name
+        self._dirty = True
+    
+    def most_recent(self, limit: Optional[int] = None) -> Iterator[str]:
+        """
+        Iterate names from most to least recent without copying the cache
+        
+        Args:
+            limit: Maximum names to yield
+        
+        Yields:
+            Player display names
+        """
+        return islice(reversed(self._players.values()), limit)
+    
+    def search(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        Find players whose name starts with a prefix (case-insensitive)
+        
+        Args:
+            prefix: Start of the name
+            limit: Maximum results
+        
+        Returns:
+            Matching display names in alphabetical order
+        """
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._index, prefix)
+        matches = []
+        for key in islice(self._index, start, start + limit):
+            if not key.startswith(prefix):
+                break
+            matches.append(self._players[key])
+        return matches
+    
+    # --- Persistence ---
+    
+    def load(self):
+        """Load the snapshot from disk, if there is one"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                names = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load recent players from {self.path}: {e}")
+            return
+        if not isinstance(names, list):
+            logger.warning(f"Ignoring {self.path}: expected a list of names, got {type(names).__name__}")
+            return
+        
+        # Hand-edited or foreign files may hold anything; only plausible names are restored
+        valid = [name for name in names if isinstance(name, str) and 0 < len(name) <= 16]
+        if len(valid) < len(names):
+            logger.warning(f"Skipped {len(names) - len(valid)} invalid entries in {self.path}")
+        
+        # Stored oldest -> newest, so replaying add() restores the order
+        for name in valid[-self.capacity:]:
+            self.add(name)
+        self._dirty = False
+        logger.info(f"Loaded {len(self._players)} recent players")
+    
+    def _write_snapshot(self, names: List[str]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(names, f)
+        os.replace(tmp_path, self.path)
+    
+    async def save(self):
+        """Write a snapshot to disk off the event loop, if anything changed"""
+        if not self.path or not self._dirty:
+            return
+        names = list(self._players.values())
+        self._dirty = False
+        try:
+            await asyncio.to_thread(self._write_snapshot, names)
+        except OSError as e:
+            self._dirty = True
+            logger.error(f"Could not save recent players to {self.path}: {e}")
+    
+    def start(self):
+        """Start periodic snapshots"""
+        if not self.path or (self._task and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run(), name="recent-players-snapshot")
+    
+    async def stop(self):
+        """Stop periodic snapshots and write a final one"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.save()
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            await self.save()
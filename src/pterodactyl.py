@@ -3,17 +3,204 @@ Pterodactyl API client for sending commands to Minecraft server
 Handles authentication, command execution, and error handling
 """
 
+import asyncio
+import contextvars
+import json
+import math
+import random
+import ssl
+import time
 import aiohttp
 import logging
-from typing import Optional, Dict, Any
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, NamedTuple
+
+from .cache import TTLCache
+from . import tracing
+from .metrics import SEND_COMMAND_SECONDS
 
 logger = logging.getLogger('Pterodactyl')
 
 
+class TokenBucket:
+    """FIFO token-bucket rate limiter for outgoing panel requests"""
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the bucket
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Bucket capacity (requests allowed back-to-back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+    
+    def _refill(self, now: float):
+        # Nothing accrues before _updated, which a pause() moves into the future
+        self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = now
+    
+    def pause(self, seconds: float):
+        """
+        Hold back every caller for a while (e.g. after a 429 with Retry-After)
+        
+        Args:
+            seconds: How long to stop handing out tokens
+        """
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        # The panel told us we are out of budget - refill from empty, starting when the pause ends
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._paused_until)
+    
+    async def acquire(self) -> float:
+        """
+        Wait for a token, in arrival order
+        
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._paused_until:
+                        await asyncio.sleep(self._paused_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return time.monotonic() - start
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+
+class PanelUnavailableError(Exception):
+    """Raised instead of calling the panel while the circuit breaker is open"""
+    
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"Panel unavailable - failing fast, next check in {math.ceil(retry_in)}s")
+
+
+class CircuitBreaker:
+    """Tracks consecutive panel failures and opens to fail fast during outages"""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Initialize the breaker
+        
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before a half-open probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+    
+    def retry_in(self) -> float:
+        """Seconds until a half-open probe is allowed"""
+        if self.state == self.CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+    
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info("✅ Panel reachable again - circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            logger.error(
+                f"❌ Panel failing ({self.failures} consecutive failures) - "
+                f"circuit open for {self.reset_timeout:.0f}s"
+            )
+
+
+# Set while a half-open probe runs so its own request is let through the breaker
+_bypass_circuit: contextvars.ContextVar[bool] = contextvars.ContextVar('bypass_circuit', default=False)
+
+# Server-side failures that are retried for idempotent requests only: a gateway
+# error can arrive after Wings already ran a command
+_RETRY_SAFE_STATUSES = {500, 502, 503, 504}
+
+
+def _log_late_result(name: str, task: asyncio.Task):
+    """Log the outcome of a fan-out command that finished after send_command_many returned"""
+    if task.cancelled():
+        return
+    result = task.result()
+    if result.get('success'):
+        logger.info(f"Late result from {name}: success")
+    else:
+        logger.warning(f"Late result from {name}: {result.get('error')}")
+
+
+class PanelResponse(NamedTuple):
+    """Status and body of a completed panel request"""
+    status: int
+    body: str
+    queue_wait: float  # Seconds spent in the rate limiter, including Retry-After pauses
+    etag: Optional[str] = None
+    
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+
+def _parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header given as seconds or an HTTP date"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
 class PterodactylClient:
     """Client for interacting with Pterodactyl Panel API"""
     
-    def __init__(self, api_url: str, api_key: str, server_id: str):
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        server_id: str,
+        connection_limit: int = 10,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 60.0,
+        rate_limit: float = 10.0,
+        rate_burst: int = 20,
+        max_rate_limit_retries: int = 3,
+        max_retries: int = 2,
+        retry_base_delay: float = 0.5,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 30.0,
+        status_cache_ttl: float = 5.0,
+        status_cache_stale: float = 30.0
+    ):
         """
         Initialize Pterodactyl API client
         
@@ -21,83 +208,338 @@ class PterodactylClient:
             api_url: Base URL of Pterodactyl panel (without trailing slash)
             api_key: Client API key from Pterodactyl
             server_id: Server identifier (UUID)
+            connection_limit: Maximum open connections to the panel host
+            dns_cache_ttl: Seconds to cache resolved panel addresses
+            keepalive_timeout: Seconds to keep idle connections open for reuse
+            rate_limit: Sustained panel requests per second
+            rate_burst: Requests allowed back-to-back before throttling
+            max_rate_limit_retries: Times to requeue a request answered with 429
+            max_retries: Retries for transient failures (network errors, 5xx)
+            retry_base_delay: Base delay in seconds for jittered exponential backoff
+            circuit_failure_threshold: Consecutive failures before failing fast
+            circuit_reset_timeout: Seconds to fail fast before probing the panel again
+            status_cache_ttl: Seconds a server status stays fresh
+            status_cache_stale: Further seconds a stale status is served while refreshing
         """
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
         self.server_id = server_id
+        # Sent with each panel request rather than as session defaults, so the API
+        # key never reaches other hosts on the session (e.g. the Wings websocket)
         self.headers = {
             'Authorization': f'Bearer {api_key}',
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
         
-    async def send_command(self, command: str) -> Dict[str, Any]:
+        # Shared HTTP session (created in start(), closed in close())
+        self.connection_limit = connection_limit
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        
+        # Client-side throttle so bursts queue here instead of hitting the panel's 429
+        self.rate_limiter = TokenBucket(rate_limit, rate_burst)
+        self.max_rate_limit_retries = max_rate_limit_retries
+        
+        # Retry transient failures, and fail fast while the panel is known to be down
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.circuit = CircuitBreaker(circuit_failure_threshold, circuit_reset_timeout)
+        self._probe_lock = asyncio.Lock()
+        
+        # Server status cache - concurrent callers share one request
+        self.status_cache = TTLCache(
+            ttl=status_cache_ttl,
+            stale_ttl=status_cache_stale,
+            should_cache=lambda result: result.get('success', False)
+        )
+    
+    async def start(self):
+        """
+        Create the shared HTTP session used for all panel requests
+        
+        A single session keeps connections alive between commands, so
+        back-to-back actions skip DNS lookup and the TCP/TLS handshake.
+        """
+        if self._session and not self._session.closed:
+            return
+        
+        # One SSL context for every connection so TLS sessions can be resumed
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.connection_limit,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+            ssl=self._ssl_context
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        logger.info(
+            f"HTTP session started (limit_per_host={self.connection_limit}, "
+            f"dns_cache_ttl={self.dns_cache_ttl}s)"
+        )
+    
+    async def close(self):
+        """Close the shared HTTP session and release pooled connections"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("HTTP session closed")
+        self._session = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, starting it on first use"""
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        retry_safe: Optional[bool] = None,
+        **kwargs
+    ) -> PanelResponse:
+        """
+        Send a request to the panel through the circuit breaker, with retries
+        
+        Transient failures are retried with jittered exponential backoff, but only
+        where a retry cannot run a command twice: connection failures (nothing was
+        sent) always; timeouts, other network errors and 5xx responses only for
+        idempotent requests (GET by default).
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            timeout: Total timeout per attempt in seconds
+            retry_safe: Whether the request is idempotent (defaults to method == 'GET')
+            **kwargs: Passed through to aiohttp (e.g. json=)
+            
+        Returns:
+            PanelResponse for the final attempt
+            
+        Raises:
+            PanelUnavailableError: The circuit is open
+        """
+        if retry_safe is None:
+            retry_safe = method == 'GET'
+        kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {})}
+        
+        await self._check_circuit()
+        
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(method, url, timeout, **kwargs)
+            except aiohttp.ClientConnectorError:
+                retryable = True
+                if attempt >= self.max_retries:
+                    self.circuit.record_failure()
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                retryable = retry_safe
+                if not retryable or attempt >= self.max_retries:
+                    self.circuit.record_failure()
+                    raise
+            else:
+                if retry_safe and response.status in _RETRY_SAFE_STATUSES:
+                    if attempt >= self.max_retries:
+                        self.circuit.record_failure()
+                        return response
+                elif response.status >= 500:
+                    self.circuit.record_failure()
+                    return response
+                else:
+                    self.circuit.record_success()
+                    return response
+            
+            # Full jitter: sleep uniformly in [0, base * 2^attempt]
+            delay = random.uniform(0, self.retry_base_delay * (2 ** attempt))
+            attempt += 1
+            logger.warning(f"Transient panel failure on {method} {url} - retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+    
+    async def _check_circuit(self):
+        """
+        Fail fast while the circuit is open; once the cooldown has passed,
+        let one caller run a half-open probe through test_connection()
+        """
+        if _bypass_circuit.get() or self.circuit.state == CircuitBreaker.CLOSED:
+            return
+        
+        if self.circuit.retry_in() > 0 or self._probe_lock.locked():
+            raise PanelUnavailableError(self.circuit.retry_in())
+        
+        async with self._probe_lock:
+            self.circuit.state = CircuitBreaker.HALF_OPEN
+            await self.test_connection()
+        
+        if self.circuit.state != CircuitBreaker.CLOSED:
+            raise PanelUnavailableError(self.circuit.retry_in())
+    
+    async def _send(self, method: str, url: str, timeout: float, **kwargs) -> PanelResponse:
+        """
+        Send a rate-limited request to the panel
+        
+        Waits for a token before every attempt. A 429 pauses the limiter for
+        the Retry-After period and requeues the request instead of failing it.
+        Network errors propagate to the caller.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            timeout: Total timeout per attempt in seconds
+            **kwargs: Passed through to aiohttp (e.g. json=)
+            
+        Returns:
+            PanelResponse for the final attempt
+        """
+        session = await self._get_session()
+        queue_wait = 0.0
+        attempt = 0
+        
+        while True:
+            queue_wait += await self.rate_limiter.acquire()
+            async with session.request(method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
+                body = await response.text()
+                if response.status != 429 or attempt >= self.max_rate_limit_retries:
+                    if queue_wait >= 0.05:
+                        logger.info(f"{method} {url} waited {queue_wait:.2f}s in rate-limit queue")
+                    return PanelResponse(response.status, body, queue_wait, response.headers.get('ETag'))
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            
+            attempt += 1
+            logger.warning(
+                f"Panel rate limit hit (429) - requeueing in {retry_after:.1f}s "
+                f"(attempt {attempt}/{self.max_rate_limit_retries})"
+            )
+            self.rate_limiter.pause(retry_after)
+    
+    async def send_command(self, command: str, server_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Send a command to the Minecraft server via Pterodactyl
         
         Args:
             command: The command to execute (without leading /)
+            server_id: Server to run it on (defaults to the configured server)
+            
+        Returns:
+            Dict with 'success' (bool), 'message' (str), 'latency' (float seconds),
+            optional 'queue_wait' (float seconds) and optional 'error' (str)
+        """
+        start = time.monotonic()
+        with tracing.span('send_command'):
+            result = await self._send_command(command, server_id or self.server_id)
+        result['latency'] = time.monotonic() - start
+        SEND_COMMAND_SECONDS.observe(result['latency'], status=result.pop('status', 'error'))
+        return result
+    
+    async def send_command_many(
+        self,
+        command: str,
+        servers: Dict[str, str],
+        timeout: float = 10.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Send the same command to several servers concurrently
+        
+        Servers that have not answered within the timeout are reported as
+        pending ('pending': True) so they cannot hold back the others. The
+        timeout includes time queued in the rate limiter, so a pending command
+        has usually not failed - its request keeps running in the background
+        and the eventual outcome is logged.
+        
+        Args:
+            command: The command to execute (without leading /)
+            servers: Server name -> server ID
+            timeout: Seconds to wait for all servers
             
         Returns:
-            Dict with 'success' (bool), 'message' (str), and optional 'error' (str)
+            Server name -> send_command result
         """
-        url = f"{self.api_url}/api/client/servers/{self.server_id}/command"
+        tasks = {
+            asyncio.ensure_future(self.send_command(command, server_id)): name
+            for name, server_id in servers.items()
+        }
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for task in done:
+            results[tasks[task]] = task.result()
+        for task in pending:
+            name = tasks[task]
+            results[name] = {
+                'success': False,
+                'pending': True,
+                'message': 'Command still queued or running',
+                'error': f"No response within {timeout:g}s (still pending)",
+                'latency': timeout
+            }
+            task.add_done_callback(lambda t, name=name: _log_late_result(name, t))
+        
+        # Keep the caller's server order
+        return {name: results[name] for name in servers}
+    
+    async def _send_command(self, command: str, server_id: str) -> Dict[str, Any]:
+        """Send a command and map the panel response to a result dict"""
+        url = f"{self.api_url}/api/client/servers/{server_id}/command"
         
         payload = {
             'command': command
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=self.headers, json=payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 204:
-                        # 204 No Content = command sent successfully
-                        logger.info(f"Command sent successfully: {command}")
-                        return {
-                            'success': True,
-                            'message': 'Command executed successfully'
-                        }
-                    elif response.status == 401:
-                        error_msg = "Authentication failed - check API key"
-                        logger.error(error_msg)
-                        return {
-                            'success': False,
-                            'message': 'Failed to execute command',
-                            'error': error_msg
-                        }
-                    elif response.status == 404:
-                        error_msg = f"Server not found - check server ID: {self.server_id}"
-                        logger.error(error_msg)
-                        return {
-                            'success': False,
-                            'message': 'Failed to execute command',
-                            'error': error_msg
-                        }
-                    elif response.status == 403:
-                        error_msg = "Permission denied - API key lacks required permissions"
-                        logger.error(error_msg)
-                        return {
-                            'success': False,
-                            'message': 'Failed to execute command',
-                            'error': error_msg
-                        }
-                    else:
-                        error_text = await response.text()
-                        error_msg = f"API returned status {response.status}: {error_text}"
-                        logger.error(error_msg)
-                        return {
-                            'success': False,
-                            'message': 'Failed to execute command',
-                            'error': error_msg
-                        }
+            response = await self._request('POST', url, timeout=30, json=payload)
+            
+            if response.status == 204:
+                # 204 No Content = command sent successfully
+                logger.info(f"Command sent successfully: {command}")
+                return {
+                    'success': True,
+                    'message': 'Command executed successfully',
+                    'queue_wait': response.queue_wait,
+                    'status': str(response.status)
+                }
+            elif response.status == 401:
+                error_msg = "Authentication failed - check API key"
+            elif response.status == 404:
+                error_msg = f"Server not found - check server ID: {server_id}"
+            elif response.status == 403:
+                error_msg = "Permission denied - API key lacks required permissions"
+            elif response.status == 429:
+                error_msg = "Rate limited by panel - too many requests, try again shortly"
+            else:
+                error_msg = f"API returned status {response.status}: {response.body}"
+            
+            logger.error(error_msg)
+            return {
+                'success': False,
+                'message': 'Failed to execute command',
+                'error': error_msg,
+                'queue_wait': response.queue_wait,
+                'status': str(response.status)
+            }
                         
+        except PanelUnavailableError as e:
+            error_msg = str(e)
+            logger.warning(error_msg)
+            return {
+                'success': False,
+                'message': 'Failed to execute command',
+                'error': error_msg,
+                'status': 'circuit_open'
+            }
         except aiohttp.ClientError as e:
             error_msg = f"Network error: {str(e)}"
             logger.error(error_msg)
             return {
                 'success': False,
                 'message': 'Failed to execute command',
-                'error': error_msg
+                'error': error_msg,
+                'status': 'network_error'
             }
         except asyncio.TimeoutError:
             error_msg = "Request timeout - server took too long to respond"
@@ -105,7 +547,8 @@ class PterodactylClient:
             return {
                 'success': False,
                 'message': 'Failed to execute command',
-                'error': error_msg
+                'error': error_msg,
+                'status': 'timeout'
             }
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
@@ -113,77 +556,207 @@ class PterodactylClient:
             return {
                 'success': False,
                 'message': 'Failed to execute command',
-                'error': error_msg
+                'error': error_msg,
+                'status': 'error'
             }
     
-    async def get_server_status(self) -> Dict[str, Any]:
+    async def get_server_status(self, fresh: bool = False) -> Dict[str, Any]:
         """
         Get server status information
         
+        Served from the status cache while fresh; a stale value is returned
+        immediately while one background request refreshes it.
+        
+        Args:
+            fresh: Bypass the cache and query the panel
+            
+        Returns:
+            Dict with server status info or error
+        """
+        return await self.status_cache.get(self.server_id, self._fetch_server_status, fresh=fresh)
+    
+    async def refresh_server_status(self) -> Dict[str, Any]:
+        """
+        Query the panel for the server status and store it in the status cache
+        
+        For background pollers: shares any request already in flight and is
+        left out of the cache's hit/miss counters.
+        
         Returns:
             Dict with server status info or error
         """
+        return await self.status_cache.refresh(self.server_id, self._fetch_server_status)
+    
+    async def _fetch_server_status(self) -> Dict[str, Any]:
+        """Query the panel for the current server status"""
         url = f"{self.api_url}/api/client/servers/{self.server_id}/resources"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
+            response = await self._request('GET', url, timeout=10)
+            if response.status == 200:
+                return {
+                    'success': True,
+                    'data': response.json().get('attributes', {})
+                }
+            else:
+                logger.error(f"Failed to get server status: {response.status} - {response.body}")
+                return {
+                    'success': False,
+                    'error': f"API returned status {response.status}"
+                }
+        except PanelUnavailableError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except Exception as e:
+            logger.exception("Error getting server status")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def get_websocket_credentials(self) -> Dict[str, Any]:
+        """
+        Get a console websocket token and socket URL
+        
+        Returns:
+            Dict with 'success' (bool), 'token' and 'socket' (str), or 'error' (str)
+        """
+        url = f"{self.api_url}/api/client/servers/{self.server_id}/websocket"
+        
+        try:
+            response = await self._request('GET', url, timeout=10)
+            if response.status == 200:
+                data = response.json().get('data', {})
+                return {
+                    'success': True,
+                    'token': data.get('token'),
+                    'socket': data.get('socket')
+                }
+            else:
+                logger.error(f"Failed to get websocket token: {response.status} - {response.body}")
+                return {
+                    'success': False,
+                    'error': f"API returned status {response.status}"
+                }
+        except PanelUnavailableError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except Exception as e:
+            logger.exception("Error getting websocket token")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def get_file_info(self, path: str) -> Dict[str, Any]:
+        """
+        Get a file's size and modification time from the server's file manager
+        
+        Args:
+            path: File path relative to the server root (e.g. '/banned-players.json')
+        
+        Returns:
+            Dict with 'success' (bool), 'size' (int) and 'modified_at' (ISO 8601 str), or 'error' (str)
+        """
+        directory, _, name = path.rpartition('/')
+        url = f"{self.api_url}/api/client/servers/{self.server_id}/files/list"
+        
+        try:
+            response = await self._request('GET', url, timeout=10, params={'directory': directory or '/'})
+            if response.status == 200:
+                for item in response.json().get('data', []):
+                    attributes = item.get('attributes', {})
+                    if attributes.get('name') == name:
                         return {
                             'success': True,
-                            'data': data.get('attributes', {})
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get server status: {response.status} - {error_text}")
-                        return {
-                            'success': False,
-                            'error': f"API returned status {response.status}"
+                            'size': attributes.get('size'),
+                            'modified_at': attributes.get('modified_at')
                         }
+                return {
+                    'success': False,
+                    'error': f"{path} not found"
+                }
+            else:
+                logger.error(f"Failed to list {directory or '/'}: {response.status} - {response.body}")
+                return {
+                    'success': False,
+                    'error': f"API returned status {response.status}"
+                }
+        except PanelUnavailableError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
         except Exception as e:
-            logger.exception("Error getting server status")
+            logger.exception(f"Error getting file info for {path}")
             return {
                 'success': False,
                 'error': str(e)
             }
     
-    async def get_online_players(self) -> Optional[list]:
+    async def get_file_contents(self, path: str, etag: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get list of online players from server console output
-        Uses the 'list' command to fetch current players
+        Download a file from the server's file manager
+        
+        Args:
+            path: File path relative to the server root
+            etag: ETag from a previous download; an unchanged file is not sent again
         
         Returns:
-            List of player names or None if unavailable
+            Dict with 'success' (bool), 'content' (str), 'etag' (str or None) and
+            'not_modified' (bool), or 'error' (str)
         """
+        url = f"{self.api_url}/api/client/servers/{self.server_id}/files/contents"
+        headers = {'If-None-Match': etag} if etag else None
+        
         try:
-            # First, send the 'list' command to get online players
-            list_result = await self.send_command("list")
-            
-            if not list_result.get('success'):
-                logger.warning("Could not send 'list' command to get players")
-                return None
-            
-            # Get recent console logs to read the response
-            url = f"{self.api_url}/api/client/servers/{self.server_id}/websocket"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        # We'll use a simpler approach - query server resources
-                        # which sometimes includes player count
-                        status = await self.get_server_status()
-                        if status.get('success'):
-                            # For now, return None - player list requires WebSocket connection
-                            # which is complex. We'll implement a cached player list instead.
-                            logger.info("Player list via WebSocket not yet implemented - using cached list")
-                            return None
-                    else:
-                        return None
-                        
+            response = await self._request('GET', url, timeout=30, params={'file': path}, headers=headers)
+            if response.status in (200, 304):
+                return {
+                    'success': True,
+                    'content': response.body,
+                    'etag': response.etag or etag,
+                    'not_modified': response.status == 304
+                }
+            else:
+                logger.error(f"Failed to read {path}: {response.status} - {response.body}")
+                return {
+                    'success': False,
+                    'error': f"API returned status {response.status}"
+                }
+        except PanelUnavailableError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
         except Exception as e:
-            logger.exception("Error fetching player list")
-            return None
+            logger.exception(f"Error reading {path}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def ws_connect(self, socket_url: str) -> aiohttp.ClientWebSocketResponse:
+        """
+        Open a console websocket on the shared session
+        
+        Args:
+            socket_url: Socket URL returned by get_websocket_credentials()
+            
+        Returns:
+            Connected websocket (use as an async context manager)
+        """
+        session = await self._get_session()
+        # Wings checks the Origin header against the panel URL
+        return await session.ws_connect(
+            socket_url,
+            headers={'Origin': self.api_url},
+            heartbeat=30
+        )
     
     async def get_cached_players(self) -> list:
         """
@@ -201,11 +774,21 @@ class PterodactylClient:
         """
         Test connection to Pterodactyl API
         
+        Always reaches the panel, even while the circuit is open, and its
+        outcome closes or re-opens the circuit - this is the half-open probe.
+        
         Returns:
             True if connection successful, False otherwise
         """
         logger.info("Testing Pterodactyl API connection...")
-        result = await self.get_server_status()
+        token = _bypass_circuit.set(True)
+        try:
+            # Fetched in this task, never by joining a shared cache load: the bypass is a
+            # context variable, and a load started elsewhere would be refused by the breaker
+            result = await self._fetch_server_status()
+        finally:
+            _bypass_circuit.reset(token)
+        self.status_cache.set(self.server_id, result)
         
         if result.get('success'):
             logger.info("✅ Pterodactyl API connection successful")
@@ -0,0 +1,202 @@
+"""
+Online player roster for Admin Action Bot
+Tracks who is on the server from console join/leave lines and 'list' output
+"""
+
+import asyncio
+import logging
+import re
+from typing import Dict, Iterator, List, Optional
+
+from .console import ConsoleStream
+
+logger = logging.getLogger('Roster')
+
+# Minecraft usernames: 3-16 characters of letters, digits and underscores
+# (Bedrock players via Geyser/Floodgate are commonly prefixed with '.' or '*')
+_NAME = r'[.*]?\w{1,16}'
+
+# Strips colour codes and the "[12:00:00 INFO]: " / "[Server thread/INFO]: " log prefix
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|§.')
+_PREFIX_RE = re.compile(r'^(?:\[[^\]]*\]\s*)+:?\s*')
+
+_JOIN_RE = re.compile(rf'^({_NAME}) joined the game$')
+_LEAVE_RE = re.compile(rf'^({_NAME}) left the game$')
+_LIST_RE = re.compile(
+    r'^There are (\d+)(?: of a max of |/| out of maximum )(\d+) players online[.:]?\s*(.*)$'
+)
+_GROUP_RE = re.compile(r'^\w+:\s*')
+
+
+class PlayerRoster:
+    """In-memory set of online players kept current from the console stream"""
+    
+    def __init__(self, console: ConsoleStream):
+        """
+        Initialize the roster
+        
+        Args:
+            console: Console stream to read join/leave and 'list' output from
+        """
+        self.console = console
+        
+        # Lowercased name -> display name, for O(1) case-insensitive lookups
+        self._players: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        
+        # Names still expected on following lines after a 'list' header
+        self._pending_list: Optional[Dict[str, str]] = None
+        self._pending_count = 0
+    
+    def __contains__(self, player_name: str) -> bool:
+        return player_name.lower() in self._players
+    
+    def __len__(self) -> int:
+        return len(self._players)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._players.values())
+    
+    def get_online_players(self) -> List[str]:
+        """
+        Get online players sorted by name
+        
+        Returns:
+            List of player display names
+        """
+        return sorted(self._players.values(), key=str.lower)
+    
+    def search(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        Find online players whose name starts with a prefix (case-insensitive)
+        
+        Args:
+            prefix: Start of the name
+            limit: Maximum results
+            
+        Returns:
+            Matching display names in alphabetical order
+        """
+        prefix = prefix.lower()
+        return sorted(
+            (name for key, name in self._players.items() if key.startswith(prefix)),
+            key=str.lower
+        )[:limit]
+    
+    def start(self):
+        """Start consuming the console stream in the background"""
+        if self._task and not self._task.done():
+            return
+        self.console.add_connect_listener(self._on_console_connect)
+        self.console.add_status_listener(self._on_server_status)
+        self._task = asyncio.create_task(self._consume(), name="player-roster")
+        logger.info("Player roster started")
+    
+    async def stop(self):
+        """Stop consuming the console stream"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _on_console_connect(self):
+        """Resynchronise after every (re)connect, since joins may have been missed"""
+        await self.console.send_command("list")
+    
+    async def _on_server_status(self, state: str):
+        """
+        Follow the server's power state: a stop or crash prints no leave lines,
+        so the roster is emptied, and rebuilt with 'list' once it is running again
+        """
+        if state in ('offline', 'stopping'):
+            if self._players:
+                logger.info(f"Server {state} - clearing roster ({len(self._players)} players)")
+            self._players = {}
+            self._pending_list = None
+        elif state == 'running':
+            await self.console.send_command("list")
+    
+    async def _consume(self):
+        """Feed every console line into the roster"""
+        async for line in self.console.lines():
+            try:
+                self.handle_line(line)
+            except Exception:
+                logger.exception(f"Failed to parse console line: {line!r}")
+    
+    def handle_line(self, line: str):
+        """
+        Update the roster from a single console line
+        
+        Args:
+            line: Raw console output line
+        """
+        text = _PREFIX_RE.sub('', _ANSI_RE.sub('', line)).strip()
+        if not text:
+            return
+        
+        # Continuation of a multi-line 'list' response
+        if self._pending_list is not None:
+            if self._collect_names(text):
+                return
+        
+        match = _JOIN_RE.match(text)
+        if match:
+            name = match.group(1)
+            self._players[name.lower()] = name
+            logger.debug(f"{name} joined ({len(self._players)} online)")
+            return
+        
+        match = _LEAVE_RE.match(text)
+        if match:
+            name = match.group(1)
+            self._players.pop(name.lower(), None)
+            logger.debug(f"{name} left ({len(self._players)} online)")
+            return
+        
+        match = _LIST_RE.match(text)
+        if match:
+            self._pending_list = {}
+            self._pending_count = int(match.group(1))
+            if match.group(3):
+                self._collect_names(match.group(3))
+            self._finish_list_if_complete()
+    
+    def _collect_names(self, text: str) -> bool:
+        """
+        Add names from one line of 'list' output to the pending snapshot
+        
+        Returns:
+            True if the line was consumed as part of the list
+        """
+        text = _GROUP_RE.sub('', text)
+        names = [name.strip() for name in text.split(',') if name.strip()]
+        if not names or not all(re.fullmatch(_NAME, name) for name in names):
+            # Not a name line - the list ended early, so take what we have
+            self._finish_list()
+            return False
+        
+        for name in names:
+            self._pending_list[name.lower()] = name
+        self._finish_list_if_complete()
+        return True
+    
+    def _finish_list_if_complete(self):
+        """Apply the pending snapshot once every announced player has been seen"""
+        if self._pending_list is not None and len(self._pending_list) >= self._pending_count:
+            self._finish_list()
+    
+    def _finish_list(self):
+        """Apply the pending 'list' snapshot to the roster"""
+        if self._pending_list is None:
+            return
+        if len(self._pending_list) >= self._pending_count:
+            self._players = self._pending_list
+        else:
+            # Truncated output - keep what we knew and add what we saw
+            self._players.update(self._pending_list)
+        self._pending_list = None
+        logger.info(f"Roster synced from 'list' ({len(self._players)} online)")
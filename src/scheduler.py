@@ -0,0 +1,460 @@
+"""
+Action scheduler for Admin Action Bot
+Timed actions (tempban expiry, scheduled freezes and announcements) kept in SQLite and
+served from one in-memory heap by a single timer task
+"""
+
+import asyncio
+import datetime
+import heapq
+import logging
+import os
+import re
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger('Scheduler')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_actions (
+    id TEXT PRIMARY KEY,
+    due_at REAL NOT NULL,
+    action TEXT NOT NULL,
+    player TEXT,
+    reason TEXT,
+    repeat REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    created_by_id INTEGER NOT NULL,
+    created_by_name TEXT NOT NULL,
+    note TEXT
+);
+"""
+
+_COLUMNS = (
+    'id', 'due_at', 'action', 'player', 'reason', 'repeat', 'attempts',
+    'created_at', 'created_by_id', 'created_by_name', 'note'
+)
+
+# Longest single sleep, so wall-clock changes (NTP, suspend) are noticed within a minute
+_MAX_SLEEP = 60.0
+
+_RELATIVE_RE = re.compile(r'^\+?((?:\d+[smhd])+)$')
+_RELATIVE_PART_RE = re.compile(r'(\d+)([smhd])')
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Called with a due job; returns an AdminBot.run_command()-style result
+JobRunner = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class ActionScheduler:
+    """Persistent timers for moderation actions, run by one task however many are pending"""
+    
+    def __init__(
+        self,
+        path: str,
+        run_job: JobRunner,
+        concurrency: int = 5,
+        batch_size: int = 100,
+        max_attempts: int = 3,
+        retry_delay: float = 60.0
+    ):
+        """
+        Initialize the scheduler
+        
+        Args:
+            path: SQLite database file
+            run_job: Runs a due job and returns its result (must not raise for panel failures)
+            concurrency: Due jobs run at once
+            batch_size: Due jobs started per pass before the timer task yields
+            max_attempts: Runs before a failing job is dropped
+            retry_delay: Seconds before a failed job is retried (multiplied by the attempt number)
+        """
+        self.path = path
+        self.run_job = run_job
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        
+        # Pending jobs by ID, a (due_at, id) heap over them, and (action, player) -> IDs.
+        # Cancelled or rescheduled jobs leave stale heap entries that are skipped when popped.
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._by_target: Dict[Tuple[str, str], Set[str]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Each due job runs in its own task so a slow panel call never holds back the timer
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._running: Set[asyncio.Task] = set()
+        self.executed = 0
+        self.failed = 0
+        
+        # sqlite3 connections are used from a single dedicated thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler")
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def __len__(self) -> int:
+        return len(self._jobs)
+    
+    async def start(self):
+        """Open the database, restore pending jobs and start the timer task"""
+        loop = asyncio.get_running_loop()
+        records = await loop.run_in_executor(self._executor, self._open)
+        for record in records:
+            self._add(record)
+        self._task = asyncio.create_task(self._run(), name="action-scheduler")
+        
+        overdue = sum(1 for record in records if record['due_at'] <= time.time())
+        logger.info(
+            f"Scheduler started with {len(records)} pending actions"
+            + (f" ({overdue} overdue, running now)" if overdue else "")
+        )
+    
+    async def stop(self):
+        """
+        Stop the timer task and close the database
+        
+        A job interrupted mid-run stays stored and runs again after the next start.
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        for task in self._running:
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=True)
+    
+    async def schedule(
+        self,
+        action: str,
+        due_at: float,
+        created_by: Tuple[int, str],
+        player: Optional[str] = None,
+        reason: Optional[str] = None,
+        repeat: Optional[float] = None,
+        note: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a timed action; it is on disk before this returns
+        
+        Args:
+            action: The action to run (unban, freeze, unfreeze, announce, etc.)
+            due_at: Unix time to run it at
+            created_by: (Discord ID, name) of whoever scheduled it, for the audit log
+            player: Target player, for player actions
+            reason: Reason, or the message for announcements
+            repeat: Seconds between runs for a recurring action (None runs once)
+            note: Why it was scheduled (e.g. 'tempban expiry')
+        
+        Returns:
+            The stored job
+        """
+        job = {
+            'id': uuid.uuid4().hex,
+            'due_at': due_at,
+            'action': action,
+            'player': player,
+            'reason': reason,
+            'repeat': repeat,
+            'attempts': 0,
+            'created_at': time.time(),
+            'created_by_id': created_by[0],
+            'created_by_name': created_by[1],
+            'note': note
+        }
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write, [job], [])
+        self._add(job)
+        logger.info(f"Scheduled {_describe(job)} for {_format_time(due_at)}")
+        return job
+    
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a pending job
+        
+        Args:
+            job_id: Full job ID, or an unambiguous prefix of one
+        
+        Returns:
+            The cancelled job, or None if no single pending job matched
+        """
+        job = self.find(job_id)
+        if job is None:
+            return None
+        self._discard(job)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write, [], [job['id']])
+        logger.info(f"Cancelled {_describe(job)}")
+        return job
+    
+    async def cancel_matching(self, action: str, player: str) -> int:
+        """
+        Cancel every pending job for an action on a player (e.g. the expiry unban after a permanent ban)
+        
+        Returns:
+            Number of jobs cancelled
+        """
+        ids = self._by_target.get((action, player.lower()))
+        if not ids:
+            return 0
+        jobs = [self._jobs[job_id] for job_id in list(ids)]
+        for job in jobs:
+            self._discard(job)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write, [], [job['id'] for job in jobs])
+        logger.info(f"Cancelled {len(jobs)} pending {action} for {player}")
+        return len(jobs)
+    
+    def find(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a pending job by ID or unambiguous ID prefix"""
+        job = self._jobs.get(job_id)
+        if job is not None or len(job_id) < 4:
+            return job
+        matches = [job for key, job in self._jobs.items() if key.startswith(job_id)]
+        return matches[0] if len(matches) == 1 else None
+    
+    def pending_for(self, action: str, player: str) -> List[Dict[str, Any]]:
+        """Pending jobs for an action on a player, soonest first"""
+        ids = self._by_target.get((action, player.lower()), ())
+        return sorted((self._jobs[job_id] for job_id in ids), key=lambda job: job['due_at'])
+    
+    def upcoming(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get the next pending jobs
+        
+        Args:
+            limit: Maximum jobs to return
+        
+        Returns:
+            Jobs in due order
+        """
+        return heapq.nsmallest(limit, self._jobs.values(), key=lambda job: job['due_at'])
+    
+    def _add(self, job: Dict[str, Any]):
+        self._jobs[job['id']] = job
+        if job['player']:
+            self._by_target.setdefault((job['action'], job['player'].lower()), set()).add(job['id'])
+        heapq.heappush(self._heap, (job['due_at'], job['id']))
+        # Only an earlier deadline changes how long the timer task should sleep
+        if self._heap[0][1] == job['id']:
+            self._wakeup.set()
+    
+    def _discard(self, job: Dict[str, Any]):
+        self._jobs.pop(job['id'], None)
+        if job['player']:
+            key = (job['action'], job['player'].lower())
+            ids = self._by_target.get(key)
+            if ids is not None:
+                ids.discard(job['id'])
+                if not ids:
+                    del self._by_target[key]
+    
+    async def _run(self):
+        """Sleep until the earliest job is due, then start everything that is due"""
+        while True:
+            # Skip heap entries for cancelled jobs and superseded due times
+            while self._heap:
+                due_at, job_id = self._heap[0]
+                job = self._jobs.get(job_id)
+                if job is not None and job['due_at'] == due_at:
+                    break
+                heapq.heappop(self._heap)
+            
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), min(delay, _MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            now = time.time()
+            started = 0
+            while self._heap and self._heap[0][0] <= now and started < self.batch_size:
+                due_at, job_id = heapq.heappop(self._heap)
+                job = self._jobs.get(job_id)
+                if job is not None and job['due_at'] == due_at:
+                    task = asyncio.create_task(self._dispatch(job), name=f"scheduled-{job['action']}")
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+                    started += 1
+            # Let the started jobs run before taking the next batch
+            await asyncio.sleep(0)
+    
+    async def _dispatch(self, job: Dict[str, Any]):
+        """Run one due job (waiting for a concurrency slot), then reschedule or delete it"""
+        try:
+            async with self._semaphore:
+                try:
+                    result = await self.run_job(job)
+                except Exception as e:
+                    logger.exception(f"Scheduled {_describe(job)} raised")
+                    result = {'success': False, 'error': str(e)}
+            success = bool(result.get('success'))
+            if not success:
+                logger.warning(f"Scheduled {_describe(job)} failed: {result.get('error', 'Unknown error')}")
+            
+            if job['id'] not in self._jobs:
+                # Cancelled while it was running
+                return
+            self._discard(job)
+            now = time.time()
+            if success:
+                self.executed += 1
+                if not job['repeat']:
+                    await self._persist([], [job['id']])
+                    return
+                # Next occurrence after now (missed occurrences while offline are skipped)
+                job = {**job, 'due_at': next_occurrence(job['due_at'], job['repeat'], now), 'attempts': 0}
+            else:
+                self.failed += 1
+                attempts = job['attempts'] + 1
+                if attempts >= self.max_attempts:
+                    logger.error(f"Giving up on scheduled {_describe(job)} after {attempts} attempts")
+                    await self._persist([], [job['id']])
+                    return
+                job = {**job, 'due_at': now + self.retry_delay * attempts, 'attempts': attempts}
+            self._add(job)
+            await self._persist([job], [])
+        except Exception:
+            logger.exception(f"Failed to run scheduled {_describe(job)}")
+    
+    async def _persist(self, upserts: List[Dict[str, Any]], deletes: List[str]):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write, upserts, deletes)
+    
+    # --- Everything below runs on the scheduler thread ---
+    
+    def _open(self) -> List[Dict[str, Any]]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        cursor = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM scheduled_actions")
+        return [dict(zip(_COLUMNS, row)) for row in cursor.fetchall()]
+    
+    def _close(self):
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+    
+    def _write(self, upserts: List[Dict[str, Any]], deletes: List[str]):
+        with self._conn:
+            if upserts:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO scheduled_actions ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                    [tuple(job[column] for column in _COLUMNS) for job in upserts]
+                )
+            if deletes:
+                self._conn.executemany(
+                    "DELETE FROM scheduled_actions WHERE id = ?",
+                    [(job_id,) for job_id in deletes]
+                )
+
+
+def next_occurrence(due_at: float, repeat: float, now: float) -> float:
+    """
+    Get the first run of a repeating action after now
+    
+    Repeats of whole days keep the local time of day, so a daily 03:00 action
+    still runs at 03:00 after a daylight saving change.
+    
+    Args:
+        due_at: Unix time of the run that just happened (or was missed)
+        repeat: Seconds between runs
+        now: Current Unix time
+    
+    Returns:
+        Unix time of the next run
+    """
+    if repeat % 86400 == 0:
+        step = datetime.timedelta(days=repeat // 86400)
+        # Naive local wall-clock time; timestamp() applies the offset in force on that date
+        when = datetime.datetime.fromtimestamp(due_at) + step
+        while when.timestamp() <= now:
+            when += step
+        return when.timestamp()
+    missed = max(1, int((now - due_at) // repeat) + 1)
+    return due_at + missed * repeat
+
+
+def parse_when(text: str, now: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """
+    Parse when a scheduled action should run
+    
+    Args:
+        text: A delay ('30m', '+2h', '1d12h'), a local time of day ('03:00', the next
+            occurrence) or a local date and time ('2025-01-31 18:00')
+        now: Current local time (default: now)
+    
+    Returns:
+        Timezone-aware datetime
+    
+    Raises:
+        ValueError: If the text is not in a supported format or is in the past
+    """
+    now = now or datetime.datetime.now().astimezone()
+    text = text.strip().lower()
+    
+    relative = _RELATIVE_RE.match(text)
+    if relative:
+        seconds = sum(int(amount) * _UNIT_SECONDS[unit] for amount, unit in _RELATIVE_PART_RE.findall(relative.group(1)))
+        if seconds <= 0:
+            raise ValueError("The delay must be greater than zero")
+        return now + datetime.timedelta(seconds=seconds)
+    
+    try:
+        clock = datetime.time.fromisoformat(text)
+    except ValueError:
+        clock = None
+    if clock is not None:
+        # Built from the local date so tomorrow's time gets tomorrow's UTC offset
+        today = now.astimezone().date()
+        for date in (today, today + datetime.timedelta(days=1)):
+            when = datetime.datetime.combine(date, clock.replace(microsecond=0)).astimezone()
+            if when > now:
+                return when
+    
+    try:
+        when = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(
+            f"Can't read '{text}' - use a delay like 30m or 2h, a time like 03:00, "
+            f"or a date and time like 2025-01-31 18:00"
+        ) from None
+    if when.tzinfo is None:
+        # Local time with the UTC offset in force on that date, not today's
+        when = when.astimezone()
+    if when <= now:
+        raise ValueError(f"{when:%Y-%m-%d %H:%M} is in the past")
+    return when
+
+
+def _describe(job: Dict[str, Any]) -> str:
+    return f"{job['action']}{' ' + job['player'] if job['player'] else ''} ({job['id'][:8]})"
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.datetime.fromtimestamp(timestamp).astimezone().isoformat(timespec='seconds')
@@ -0,0 +1,69 @@
+"""
+Persistent bot state for Admin Action Bot
+Small JSON key-value store for values that must survive restarts (message IDs, hashes)
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger('State')
+
+
+class BotState:
+    """JSON-backed key-value store, written atomically off the event loop"""
+    
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the store
+        
+        Args:
+            path: JSON file (None keeps state in memory only)
+        """
+        self.path = path
+        self._data: Dict[str, Any] = {}
+        # One write at a time, so an older snapshot can never replace a newer one
+        self._write_lock = asyncio.Lock()
+    
+    def load(self):
+        """Load state from disk, if there is any"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load bot state from {self.path}: {e}")
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+    
+    async def set(self, key: str, value: Any):
+        """
+        Store a value and persist the state file
+        
+        Args:
+            key: State key
+            value: JSON-serialisable value
+        """
+        if self._data.get(key) == value:
+            return
+        self._data[key] = value
+        if self.path:
+            async with self._write_lock:
+                try:
+                    # Snapshot taken under the lock: includes every set() made while waiting
+                    await asyncio.to_thread(self._write, dict(self._data))
+                except OSError as e:
+                    logger.error(f"Could not save bot state to {self.path}: {e}")
+    
+    def _write(self, data: Dict[str, Any]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
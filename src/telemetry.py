@@ -0,0 +1,236 @@
+"""
+Resource telemetry for Admin Action Bot
+Background poller that keeps recent panel resource samples in a fixed-size ring buffer
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence
+
+from .pterodactyl import PterodactylClient
+
+logger = logging.getLogger('Telemetry')
+
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+class ResourceSample(NamedTuple):
+    """One reading of the server's /resources endpoint"""
+    time: float  # Unix time the sample was taken
+    state: str  # running, starting, stopping or offline
+    cpu: float  # Percent of one core (can exceed 100)
+    memory_bytes: int
+    disk_bytes: int
+    network_rx_bytes: int
+    network_tx_bytes: int
+    uptime: float  # Seconds
+
+
+class ResourceMonitor:
+    """Polls server resources in the background, slowing down while the server is idle"""
+    
+    def __init__(
+        self,
+        client: PterodactylClient,
+        interval: float = 15.0,
+        idle_interval: float = 120.0,
+        idle_cpu: float = 5.0,
+        capacity: int = 480
+    ):
+        """
+        Initialize the monitor
+        
+        Args:
+            client: Panel client used to read resources
+            interval: Seconds between samples while the server is busy
+            idle_interval: Longest gap between samples while idle or unreachable
+            idle_cpu: CPU percent below which a running server counts as idle
+            capacity: Samples kept; the oldest is dropped once full
+        """
+        self.client = client
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.idle_cpu = idle_cpu
+        
+        # Ring buffer of samples, oldest first
+        self._samples: Deque[ResourceSample] = deque(maxlen=capacity)
+        self.current_interval = interval
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    @property
+    def capacity(self) -> int:
+        return self._samples.maxlen
+    
+    def latest(self) -> Optional[ResourceSample]:
+        """Get the most recent sample, if any"""
+        return self._samples[-1] if self._samples else None
+    
+    def window(self, seconds: float, now: Optional[float] = None) -> List[ResourceSample]:
+        """
+        Get the samples taken in the last `seconds`
+        
+        Args:
+            seconds: Window length
+            now: End of the window (default: now)
+        
+        Returns:
+            Samples in the window, oldest first
+        """
+        cutoff = (time.time() if now is None else now) - seconds
+        samples = []
+        for sample in reversed(self._samples):
+            if sample.time < cutoff:
+                break
+            samples.append(sample)
+        samples.reverse()
+        return samples
+    
+    def trend(self, field: str, seconds: float) -> Optional[Dict[str, float]]:
+        """
+        Summarise one field over a recent window
+        
+        Args:
+            field: ResourceSample field (cpu, memory_bytes, disk_bytes, ...)
+            seconds: Window length
+        
+        Returns:
+            Dict with 'min', 'max', 'avg', 'change' (last minus first) and 'samples',
+            or None if there are no samples in the window
+        """
+        values = [getattr(sample, field) for sample in self.window(seconds)]
+        if not values:
+            return None
+        return {
+            'min': min(values),
+            'max': max(values),
+            'avg': sum(values) / len(values),
+            'change': values[-1] - values[0],
+            'samples': len(values)
+        }
+    
+    async def poll(self) -> Optional[ResourceSample]:
+        """
+        Take one sample from the panel and store it
+        
+        Returns:
+            The new sample, or None if the panel could not be read
+        """
+        result = await self.client.refresh_server_status()
+        if not result['success']:
+            self.failures += 1
+            self.last_error = result.get('error')
+            return None
+        
+        data = result['data']
+        resources = data.get('resources', {})
+        sample = ResourceSample(
+            time=time.time(),
+            state=data.get('current_state', 'unknown'),
+            cpu=float(resources.get('cpu_absolute') or 0.0),
+            memory_bytes=int(resources.get('memory_bytes') or 0),
+            disk_bytes=int(resources.get('disk_bytes') or 0),
+            network_rx_bytes=int(resources.get('network_rx_bytes') or 0),
+            network_tx_bytes=int(resources.get('network_tx_bytes') or 0),
+            uptime=(resources.get('uptime') or 0) / 1000
+        )
+        self._samples.append(sample)
+        self.last_error = None
+        return sample
+    
+    def is_idle(self, sample: ResourceSample) -> bool:
+        """Whether a sample shows a stopped server or one doing next to nothing"""
+        return sample.state != 'running' or sample.cpu < self.idle_cpu
+    
+    def _next_interval(self, sample: Optional[ResourceSample]) -> float:
+        """Base interval while busy; doubling up to idle_interval while idle or unreachable"""
+        if sample is not None and not self.is_idle(sample):
+            return self.interval
+        return min(self.idle_interval, self.current_interval * 2)
+    
+    def start(self):
+        """Start sampling in the background"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="resource-monitor")
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        while True:
+            sample = None
+            try:
+                sample = await self.poll()
+            except Exception:
+                logger.exception("Resource poll failed")
+            interval = self._next_interval(sample)
+            if interval != self.current_interval:
+                logger.debug(f"Resource poll interval now {interval:g}s")
+            self.current_interval = interval
+            await asyncio.sleep(interval)
+
+
+def sparkline(values: Sequence[float], width: int = 24) -> str:
+    """
+    Draw values as a row of block characters
+    
+    Args:
+        values: Values oldest first
+        width: Maximum characters; longer series are averaged into buckets
+    
+    Returns:
+        Text such as "▁▂▄▇█▅"
+    """
+    if not values:
+        return ""
+    if len(values) > width:
+        step = len(values) / width
+        values = [
+            sum(bucket) / len(bucket)
+            for bucket in (values[int(i * step):int((i + 1) * step)] for i in range(width))
+            if bucket
+        ]
+    low, high = min(values), max(values)
+    span = high - low
+    top = len(_SPARK_BLOCKS) - 1
+    return "".join(
+        _SPARK_BLOCKS[round((value - low) / span * top) if span else 0]
+        for value in values
+    )
+
+
+def format_bytes(value: float) -> str:
+    """Format a byte count with a binary unit (e.g. '1.50 GiB')"""
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.2f} {unit}"
+        value /= 1024
+    return f"{value:.2f} TiB"
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '2d 3h', '3h 12m' or '45s'"""
+    seconds = int(seconds)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
@@ -0,0 +1,128 @@
+"""
+Console command templates for Admin Action Bot
+Templates are parsed and checked once at load, then rendered with sanitised values
+"""
+
+import re
+import string
+from typing import FrozenSet, Optional
+
+# Placeholders a template may use
+TEMPLATE_FIELDS = frozenset({'player', 'reason', 'duration'})
+
+# Control characters (newlines included) would let a value start a second console command
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f\u2028\u2029]+')
+# Minecraft usernames, optionally prefixed with '.' or '*' for Bedrock players (Geyser/Floodgate).
+# Nothing else may reach a console command: selectors such as '@a' would target every player
+_PLAYER_NAME_RE = re.compile(r'[.*]?\w{1,16}')
+
+
+class CommandTemplate:
+    """A console command template compiled into literal text and placeholder slots"""
+    
+    __slots__ = ('action', 'source', 'fields', '_format')
+    
+    def __init__(self, action: str, source: str, allowed_fields: FrozenSet[str] = TEMPLATE_FIELDS):
+        """
+        Parse and check a template
+        
+        Args:
+            action: The moderation action the template belongs to
+            source: Template text, e.g. 'kick {player} {reason}'
+            allowed_fields: Placeholders this action supplies
+        
+        Raises:
+            ValueError: If the template is malformed or uses an unsupported placeholder
+        """
+        self.action = action
+        self.source = source
+        
+        try:
+            parsed = list(string.Formatter().parse(source))
+        except ValueError as e:
+            raise ValueError(f"Command template for '{action}' is malformed ({e}): '{source}'") from None
+        
+        # Compiled to a %-style mapping format: rendering is one C-level pass with no re-parsing
+        compiled = []
+        fields = set()
+        for literal, field, format_spec, conversion in parsed:
+            compiled.append(literal.replace('%', '%%'))
+            if field is None:
+                continue
+            if field not in allowed_fields:
+                allowed = ", ".join(f"{{{name}}}" for name in sorted(allowed_fields)) or "none"
+                raise ValueError(
+                    f"Command template for '{action}' uses unknown placeholder {{{field}}} "
+                    f"(allowed: {allowed}): '{source}'"
+                )
+            if format_spec or conversion:
+                raise ValueError(
+                    f"Command template for '{action}' may not use format specs or conversions "
+                    f"in {{{field}}}: '{source}'"
+                )
+            compiled.append(f"%({field})s")
+            fields.add(field)
+        
+        self.fields: FrozenSet[str] = frozenset(fields)
+        self._format = "".join(compiled)
+    
+    def render(
+        self,
+        player: Optional[str] = None,
+        reason: Optional[str] = None,
+        duration: Optional[int] = None
+    ) -> str:
+        """
+        Build the console command
+        
+        Args:
+            player: Target player (must be a single token)
+            reason: Free-text reason (control characters are replaced with spaces)
+            duration: Duration in minutes
+        
+        Returns:
+            The command, with unused trailing whitespace removed
+        
+        Raises:
+            ValueError: If a value cannot be placed in a console command safely,
+                or the template uses {duration} and none was given
+        """
+        fields = self.fields
+        if duration is None and 'duration' in fields:
+            # Would otherwise render e.g. 'tempban Steve m' - a different command entirely
+            raise ValueError(f"Command template for '{self.action}' needs a duration")
+        return (self._format % {
+            'player': sanitize_player(player) if 'player' in fields else '',
+            'reason': sanitize_reason(reason) if 'reason' in fields else '',
+            'duration': int(duration) if 'duration' in fields else ''
+        }).rstrip()
+    
+    def __repr__(self) -> str:
+        return f"CommandTemplate({self.action!r}, {self.source!r})"
+
+
+def is_valid_player_name(player: Optional[str]) -> bool:
+    """Whether a name is safe to place in a console command as a player"""
+    return bool(player) and _PLAYER_NAME_RE.fullmatch(player) is not None
+
+
+def sanitize_player(player: Optional[str]) -> str:
+    """
+    Check that a player name is a plain Minecraft username
+    
+    Raises:
+        ValueError: If the name is empty, too long, or contains anything but letters,
+            digits and underscores (after an optional Bedrock '.' or '*' prefix)
+    """
+    if not is_valid_player_name(player):
+        raise ValueError(f"Invalid player name: {player!r}")
+    return player
+
+
+def sanitize_reason(reason: Optional[str]) -> str:
+    """Collapse control characters (including newlines) in a reason to single spaces"""
+    if not reason:
+        return ''
+    if reason.isprintable():
+        return reason.strip()
+    return _CONTROL_CHARS_RE.sub(' ', reason).strip()
@@ -0,0 +1,149 @@
+"""
+Interaction tracing for Admin Action Bot
+Lightweight per-interaction spans on monotonic time, emitted as JSON log records
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger('Trace')
+
+_current: contextvars.ContextVar[Optional['InteractionTrace']] = contextvars.ContextVar('interaction_trace', default=None)
+
+
+class InteractionTrace:
+    """Timeline of one interaction: named spans relative to when handling began"""
+    
+    def __init__(self, tracer: 'Tracer', name: str, interaction: Optional[discord.Interaction] = None):
+        """
+        Start a trace
+        
+        Args:
+            tracer: Decides whether and how the finished trace is logged
+            name: What is being handled (e.g. 'admin_panel', 'modal_submit:kick')
+            interaction: The Discord interaction, for its ID, user and age
+        """
+        self.tracer = tracer
+        self.name = name
+        self.started = time.monotonic()
+        self.spans: List[Tuple[str, float, float]] = []
+        self.attributes: Dict[str, Any] = {}
+        self._handed_off = False
+        self._finished = False
+        
+        if interaction is not None:
+            self.attributes['interaction_id'] = interaction.id
+            self.attributes['user_id'] = interaction.user.id if interaction.user else None
+            # How old the interaction already was when we got it (Discord clock vs ours)
+            age = discord.utils.utcnow() - interaction.created_at
+            self.attributes['discord_age_ms'] = round(age.total_seconds() * 1000, 1)
+    
+    def add_span(self, stage: str, start: float, end: float):
+        """Record a stage from absolute time.monotonic() values"""
+        self.spans.append((stage, start - self.started, end - start))
+    
+    def handoff(self):
+        """Hand the trace to another task (e.g. an executor job), which will finish it"""
+        self._handed_off = True
+    
+    def finish(self, status: str = 'ok'):
+        """Close the trace and emit it (only the first call counts)"""
+        if self._finished:
+            return
+        self._finished = True
+        self.tracer.emit(self, time.monotonic() - self.started, status)
+    
+    def to_record(self, total: float, status: str) -> Dict[str, Any]:
+        return {
+            'trace': self.name,
+            'status': status,
+            'total_ms': round(total * 1000, 1),
+            **self.attributes,
+            'spans': [
+                {'stage': stage, 'start_ms': round(offset * 1000, 1), 'duration_ms': round(duration * 1000, 1)}
+                for stage, offset, duration in self.spans
+            ]
+        }
+
+
+class Tracer:
+    """Creates interaction traces and logs them as JSON"""
+    
+    def __init__(self, log_all: bool = False, slow_threshold: float = 2.0):
+        """
+        Initialize the tracer
+        
+        Args:
+            log_all: Log every finished trace at INFO
+            slow_threshold: Seconds after which a trace's full breakdown is logged as a warning (0 disables)
+        """
+        self.log_all = log_all
+        self.slow_threshold = slow_threshold
+        self.slow_count = 0
+    
+    @contextlib.asynccontextmanager
+    async def interaction(self, name: str, interaction: Optional[discord.Interaction] = None) -> AsyncIterator[InteractionTrace]:
+        """
+        Trace the handling of one interaction in the current task
+        
+        The trace is finished on exit unless handoff() was called, in which case
+        whoever took it over finishes it.
+        """
+        trace = InteractionTrace(self, name, interaction)
+        token = _current.set(trace)
+        status = 'ok'
+        try:
+            yield trace
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            _current.reset(token)
+            if not trace._handed_off:
+                trace.finish(status)
+    
+    def emit(self, trace: InteractionTrace, total: float, status: str):
+        slow = self.slow_threshold > 0 and total >= self.slow_threshold
+        if not (slow or self.log_all):
+            return
+        record = json.dumps(trace.to_record(total, status), default=str)
+        if slow:
+            self.slow_count += 1
+            logger.warning(f"Slow interaction ({total:.2f}s): {record}")
+        else:
+            logger.info(record)
+
+
+def current() -> Optional[InteractionTrace]:
+    """The trace of the interaction being handled in this context, if any"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def activate(trace: Optional[InteractionTrace]) -> Iterator[None]:
+    """Make a handed-off trace current in another task (e.g. an executor worker)"""
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time a stage of the current interaction; does nothing outside a trace"""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.add_span(stage, start, time.monotonic())
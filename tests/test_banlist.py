@@ -0,0 +1,97 @@
+"""Tests for the ban-list index and the bot's not-yet-written bans"""
+
+import json
+
+import pytest
+
+from src.banlist import BanList
+
+
+class FilesStub:
+    """Stands in for PterodactylClient's files API, serving one banned-players.json"""
+    
+    def __init__(self):
+        self.records = []
+        self.version = 0
+        # Panel clock far ahead of ours - must not matter
+        self.modified_at = '2099-01-01T00:00:00+00:00'
+    
+    def write(self, *records):
+        self.records = list(records)
+        self.version += 1
+    
+    async def get_file_info(self, path):
+        return {'success': True, 'modified_at': self.modified_at, 'size': self.version}
+    
+    async def get_file_contents(self, path, etag=None):
+        return {'success': True, 'content': json.dumps(self.records), 'etag': str(self.version)}
+
+
+def record(name, expires='forever'):
+    return {
+        'name': name, 'reason': 'Banned', 'source': 'Server',
+        'created': '2025-01-01 00:00:00 +0000', 'expires': expires
+    }
+
+
+@pytest.fixture
+def files():
+    return FilesStub()
+
+
+@pytest.fixture
+def bans(files):
+    return BanList(files, refresh_interval=60.0)
+
+
+async def test_load_and_lookup(bans, files):
+    files.write(record('Steve'), record('Alex', '2000-01-01 00:00:00 +0000'))
+    assert await bans.refresh()
+    assert bans.get('steve')['name'] == 'Steve'
+    # Expired tempbans are not current bans
+    assert 'Alex' not in bans
+    assert [entry['name'] for entry in bans.entries()] == ['Steve']
+
+
+async def test_unchanged_file_is_not_downloaded_again(bans, files):
+    files.write(record('Steve'))
+    assert await bans.refresh()
+    assert not await bans.refresh()
+
+
+async def test_bot_ban_survives_refresh_until_file_shows_it(bans, files):
+    files.write(record('Alex'))
+    await bans.refresh()
+    bans.record_ban('Steve', reason='griefing')
+    
+    # The file changed for another reason, but the panel has not written Steve yet
+    files.write(record('Alex'), record('Notch'))
+    await bans.refresh()
+    assert 'Steve' in bans
+    
+    files.write(record('Alex'), record('Notch'), record('Steve'))
+    await bans.refresh()
+    assert 'Steve' in bans
+    assert not bans._overlay
+
+
+async def test_bot_unban_survives_refresh_until_file_shows_it(bans, files):
+    files.write(record('Steve'), record('Alex'))
+    await bans.refresh()
+    bans.record_unban('Steve')
+    
+    files.write(record('Steve'), record('Alex'), record('Notch'))
+    await bans.refresh()
+    assert 'Steve' not in bans
+    
+    files.write(record('Alex'), record('Notch'))
+    await bans.refresh()
+    assert not bans._overlay
+
+
+async def test_ban_undone_elsewhere_is_dropped_after_overlay_ttl(files):
+    bans = BanList(files, refresh_interval=60.0, overlay_ttl=0.0)
+    bans.record_ban('Steve')
+    files.write(record('Alex'))
+    await bans.refresh()
+    assert 'Steve' not in bans
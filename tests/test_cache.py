@@ -0,0 +1,100 @@
+"""Tests for the single-flight TTL cache"""
+
+import asyncio
+
+import pytest
+
+from src.cache import TTLCache
+
+
+class Loader:
+    """Counts loads; each one takes a little while and returns the load number"""
+    
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.calls = 0
+    
+    async def __call__(self):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        return {'success': True, 'load': call}
+
+
+async def test_concurrent_misses_share_one_load():
+    cache, loader = TTLCache(ttl=10.0), Loader()
+    results = await asyncio.gather(*(cache.get('status', loader) for _ in range(5)))
+    assert loader.calls == 1
+    assert all(result['load'] == 1 for result in results)
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['coalesced'] == 4
+
+
+async def test_fresh_value_is_a_hit():
+    cache, loader = TTLCache(ttl=10.0), Loader()
+    await cache.get('status', loader)
+    assert (await cache.get('status', loader))['load'] == 1
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['hit_rate'] == pytest.approx(0.5)
+
+
+async def test_stale_value_is_served_while_one_refresh_runs():
+    cache, loader = TTLCache(ttl=0.01, stale_ttl=10.0), Loader()
+    await cache.get('status', loader)
+    await asyncio.sleep(0.02)
+    
+    # Both get the stale value at once; only one background refresh starts
+    stale = await asyncio.gather(cache.get('status', loader), cache.get('status', loader))
+    assert [result['load'] for result in stale] == [1, 1]
+    assert cache.stats()['stale_hits'] == 2
+    
+    await asyncio.sleep(0.05)
+    assert loader.calls == 2
+    assert cache.peek('status')['load'] == 2
+
+
+async def test_expired_value_is_loaded_again():
+    cache, loader = TTLCache(ttl=0.01, stale_ttl=0.0), Loader()
+    await cache.get('status', loader)
+    await asyncio.sleep(0.02)
+    assert (await cache.get('status', loader))['load'] == 2
+    assert cache.stats()['misses'] == 2
+
+
+async def test_fresh_bypasses_cache_but_stores_result():
+    cache, loader = TTLCache(ttl=10.0), Loader()
+    await cache.get('status', loader)
+    assert (await cache.get('status', loader, fresh=True))['load'] == 2
+    assert cache.peek('status')['load'] == 2
+
+
+async def test_failures_are_not_cached():
+    cache = TTLCache(ttl=10.0, should_cache=lambda result: result['success'])
+    
+    async def failing():
+        return {'success': False}
+    
+    await cache.get('status', failing)
+    assert cache.peek('status') is None
+
+
+async def test_refresh_joins_load_without_counting():
+    cache, loader = TTLCache(ttl=10.0), Loader()
+    results = await asyncio.gather(cache.get('status', loader), cache.refresh('status', loader))
+    assert loader.calls == 1
+    assert results[0] is results[1]
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['coalesced'] == 0
+
+
+async def test_cancelled_caller_does_not_cancel_shared_load():
+    cache, loader = TTLCache(ttl=10.0), Loader(delay=0.05)
+    first = asyncio.create_task(cache.get('status', loader))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(cache.get('status', loader))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    
+    assert (await second)['load'] == 1
+    assert loader.calls == 1
@@ -0,0 +1,119 @@
+"""Tests for the panel circuit breaker and its half-open probe"""
+
+import json
+
+import aiohttp
+import pytest
+
+from src.pterodactyl import CircuitBreaker, PanelResponse, PterodactylClient
+
+STATUS_BODY = json.dumps({'attributes': {'current_state': 'running', 'resources': {}}})
+
+
+class FakePanel:
+    """Replaces PterodactylClient._send, answering or failing every request"""
+    
+    def __init__(self):
+        self.up = True
+        self.requests = []
+    
+    async def send(self, method, url, timeout, **kwargs):
+        self.requests.append((method, url))
+        if not self.up:
+            raise aiohttp.ClientConnectionError("Connection refused")
+        if url.endswith('/resources'):
+            return PanelResponse(200, STATUS_BODY, 0.0)
+        return PanelResponse(204, '', 0.0)
+
+
+@pytest.fixture
+def panel():
+    return FakePanel()
+
+
+@pytest.fixture
+def client(panel):
+    client = PterodactylClient(
+        'https://panel.example', 'key', 'abcd1234',
+        max_retries=0, circuit_failure_threshold=2, circuit_reset_timeout=30.0
+    )
+    client._send = panel.send
+    return client
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert 9.0 < breaker.retry_in() <= 10.0
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.retry_in() == 0.0
+
+
+def test_failed_probe_reopens_immediately():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10.0)
+    breaker.state = CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+async def test_open_circuit_fails_fast(client, panel):
+    panel.up = False
+    for _ in range(2):
+        assert not (await client.send_command('say hi'))['success']
+    assert client.circuit.state == CircuitBreaker.OPEN
+    
+    sent = len(panel.requests)
+    result = await client.send_command('say hi')
+    assert not result['success']
+    assert "failing fast" in result['error']
+    assert len(panel.requests) == sent
+
+
+async def test_probe_after_cooldown_closes_circuit(client, panel):
+    panel.up = False
+    for _ in range(2):
+        await client.send_command('say hi')
+    client.circuit._opened_at -= 31
+    panel.up = True
+    
+    assert (await client.send_command('say hi'))['success']
+    assert client.circuit.state == CircuitBreaker.CLOSED
+    # The probe read the status directly, then the command went through
+    assert [url.rsplit('/', 1)[-1] for _, url in panel.requests[-2:]] == ['resources', 'command']
+    # and its result refreshed the status cache without counting as a lookup
+    assert client.status_cache.peek('abcd1234')['success']
+    assert client.status_cache.stats()['misses'] == 0
+
+
+async def test_failed_probe_keeps_failing_fast(client, panel):
+    panel.up = False
+    for _ in range(2):
+        await client.send_command('say hi')
+    client.circuit._opened_at -= 31
+    
+    assert not (await client.send_command('say hi'))['success']
+    assert client.circuit.state == CircuitBreaker.OPEN
+    assert client.circuit.retry_in() > 29
+
+
+async def test_probe_is_not_blocked_by_a_status_load(client, panel):
+    panel.up = False
+    for _ in range(2):
+        await client.send_command('say hi')
+    client.circuit._opened_at -= 31
+    panel.up = True
+    
+    # A status read after the cooldown runs the probe from inside the cache's shared load
+    assert (await client.get_server_status())['success']
+    assert client.circuit.state == CircuitBreaker.CLOSED
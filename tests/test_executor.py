@@ -0,0 +1,146 @@
+"""Tests for the action executor's coalescing of identical commands"""
+
+import asyncio
+
+import pytest
+
+from src.executor import ActionExecutor
+
+
+class PanelStub:
+    """Stands in for AdminBot.run_command, counting the commands that reach the panel"""
+    
+    def __init__(self, delay: float = 0.05, success: bool = True):
+        self.delay = delay
+        self.success = success
+        self.calls = []
+    
+    async def run_command(self, action, command):
+        self.calls.append(command)
+        await asyncio.sleep(self.delay)
+        if self.success:
+            return {'success': True, 'message': f"Ran {command}"}
+        return {'success': False, 'error': "Panel unavailable"}
+
+
+class Recorder:
+    """Collects the results passed to a reply or audit handler"""
+    
+    def __init__(self):
+        self.results = []
+    
+    async def __call__(self, result):
+        self.results.append(result)
+
+
+async def settle(executor):
+    """Wait until every submitted job has replied, audited and been released"""
+    await asyncio.wait_for(executor._queue.join(), 1.0)
+    await asyncio.sleep(0)
+
+
+@pytest.fixture
+def panel():
+    return PanelStub()
+
+
+@pytest.fixture
+async def executor(panel):
+    executor = ActionExecutor(panel.run_command, workers=2)
+    executor.start()
+    yield executor
+    await executor.stop(timeout=1.0)
+
+
+async def test_in_flight_duplicates_share_one_command(executor, panel):
+    replies = [Recorder() for _ in range(3)]
+    audit = Recorder()
+    
+    first = executor.submit('kick', 'kick Steve', reply=replies[0], audit=audit, key='kick Steve', requester='mod-a')
+    for n, reply in enumerate(replies[1:], start=1):
+        job = executor.submit('kick', 'kick Steve', reply=reply, audit=Recorder(), key='kick Steve', requester=f"mod-{n}")
+        assert job is first
+    await settle(executor)
+    
+    assert panel.calls == ['kick Steve']
+    assert replies[0].results[0]['success']
+    assert [reply.results[0]['duplicate_of'] for reply in replies[1:]] == [first.id, first.id]
+    # One audit entry names everyone who joined
+    assert audit.results[0]['coalesced'] == ['mod-1', 'mod-2']
+    assert executor.coalesced == 2
+
+
+async def test_repeat_after_completion_runs_again(executor, panel):
+    # freeze -> unfreeze -> freeze must freeze the game again, not reuse the first result
+    for command in ('tick freeze', 'tick unfreeze', 'tick freeze'):
+        job = executor.submit(command.split()[1], command, key=command)
+        assert (await job.wait(1.0))['success']
+        await settle(executor)
+    assert panel.calls == ['tick freeze', 'tick unfreeze', 'tick freeze']
+    assert executor.coalesced == 0
+
+
+async def test_submit_after_result_is_not_joined(executor, panel):
+    job = executor.submit('ban', 'ban Steve', key='ban Steve')
+    await job.wait(1.0)
+    # The command has returned, even if the reply and audit are still being written
+    again = executor.submit('ban', 'ban Steve', key='ban Steve')
+    assert again is not job
+    await settle(executor)
+    assert panel.calls == ['ban Steve', 'ban Steve']
+
+
+async def test_joiners_audit_handler_is_never_called(executor, panel):
+    audit, joiner_audit = Recorder(), Recorder()
+    executor.submit('kick', 'kick Steve', audit=audit, key='kick Steve', requester='mod-a')
+    executor.submit('kick', 'kick Steve', reply=Recorder(), audit=joiner_audit, key='kick Steve', requester='mod-b')
+    await settle(executor)
+    
+    assert len(audit.results) == 1
+    assert audit.results[0]['coalesced'] == ['mod-b']
+    assert joiner_audit.results == []
+
+
+async def test_failed_action_is_not_reused(executor, panel):
+    panel.success = False
+    job = executor.submit('ban', 'ban Steve', key='ban Steve')
+    assert not (await job.wait(1.0))['success']
+    await settle(executor)
+    
+    panel.success = True
+    retry = executor.submit('ban', 'ban Steve', key='ban Steve')
+    assert retry is not job
+    assert (await retry.wait(1.0))['success']
+    assert panel.calls == ['ban Steve', 'ban Steve']
+
+
+async def test_command_exception_becomes_failed_result(executor, panel):
+    async def broken(action, command):
+        raise RuntimeError("boom")
+    executor.run_command = broken
+    
+    reply = Recorder()
+    job = executor.submit('kick', 'kick Steve', reply=reply, key='kick Steve')
+    result = await job.wait(1.0)
+    await settle(executor)
+    
+    assert result == {'success': False, 'error': "Internal error: boom"}
+    assert reply.results == [result]
+    assert executor.submit('kick', 'kick Steve', key='kick Steve') is not job
+
+
+async def test_unkeyed_jobs_never_coalesce(executor, panel):
+    jobs = [executor.submit('freeze', 'tick freeze') for _ in range(2)]
+    await asyncio.gather(*(job.wait(1.0) for job in jobs))
+    assert jobs[0] is not jobs[1]
+    assert panel.calls == ['tick freeze', 'tick freeze']
+
+
+async def test_failing_reply_does_not_stop_audit(executor, panel):
+    async def expired(result):
+        raise RuntimeError("Unknown interaction")
+    audit = Recorder()
+    
+    job = executor.submit('kick', 'kick Steve', reply=expired, audit=audit)
+    await settle(executor)
+    assert audit.results[0]['success']
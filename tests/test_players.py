@@ -0,0 +1,68 @@
+"""Tests for the recent-players LRU, its prefix index and snapshots"""
+
+import json
+
+import pytest
+
+from src.players import RecentPlayers
+
+
+def test_most_recent_first():
+    players = RecentPlayers(capacity=5)
+    for name in ('Steve', 'Alex', 'Notch'):
+        players.add(name)
+    players.add('steve')
+    # Re-adding moves to most recent and keeps the latest capitalisation
+    assert list(players.most_recent()) == ['steve', 'Notch', 'Alex']
+    assert list(players.most_recent(2)) == ['steve', 'Notch']
+    assert len(players) == 3
+
+
+def test_least_recent_is_evicted_from_cache_and_index():
+    players = RecentPlayers(capacity=2)
+    for name in ('Steve', 'Alex', 'Notch'):
+        players.add(name)
+    assert 'Steve' not in players
+    assert list(players.most_recent()) == ['Notch', 'Alex']
+    assert players.search('s') == []
+    assert players._index == ['alex', 'notch']
+
+
+def test_search_is_case_insensitive_prefix_in_alphabetical_order():
+    players = RecentPlayers()
+    for name in ('stevo', 'Steve', 'Alex', 'STEPH'):
+        players.add(name)
+    assert players.search('STE') == ['STEPH', 'Steve', 'stevo']
+    assert players.search('ste', limit=2) == ['STEPH', 'Steve']
+    assert players.search('x') == []
+
+
+async def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / 'recent.json'
+    players = RecentPlayers(capacity=3, path=str(path))
+    for name in ('Steve', 'Alex', 'Notch'):
+        players.add(name)
+    await players.save()
+    
+    restored = RecentPlayers(capacity=2, path=str(path))
+    restored.load()
+    assert list(restored.most_recent()) == ['Notch', 'Alex']
+    # Nothing changed since loading, so nothing to write
+    assert not restored._dirty
+
+
+@pytest.mark.parametrize('content', ['{"Steve": 1}', '"Steve"', '42', 'null', 'not json'])
+def test_malformed_snapshot_is_ignored(tmp_path, content):
+    path = tmp_path / 'recent.json'
+    path.write_text(content)
+    players = RecentPlayers(path=str(path))
+    players.load()
+    assert len(players) == 0
+
+
+def test_invalid_snapshot_entries_are_skipped(tmp_path):
+    path = tmp_path / 'recent.json'
+    path.write_text(json.dumps(['Steve', 7, None, ['Alex'], '', 'x' * 40, 'Notch']))
+    players = RecentPlayers(path=str(path))
+    players.load()
+    assert list(players.most_recent()) == ['Notch', 'Steve']
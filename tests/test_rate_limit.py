@@ -0,0 +1,96 @@
+"""Tests for the client-side rate limiter and 429 handling"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.pterodactyl import PterodactylClient, TokenBucket
+
+
+async def test_burst_then_sustained_rate():
+    bucket = TokenBucket(rate=20.0, burst=3)
+    started = time.monotonic()
+    waits = [await bucket.acquire() for _ in range(5)]
+    
+    # Three back-to-back, then one token per 50ms
+    assert all(wait < 0.01 for wait in waits[:3])
+    assert time.monotonic() - started == pytest.approx(0.1, abs=0.03)
+
+
+async def test_tokens_are_handed_out_in_arrival_order():
+    bucket = TokenBucket(rate=50.0, burst=1)
+    order = []
+    
+    async def take(n):
+        await bucket.acquire()
+        order.append(n)
+    
+    await asyncio.gather(*(take(n) for n in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_pause_holds_back_callers_and_accrues_nothing():
+    bucket = TokenBucket(rate=10.0, burst=5)
+    started = time.monotonic()
+    bucket.pause(0.2)
+    
+    await bucket.acquire()
+    first = time.monotonic() - started
+    await bucket.acquire()
+    second = time.monotonic() - started
+    
+    # The first token only refills after the pause, and the bucket starts empty
+    assert first == pytest.approx(0.3, abs=0.03)
+    assert second == pytest.approx(0.4, abs=0.03)
+
+
+@pytest.fixture
+async def panel():
+    """Panel answering the first two commands with 429 and Retry-After, then accepting"""
+    commands = []
+    
+    async def command(request):
+        commands.append(time.monotonic())
+        if len(commands) <= 2:
+            return web.Response(status=429, headers={'Retry-After': '0.1'})
+        return web.Response(status=204)
+    
+    app = web.Application()
+    app.router.add_post('/api/client/servers/{server}/command', command)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, commands
+    await server.close()
+
+
+async def test_429_is_requeued_after_retry_after(panel):
+    server, commands = panel
+    client = PterodactylClient(str(server.make_url('')), 'key', 'abcd1234', rate_limit=100.0)
+    try:
+        result = await client.send_command('say hi')
+    finally:
+        await client.close()
+    
+    assert result['success']
+    assert len(commands) == 3
+    # Each retry waited out the Retry-After pause
+    assert commands[1] - commands[0] >= 0.09
+    assert commands[2] - commands[1] >= 0.09
+    assert result['queue_wait'] >= 0.18
+
+
+async def test_429_gives_up_after_max_retries(panel):
+    server, commands = panel
+    client = PterodactylClient(
+        str(server.make_url('')), 'key', 'abcd1234', rate_limit=100.0, max_rate_limit_retries=1
+    )
+    try:
+        result = await client.send_command('say hi')
+    finally:
+        await client.close()
+    
+    assert not result['success']
+    assert len(commands) == 2
@@ -0,0 +1,104 @@
+"""Tests for the online player roster's console parsing"""
+
+import pytest
+
+from src.roster import PlayerRoster
+
+
+class ConsoleStub:
+    """Stands in for ConsoleStream, recording commands sent to the server"""
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def send_command(self, command: str) -> bool:
+        self.sent.append(command)
+        return True
+
+
+@pytest.fixture
+def console():
+    return ConsoleStub()
+
+
+@pytest.fixture
+def roster(console):
+    return PlayerRoster(console)
+
+
+def test_join_and_leave(roster):
+    roster.handle_line("[12:00:00 INFO]: Steve joined the game")
+    roster.handle_line("[12:00:01] [Server thread/INFO]: .Bedrock joined the game")
+    assert roster.get_online_players() == ['.Bedrock', 'Steve']
+    
+    roster.handle_line("[12:00:02 INFO]: steve left the game")
+    assert roster.get_online_players() == ['.Bedrock']
+    assert 'BEDROCK' not in roster
+    assert '.bedrock' in roster
+
+
+def test_colour_codes_are_ignored(roster):
+    roster.handle_line("\x1b[33;1m[12:00:00 INFO]: §eSteve joined the game\x1b[m")
+    assert 'Steve' in roster
+
+
+def test_chat_is_not_a_join(roster):
+    roster.handle_line("[12:00:00 INFO]: <Steve> Alex joined the game")
+    assert len(roster) == 0
+
+
+@pytest.mark.parametrize('line', [
+    "[12:00:00 INFO]: There are 2 of a max of 20 players online: Steve, Alex",
+    "[12:00:00 INFO]: There are 2/20 players online: Steve, Alex",
+    "[12:00:00 INFO]: There are 2 out of maximum 20 players online. Steve, Alex",
+])
+def test_list_replaces_roster(roster, line):
+    roster.handle_line("[11:59:00 INFO]: Notch joined the game")
+    roster.handle_line(line)
+    assert roster.get_online_players() == ['Alex', 'Steve']
+
+
+def test_empty_list_clears_roster(roster):
+    roster.handle_line("[11:59:00 INFO]: Notch joined the game")
+    roster.handle_line("[12:00:00 INFO]: There are 0 of a max of 20 players online:")
+    assert len(roster) == 0
+
+
+def test_multi_line_grouped_list(roster):
+    # Permission plugins print one line per group after the header
+    roster.handle_line("[12:00:00 INFO]: There are 3 of a max of 20 players online.")
+    assert len(roster) == 0
+    roster.handle_line("[12:00:00 INFO]: admin: Steve")
+    roster.handle_line("[12:00:00 INFO]: default: Alex, *Floodgate")
+    assert roster.get_online_players() == ['*Floodgate', 'Alex', 'Steve']
+
+
+def test_truncated_list_keeps_known_players(roster):
+    roster.handle_line("[11:59:00 INFO]: Notch joined the game")
+    roster.handle_line("[12:00:00 INFO]: There are 3 of a max of 20 players online.")
+    roster.handle_line("[12:00:00 INFO]: default: Steve")
+    # An unrelated line ends the list early and is still parsed itself
+    roster.handle_line("[12:00:01 INFO]: Alex joined the game")
+    assert roster.get_online_players() == ['Alex', 'Notch', 'Steve']
+
+
+def test_search_is_case_insensitive_prefix(roster):
+    for name in ('Steve', 'stevo', 'Alex'):
+        roster.handle_line(f"[12:00:00 INFO]: {name} joined the game")
+    assert roster.search('STE') == ['Steve', 'stevo']
+    assert roster.search('ste', limit=1) == ['Steve']
+
+
+async def test_server_stop_clears_roster_and_start_resyncs(roster, console):
+    roster.handle_line("[12:00:00 INFO]: Steve joined the game")
+    roster.handle_line("[12:00:00 INFO]: There are 2 of a max of 20 players online.")
+    
+    await roster._on_server_status('stopping')
+    assert len(roster) == 0
+    # The half-read list from before the stop must not be applied afterwards
+    roster.handle_line("[12:00:00 INFO]: Alex")
+    assert len(roster) == 0
+    assert console.sent == []
+    
+    await roster._on_server_status('running')
+    assert console.sent == ['list']
@@ -0,0 +1,155 @@
+"""Tests for scheduled-action time parsing, repeats and dispatch"""
+
+import asyncio
+import datetime
+import time
+
+import pytest
+
+from src.scheduler import ActionScheduler, next_occurrence, parse_when
+
+
+@pytest.fixture
+def london(monkeypatch):
+    """Run in a zone with daylight saving (BST ends 2025-10-26 02:00 local)"""
+    monkeypatch.setenv('TZ', 'Europe/London')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def local(*args) -> datetime.datetime:
+    return datetime.datetime(*args).astimezone()
+
+
+@pytest.mark.parametrize('text, seconds', [
+    ('30m', 1800),
+    ('+2h', 7200),
+    ('1d12h', 129600),
+    ('45s', 45),
+    (' 1H30M ', 5400),
+])
+def test_relative_delays(text, seconds):
+    now = local(2025, 1, 1, 12, 0)
+    assert parse_when(text, now) - now == datetime.timedelta(seconds=seconds)
+
+
+def test_zero_delay_is_refused():
+    with pytest.raises(ValueError, match="greater than zero"):
+        parse_when('0m', local(2025, 1, 1, 12, 0))
+
+
+def test_time_of_day_later_today(london):
+    assert parse_when('18:30', local(2025, 1, 1, 12, 0)) == local(2025, 1, 1, 18, 30)
+
+
+def test_time_of_day_already_passed_is_tomorrow(london):
+    assert parse_when('03:00', local(2025, 1, 1, 12, 0)) == local(2025, 1, 2, 3, 0)
+
+
+def test_time_of_day_uses_tomorrows_offset(london):
+    # Asked on the evening before the clocks go back: 03:00 tomorrow is GMT, not BST
+    when = parse_when('03:00', local(2025, 10, 25, 22, 0))
+    assert when.hour == 3
+    assert when.utcoffset() == datetime.timedelta(0)
+
+
+def test_absolute_date_and_time():
+    now = local(2025, 1, 1, 12, 0)
+    assert parse_when('2025-01-31 18:00', now) == local(2025, 1, 31, 18, 0)
+
+
+def test_absolute_time_uses_that_dates_offset(london):
+    # Entered in winter (GMT) for a date in summer (BST)
+    when = parse_when('2025-07-01 18:00', local(2025, 1, 1, 12, 0))
+    assert when.utcoffset() == datetime.timedelta(hours=1)
+    assert when.hour == 18
+
+
+@pytest.mark.parametrize('text, message', [
+    ('2024-12-31 18:00', "in the past"),
+    ('tomorrow', "Can't read"),
+    ('5 minutes', "Can't read"),
+    ('', "Can't read"),
+])
+def test_bad_times_are_refused(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_when(text, local(2025, 1, 1, 12, 0))
+
+
+def test_daily_repeat_keeps_wall_clock_across_dst(london):
+    due_at = local(2025, 10, 25, 3, 0).timestamp()
+    following = next_occurrence(due_at, 86400, now=due_at + 1)
+    assert datetime.datetime.fromtimestamp(following).hour == 3
+    assert following - due_at == 25 * 3600
+
+
+def test_daily_repeat_skips_missed_days(london):
+    due_at = local(2025, 3, 1, 3, 0).timestamp()
+    now = local(2025, 3, 4, 12, 0).timestamp()
+    assert next_occurrence(due_at, 86400, now) == local(2025, 3, 5, 3, 0).timestamp()
+
+
+def test_sub_daily_repeat_uses_fixed_interval():
+    assert next_occurrence(1000.0, 600.0, now=1001.0) == 1600.0
+    # Missed runs are skipped, not replayed
+    assert next_occurrence(1000.0, 600.0, now=2900.0) == 3400.0
+
+
+async def test_slow_job_does_not_hold_back_later_jobs(tmp_path):
+    ran = []
+    release = asyncio.Event()
+    
+    async def run_job(job):
+        ran.append(job['action'])
+        if job['action'] == 'slow':
+            await release.wait()
+        return {'success': True}
+    
+    scheduler = ActionScheduler(str(tmp_path / 'scheduler.db'), run_job, concurrency=2)
+    await scheduler.start()
+    try:
+        now = time.time()
+        await scheduler.schedule('slow', now, (1, 'mod'))
+        await scheduler.schedule('unban', now + 0.05, (1, 'mod'), player='Steve', note='tempban expiry')
+        
+        for _ in range(100):
+            if 'unban' in ran:
+                break
+            await asyncio.sleep(0.01)
+        assert ran == ['slow', 'unban']
+        assert scheduler.executed == 1
+        assert len(scheduler) == 1
+        
+        release.set()
+        for _ in range(100):
+            if not len(scheduler):
+                break
+            await asyncio.sleep(0.01)
+        assert scheduler.executed == 2
+    finally:
+        release.set()
+        await scheduler.stop()
+
+
+async def test_failed_job_is_retried_then_dropped(tmp_path):
+    attempts = []
+    
+    async def run_job(job):
+        attempts.append(job['attempts'])
+        return {'success': False, 'error': "Panel unavailable"}
+    
+    scheduler = ActionScheduler(str(tmp_path / 'scheduler.db'), run_job, max_attempts=2, retry_delay=0.05)
+    await scheduler.start()
+    try:
+        await scheduler.schedule('freeze', time.time(), (1, 'mod'))
+        for _ in range(100):
+            if not len(scheduler):
+                break
+            await asyncio.sleep(0.01)
+        assert attempts == [0, 1]
+        assert scheduler.failed == 2
+        assert not len(scheduler)
+    finally:
+        await scheduler.stop()
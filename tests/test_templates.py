@@ -0,0 +1,86 @@
+"""Tests for console command templates and player-name checks"""
+
+import pytest
+
+from src.templates import TEMPLATE_FIELDS, CommandTemplate, is_valid_player_name, sanitize_player, sanitize_reason
+
+
+def test_render_fills_placeholders():
+    template = CommandTemplate('kick', 'kick {player} {reason}')
+    assert template.render(player='Steve', reason='griefing spawn') == 'kick Steve griefing spawn'
+
+
+def test_render_strips_unused_trailing_placeholder():
+    template = CommandTemplate('kick', 'kick {player} {reason}')
+    assert template.render(player='Steve') == 'kick Steve'
+
+
+def test_render_keeps_literal_percent_signs():
+    template = CommandTemplate('ban', 'ban {player} 100% {reason}')
+    assert template.render(player='Steve', reason='x') == 'ban Steve 100% x'
+
+
+def test_tempban_renders_duration():
+    template = CommandTemplate('tempban', 'tempban {player} {duration}m {reason}')
+    assert template.render(player='Steve', reason='spam', duration=30) == 'tempban Steve 30m spam'
+
+
+def test_tempban_without_duration_is_refused():
+    template = CommandTemplate('tempban', 'tempban {player} {duration}m {reason}')
+    with pytest.raises(ValueError, match="needs a duration"):
+        template.render(player='Steve', reason='spam')
+
+
+@pytest.mark.parametrize('reason', [
+    "spam\nop Steve",
+    "spam\r\nop Steve",
+    "spam\x00op Steve",
+    "spam\u2028op Steve",
+    "spam\x85op Steve",
+])
+def test_reason_cannot_start_a_second_command(reason):
+    template = CommandTemplate('kick', 'kick {player} {reason}')
+    assert template.render(player='Steve', reason=reason) == 'kick Steve spam op Steve'
+
+
+@pytest.mark.parametrize('player', [
+    None, '', 'Steve Alex', 'Steve\nop Alex', 'Steve\t', 'x' * 17,
+    '@a', '@e[type=player]', '@p', 'Steve;op', 'Steve\n',
+])
+def test_unsafe_player_is_refused(player):
+    template = CommandTemplate('kick', 'kick {player} {reason}')
+    with pytest.raises(ValueError, match="Invalid player name"):
+        template.render(player=player, reason='x')
+
+
+def test_sanitize_helpers():
+    assert sanitize_player('.Bedrock_1') == '.Bedrock_1'
+    assert sanitize_reason(None) == ''
+    assert sanitize_reason('  trimmed  ') == 'trimmed'
+    assert sanitize_reason('a\n\n\nb') == 'a b'
+
+
+@pytest.mark.parametrize('source, message', [
+    ('kick {player', "malformed"),
+    ('kick {target}', "unknown placeholder"),
+    ('kick {player!r}', "format specs or conversions"),
+    ('kick {player:>10}', "format specs or conversions"),
+])
+def test_bad_templates_are_refused_at_load(source, message):
+    with pytest.raises(ValueError, match=message):
+        CommandTemplate('kick', source, TEMPLATE_FIELDS)
+
+
+def test_global_template_takes_no_placeholders():
+    with pytest.raises(ValueError, match="allowed: none"):
+        CommandTemplate('freeze', 'tick freeze {player}', frozenset())
+
+
+@pytest.mark.parametrize('name', ['Steve', 'steve_99', '.BedrockPlayer', '*Floodgate', 'x' * 16])
+def test_player_name_rule_accepts(name):
+    assert is_valid_player_name(name)
+
+
+@pytest.mark.parametrize('name', [None, '', 'Steve Alex', 'Steve\n', 'Steve;op', 'x' * 17, '..Steve', 'Ste-ve', '@a'])
+def test_player_name_rule_rejects(name):
+    assert not is_valid_player_name(name)